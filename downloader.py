@@ -20,9 +20,11 @@ from src.config import (
     AlbumInfo,
     DownloadInfo,
     SessionInfo,
+    UrlInfo,
     MAX_WORKERS,
     apply_argument_overrides,
     build_network_context,
+    build_run_context,
     parse_arguments,
 )
 from src.crawlers.crawler_utils import (
@@ -36,6 +38,12 @@ from src.general_utils import (
     check_python_version,
     clear_terminal,
     fetch_page,
+    run_async,
+)
+from src.http_utils import (
+    configure_http_session,
+    get_http_session,
+    install_dns_cache,
 )
 from src.managers.live_manager import initialize_managers
 from src.url_utils import (
@@ -59,34 +67,29 @@ async def handle_download_process(
     url: str,
     initial_soup: BeautifulSoup,
     live_manager: LiveManager,
+    url_info: UrlInfo,
 ) -> None:
     """Handle the download process for a Bunkr album or a single item."""
-    if session_info.args:
-        log_level = getattr(session_info.args, "log_level", "info")
-        max_workers = getattr(session_info.args, "max_workers", MAX_WORKERS)
-    else:
-        log_level = "info"
-        max_workers = MAX_WORKERS
-    host_page = get_host_page(url)
-    identifier = get_identifier(url, soup=initial_soup)
+    run_ctx = session_info.run_ctx
+    identifier = url_info.identifier
 
-    if log_level.lower() == "debug":
+    if run_ctx.debug:
         live_manager.update_log(
             event="Debug",
             details=f"Resolved identifier {identifier} for {url}",
         )
 
     # Album download
-    if check_url_type(url):
+    if url_info.is_album:
         item_pages = await extract_all_album_item_pages(
-            initial_soup, host_page, url, network=session_info.network,
+            initial_soup, url_info.host_page, url, network=session_info.network,
         )
         album_downloader = AlbumDownloader(
             session_info=session_info,
             album_info=AlbumInfo(album_id=identifier, item_pages=item_pages),
             live_manager=live_manager,
         )
-        await album_downloader.download_album(max_workers=max_workers)
+        await album_downloader.download_album(max_workers=run_ctx.max_workers)
 
     # Single item download
     else:
@@ -114,7 +117,9 @@ async def handle_download_process(
             ),
             live_manager=live_manager,
         )
-        media_downloader.download()
+        # Stream on a worker thread so the event loop (live UI, web job
+        # events) keeps running for the duration of the transfer.
+        await asyncio.to_thread(media_downloader.download)
 
 
 async def validate_and_download(
@@ -124,30 +129,36 @@ async def validate_and_download(
     args: Namespace | None = None,
 ) -> None:
     """Validate the provided URL, and initiate the download process."""
-    log_level = getattr(args, "log_level", "info") if args else "info"
-    logging.getLogger().setLevel(log_level.upper())
+    run_ctx = build_run_context(args)
+    logging.getLogger().setLevel(run_ctx.log_level.upper())
 
     # Check the available disk space on the download path before starting the download
     if args and not args.disable_disk_check:
         check_disk_space(live_manager, custom_path=args.custom_path)
-    elif args and args.disable_disk_check and log_level.lower() == "debug":
+    elif args and args.disable_disk_check and run_ctx.debug:
         live_manager.update_log(
             event="Debug",
             details="Disk space check skipped by configuration",
         )
 
     network = build_network_context(args)
-    soup = await fetch_page(url, network=network)
+    soup = await fetch_page(url, network=network, session=get_http_session())
     if soup is None:
         live_manager.update_log(
             event="Fetch failed",
             details=f"Unable to load page content for {url}. Please verify the link and retry.",
         )
         raise RuntimeError(f"Failed to fetch page for {url}")
-    album_id = get_album_id(url) if check_url_type(url) else None
-    album_name = get_album_name(soup)
+    is_album = check_url_type(url)
+    url_info = UrlInfo(
+        is_album=is_album,
+        host_page=get_host_page(url),
+        identifier=get_identifier(url, soup=soup),
+        album_id=get_album_id(url) if is_album else None,
+        album_name=get_album_name(soup),
+    )
 
-    directory_name = format_directory_name(album_name, album_id)
+    directory_name = format_directory_name(url_info.album_name, url_info.album_id)
     download_path = create_download_directory(
         directory_name,
         custom_path=args.custom_path,
@@ -157,29 +168,34 @@ async def validate_and_download(
         bunkr_status=bunkr_status,
         download_path=download_path,
         network=network,
+        http=get_http_session(),
+        run_ctx=run_ctx,
     )
 
-    if log_level.lower() == "debug":
+    if run_ctx.debug:
         live_manager.update_log(
             event="Debug",
             details=(
-                f"Prepared session for '{album_name or 'single file'}'"
+                f"Prepared session for '{url_info.album_name or 'single file'}'"
                 f" at {download_path}"
             ),
         )
 
     try:
-        max_workers = getattr(args, "max_workers", MAX_WORKERS) if args else MAX_WORKERS
-        if log_level.lower() == "debug":
+        if run_ctx.debug:
             live_manager.update_log(
                 event="Debug",
-                details=f"Using {max_workers} concurrent worker(s) for album downloads",
+                details=(
+                    f"Using {run_ctx.max_workers} concurrent worker(s)"
+                    " for album downloads"
+                ),
             )
         await handle_download_process(
             session_info,
             url,
             soup,
             live_manager,
+            url_info,
         )
 
     except (RequestConnectionError, Timeout, RequestException) as err:
@@ -194,6 +210,8 @@ async def main() -> None:
 
     args = parse_arguments()
     apply_argument_overrides(args)
+    configure_http_session(getattr(args, "max_workers", MAX_WORKERS))
+    install_dns_cache()
     bunkr_status = get_bunkr_status_cached(build_network_context(args)) or {}
     live_manager = initialize_managers(
         disable_ui=args.disable_ui,
@@ -215,4 +233,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
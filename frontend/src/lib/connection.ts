@@ -1,8 +1,19 @@
 import { api } from "./api";
-import { isHelloFrame, isTerminalStatus, type JobEvent, type HelloFrame } from "./events";
+import {
+  isDroppedFrame,
+  isHelloFrame,
+  isResetFrame,
+  isTerminalStatus,
+  type DroppedFrame,
+  type JobEvent,
+  type HelloFrame,
+  type ResetFrame,
+} from "./events";
 import { buildWsUrl } from "./ws-url";
 import { useJobStore, type ConnectionMode } from "./store";
 
+type WsFrame = JobEvent | HelloFrame | DroppedFrame | ResetFrame;
+
 /**
  * Deterministic WebSocket-over-polling state machine for a single job.
  *
@@ -57,6 +68,8 @@ export class JobConnection {
   private backfilling = false;
   /** WS events buffered during backfill so they are applied after the HTTP batch. */
   private wsBuffer: JobEvent[] = [];
+  /** True when the current socket was opened with `?since=<cursor>`. */
+  private wsResumed = false;
 
   start(jobId: string): void {
     this.jobId = jobId;
@@ -120,7 +133,9 @@ export class JobConnection {
       if (this.ws === existingWs) this.ws = null;
     }
 
-    const ws = new WebSocket(buildWsUrl(this.jobId));
+    // buildWsUrl only appends `since` for a non-zero cursor.
+    this.wsResumed = this.cursor > 0;
+    const ws = new WebSocket(buildWsUrl(this.jobId, this.cursor));
     this.ws = ws;
 
     ws.onopen = () => {
@@ -129,37 +144,15 @@ export class JobConnection {
     };
 
     ws.onmessage = (messageEvent: MessageEvent) => {
-      let payload: JobEvent | HelloFrame;
+      let payload: WsFrame | WsFrame[];
       try {
         payload = JSON.parse(messageEvent.data);
       } catch {
         return;
       }
 
-      if (isHelloFrame(payload)) {
-        this.attempts = 0;
-        this.setMode("ws");
-        // If we missed events between our last cursor and the server's
-        // hello cursor, pull them via one HTTP backfill before the live
-        // stream continues.  Mark backfilling=true so subsequent WS frames
-        // are buffered rather than applied immediately — this prevents newer
-        // events from being committed before the HTTP batch arrives, which
-        // would regress task/status state for ordering-sensitive payloads.
-        if (payload.next_id > this.cursor) {
-          this.backfilling = true;
-          this.wsBuffer = [];
-          void this.backfill(payload.next_id);
-        }
-        return;
-      }
-
-      // While a backfill is in-flight, queue rather than ingest immediately.
-      if (this.backfilling) {
-        this.wsBuffer.push(payload as JobEvent);
-        return;
-      }
-
-      this.ingest([payload]);
+      // Batched sockets deliver every pending envelope as one array frame.
+      this.handleFrames(Array.isArray(payload) ? payload : [payload]);
     };
 
     ws.onclose = () => {
@@ -185,6 +178,60 @@ export class JobConnection {
     };
   }
 
+  private handleFrames(frames: WsFrame[]): void {
+    const live: JobEvent[] = [];
+    for (const payload of frames) {
+      if (isHelloFrame(payload)) {
+        this.attempts = 0;
+        this.setMode("ws");
+        // If we missed events between our last cursor and the server's
+        // hello cursor, pull them via one HTTP backfill before the live
+        // stream continues.  Mark backfilling=true so subsequent WS frames
+        // are buffered rather than applied immediately — this prevents
+        // newer events from being committed before the HTTP batch arrives,
+        // which would regress task/status state for ordering-sensitive
+        // payloads.  A socket opened with `since` needs none of this: the
+        // server replays every event after our cursor right behind hello.
+        if (!this.wsResumed && payload.next_id > this.cursor) {
+          this.backfilling = true;
+          this.wsBuffer = [];
+          void this.backfill(payload.next_id);
+        }
+        continue;
+      }
+
+      // Our `since` cursor is below the pruned floor, so the replay would
+      // have a gap; start over from the server's cursor as for a 410.
+      if (isResetFrame(payload)) {
+        live.length = 0;
+        this.resetView(payload.next_id);
+        continue;
+      }
+
+      // The server shed envelopes from our queue; fetch the gap over HTTP
+      // and buffer the live stream until it lands, as for a hello cursor.
+      if (isDroppedFrame(payload)) {
+        if (!this.backfilling) {
+          this.backfilling = true;
+          this.wsBuffer = [];
+          void this.backfill(payload.next_id);
+        }
+        continue;
+      }
+
+      // While a backfill is in-flight, queue rather than ingest immediately.
+      if (this.backfilling) {
+        this.wsBuffer.push(payload);
+        continue;
+      }
+
+      live.push(payload);
+    }
+
+    // One ingest (and one store update) per frame, however many it carried.
+    if (live.length > 0) this.ingest(live);
+  }
+
   private startPolling(): void {
     if (this.pollTimer || !this.jobId) return;
 
@@ -221,14 +268,11 @@ export class JobConnection {
           // without misleading the user about what's on screen.
           const detail = (err as { response?: { data?: { detail?: { next_id?: number } } } })
             .response?.data?.detail;
-          const resetTo =
+          this.resetView(
             detail && typeof detail === "object" && typeof detail.next_id === "number"
               ? detail.next_id
-              : 0;
-          this.seen.clear();
-          this.cursor = resetTo;
-          useJobStore.getState().reset();
-          useJobStore.getState().setJob(this.jobId, "running");
+              : 0,
+          );
           return;
         }
         if (status === 404) {
@@ -243,6 +287,15 @@ export class JobConnection {
     this.pollTimer = setInterval(tick, POLL_INTERVAL_MS);
   }
 
+  /** Drop the local view and continue from `cursor` after pruned history. */
+  private resetView(cursor: number): void {
+    if (!this.jobId) return;
+    this.seen.clear();
+    this.cursor = cursor;
+    useJobStore.getState().reset();
+    useJobStore.getState().setJob(this.jobId, "running");
+  }
+
   private async backfill(upTo: number): Promise<void> {
     if (!this.jobId) return;
     try {
@@ -74,6 +74,29 @@ export interface HelloFrame {
   ts: string;
 }
 
+/**
+ * WS-only frame sent when this subscriber fell too far behind and the
+ * server discarded ``count`` envelopes from its queue. They are still in
+ * the broker's ring buffer, so the client backfills up to ``next_id``.
+ */
+export interface DroppedFrame {
+  type: "dropped";
+  count: number;
+  next_id: number;
+}
+
+/**
+ * WS-only frame sent right after ``hello`` when the ``?since=`` cursor is
+ * below what the ring buffer still holds — the socket counterpart of the
+ * ``410 Gone`` from ``GET /events``. The client resets its view and carries
+ * on from ``next_id``.
+ */
+export interface ResetFrame {
+  type: "reset";
+  oldest_event_id: number;
+  next_id: number;
+}
+
 export type JobEvent =
   | LogEvent
   | TaskCreatedEvent
@@ -86,6 +109,14 @@ export function isHelloFrame(msg: { type: string }): msg is HelloFrame {
   return msg.type === "hello";
 }
 
+export function isDroppedFrame(msg: { type: string }): msg is DroppedFrame {
+  return msg.type === "dropped";
+}
+
+export function isResetFrame(msg: { type: string }): msg is ResetFrame {
+  return msg.type === "reset";
+}
+
 export function isTerminalStatus(status: JobStatus | "idle"): boolean {
   return status === "completed" || status === "failed" || status === "cancelled";
 }
@@ -5,12 +5,17 @@ const WS_BASE = (import.meta.env.VITE_WS_BASE_URL as string | undefined) ?? null
  * the app is served under (e.g. ``/bunkr/`` behind a reverse proxy).
  * Falls back to ``VITE_WS_BASE_URL`` when set so dev setups that tunnel
  * the socket through a different origin keep working.
+ *
+ * A positive ``since`` cursor asks the server to replay only the events the
+ * client has not seen yet. ``batch=1`` is always requested: the server then
+ * sends every pending envelope as one JSON array frame.
  */
-export function buildWsUrl(jobId: string): string {
-  if (WS_BASE) return `${WS_BASE.replace(/\/$/, "")}/ws/jobs/${jobId}`;
+export function buildWsUrl(jobId: string, since = 0): string {
+  const query = since > 0 ? `?batch=1&since=${since}` : "?batch=1";
+  if (WS_BASE) return `${WS_BASE.replace(/\/$/, "")}/ws/jobs/${jobId}${query}`;
 
   const { protocol, host, pathname } = window.location;
   const wsProtocol = protocol === "https:" ? "wss" : "ws";
   const base = pathname.replace(/\/[^/]*$/, "").replace(/\/$/, "");
-  return `${wsProtocol}://${host}${base}/ws/jobs/${jobId}`;
+  return `${wsProtocol}://${host}${base}/ws/jobs/${jobId}${query}`;
 }
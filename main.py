@@ -15,13 +15,16 @@ from argparse import Namespace
 from downloader import parse_arguments, validate_and_download
 from src.bunkr_utils import get_bunkr_status_cached
 from src.config import (
+    MAX_CONCURRENT_URLS,
+    MAX_WORKERS,
     SESSION_LOG,
     URLS_FILE,
     apply_argument_overrides,
     build_network_context,
 )
 from src.file_utils import read_file, write_file
-from src.general_utils import check_python_version, clear_terminal
+from src.general_utils import check_python_version, clear_terminal, run_async
+from src.http_utils import configure_http_session, install_dns_cache
 from src.managers.live_manager import initialize_managers
 
 
@@ -30,16 +33,33 @@ async def process_urls(
     args: Namespace,
     bunkr_status: dict[str, str],
 ) -> None:
-    """Validate and downloads items for a list of URLs."""
+    """Validate and downloads items for a list of URLs.
+
+    URLs are independent and I/O-bound, so up to :data:`MAX_CONCURRENT_URLS`
+    of them are processed concurrently instead of letting one slow album hold
+    up the rest. The cap is fixed rather than `max_workers`, since each album
+    already runs up to `max_workers` downloads of its own.
+    """
     live_manager = initialize_managers(
         disable_ui=args.disable_ui,
         log_level=getattr(args, "log_level", "info"),
     )
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_URLS)
 
-    with live_manager.live:
-        for url in urls:
-            await validate_and_download(bunkr_status, url, live_manager, args=args)
+    async def process_url(url: str) -> None:
+        async with semaphore:
+            try:
+                await validate_and_download(bunkr_status, url, live_manager, args=args)
 
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                # One bad URL (unreachable page, network error, unwritable
+                # directory) must not abort the albums still downloading.
+                live_manager.update_log(
+                    event="Download failed", details=f"{url}: {err}",
+                )
+
+    with live_manager.live:
+        await asyncio.gather(*(process_url(url) for url in urls))
         live_manager.stop()
 
 
@@ -53,6 +73,8 @@ async def main() -> None:
     check_python_version()
     args = parse_arguments(common_only=True)
     apply_argument_overrides(args)
+    configure_http_session(getattr(args, "max_workers", MAX_WORKERS))
+    install_dns_cache()
     bunkr_status = get_bunkr_status_cached(build_network_context(args)) or {}
 
     # Read and process URLs, ignoring empty lines
@@ -65,7 +87,7 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_async(main())
 
     except KeyboardInterrupt:
         sys.exit(1)
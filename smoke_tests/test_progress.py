@@ -94,6 +94,22 @@ class ProgressSmokeTests(unittest.TestCase):
             all(0 <= value <= 100 for value in manager.history if value is not None)
         )
 
+    def test_progress_updates_are_rate_limited(self) -> None:
+        """A burst of chunks collapses into a bounded number of updates."""
+        response = FakeResponse([b"d"] * 5000, headers={"Content-Length": "5000"})
+        manager = FakeManager()
+
+        result = download_utils.save_file_with_progress(
+            response,
+            str(self.destination),
+            task=3,
+            progress_manager=manager,
+        )
+
+        self.assertFalse(result)
+        self.assertEqual(manager.history[-1], 100)
+        self.assertLess(len(manager.history), 50)
+
     def test_unknown_length_falls_back_to_estimator(self) -> None:
         """Streams without length should still progress via estimator."""
         response = FakeResponse([b"b" * 3] * 8)
@@ -8,6 +8,7 @@ Modules:
     - config: Constants and settings used across the project.
     - file_utils: Utilities for managing file operations.
     - general_utils: Miscellaneous utility functions.
+    - http_utils: Shared, connection-pooled HTTP session.
     - url_utils: Utilities to analyze and extract details from URLs.
 
 This package is designed to be reusable and modular, allowing its components
@@ -19,6 +20,7 @@ to be easily imported and used across different parts of the application.
 from __future__ import annotations
 
 import os
+from functools import cache
 from importlib import metadata
 from pathlib import Path
 
@@ -31,6 +33,7 @@ __all__ = [
     "config",
     "file_utils",
     "general_utils",
+    "http_utils",
     "url_utils",
     "__version__",
 ]
@@ -38,6 +41,7 @@ __all__ = [
 _DEFAULT_VERSION = "0.0.0"
 
 
+@cache
 def _derive_version() -> str:
     """Resolve the best available application version string."""
 
@@ -53,7 +57,8 @@ def _derive_version() -> str:
     if TOMLIB is not None:
         pyproject_path = Path(__file__).resolve().parent.parent / "pyproject.toml"
         try:
-            loaded = TOMLIB.loads(pyproject_path.read_text(encoding="utf-8"))
+            with pyproject_path.open("rb") as pyproject_file:
+                loaded = TOMLIB.load(pyproject_file)
         except (FileNotFoundError, OSError, ValueError):
             loaded = None
         if loaded:
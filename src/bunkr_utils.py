@@ -3,58 +3,86 @@
 from __future__ import annotations
 
 import logging
+import re
+import sys
+import threading
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
 
 from .config import HEADERS, NetworkContext, STATUS_CACHE_TTL_SECONDS, STATUS_PAGE
+from .http_utils import get_http_session
 
 # Module-level cache for status page results, keyed on the status_page URL so
 # jobs with differing network overrides maintain isolated caches.
 # Shape: {status_page_url: (fetch_time, status_dict)}.
 _status_cache: dict[str, tuple[datetime, dict[str, str]]] = {}
-
-
-def fetch_page(url: str, *, network: NetworkContext | None = None) -> BeautifulSoup | None:
-    """Fetch the HTML content of a page at the given URL."""
+# One lock per status page so concurrent misses (worker threads retrying
+# failed downloads, parallel albums) coalesce into a single scrape.
+_status_locks: dict[str, threading.Lock] = {}
+# Time of the last failed scrape per status page. While the page itself is
+# down, failing downloads would otherwise each trigger another scrape.
+_status_failures: dict[str, datetime] = {}
+STATUS_FAILURE_RETRY_SECONDS = 15
+
+
+# Notified after every successful scrape so downloads waiting out a
+# maintenance window re-check the fresh status at once. The generation counter
+# lets a waiter tell a new scrape from one it has already looked at.
+_recovery_condition = threading.Condition()
+_RECOVERY_GENERATION = 0
+
+# Interned so the per-link status comparisons short-circuit on identity.
+_STATUS_OPERATIONAL = sys.intern("Operational")
+_STATUS_NON_OPERATIONAL = sys.intern("Non-operational")
+# Status labels vary in case ("Maintenance", "Under maintenance").
+_MAINTENANCE_RE = re.compile("maintenance", re.IGNORECASE)
+
+# Server rows of the status page, matched on their exact class attribute. The
+# expression is compiled once and evaluated by libxml2 rather than walking a
+# pure-Python tree.
+_SERVER_ROW_CLASS = "flex items-center gap-4 py-4 border-b border-soft last:border-b-0"
+_SERVER_ROWS = etree.XPath("//div[@class=$row_class]")
+
+
+def fetch_page(
+    url: str, *, network: NetworkContext | None = None,
+) -> html.HtmlElement | None:
+    """Fetch and parse the HTML content of a page at the given URL."""
     headers = network.headers if network else HEADERS
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_session().get(url, headers=headers, timeout=10)
         response.raise_for_status()
+        return html.fromstring(response.text)
 
     except requests.RequestException:
         logging.exception("An error occurred while fetching the status page.")
-        return None
 
-    return BeautifulSoup(response.text, "html.parser")
+    except (etree.ParserError, ValueError):
+        logging.exception("The status page could not be parsed.")
+
+    return None
 
 
-def get_bunkr_status(network: NetworkContext | None = None) -> dict[str, str]:
-    """Fetch the status of servers from the status page and return a dictionary."""
+def _fetch_bunkr_status(network: NetworkContext | None = None) -> dict[str, str]:
+    """Scrape the status page and return a fresh server-status dictionary."""
     status_page = network.status_page if network else STATUS_PAGE
-    soup = fetch_page(status_page, network=network)
-    if soup is None:
+    tree = fetch_page(status_page, network=network)
+    if tree is None:
         logging.warning("Unable to fetch Bunkr status page; continuing without host data")
         return {}
 
     bunkr_status: dict[str, str] = {}
 
     try:
-        server_items = soup.find_all(
-            "div",
-            {
-                "class": (
-                    "flex items-center gap-4 py-4 border-b border-soft last:border-b-0"
-                ),
-            },
-        )
-
-        for server_item in server_items:
-            server_name = server_item.find("p").get_text(strip=True)
-            server_status = server_item.find("span").get_text(strip=True)
-            bunkr_status[server_name] = server_status
+        for server_item in _SERVER_ROWS(tree, row_class=_SERVER_ROW_CLASS):
+            server_name = server_item.find(".//p").text_content().strip()
+            server_status = server_item.find(".//span").text_content().strip()
+            bunkr_status[sys.intern(server_name)] = sys.intern(server_status)
 
     except AttributeError as attr_err:
         logging.exception("Error extracting server data: %s", attr_err)
@@ -63,35 +91,141 @@ def get_bunkr_status(network: NetworkContext | None = None) -> dict[str, str]:
     return bunkr_status
 
 
+def get_bunkr_status(
+    network: NetworkContext | None = None,
+    *,
+    force: bool = False,
+    ttl: int = STATUS_CACHE_TTL_SECONDS,
+) -> dict[str, str]:
+    """Return the server-status dictionary, scraping only when the cache is stale.
+
+    Results are memoised in :data:`_status_cache` for `ttl` seconds, so every
+    entry point and retry path shares one fetch per TTL window. Pass
+    ``force=True`` to bypass a fresh entry. Concurrent misses for the same
+    status page wait on one in-flight scrape instead of each fetching it, and
+    a failed scrape is not retried for :data:`STATUS_FAILURE_RETRY_SECONDS`.
+    Callers receive their own copy and may mutate it freely.
+    """
+    cache_key = network.status_page if network else STATUS_PAGE
+    requested_at = datetime.now()
+
+    entry = _status_cache.get(cache_key)
+    if not force and entry is not None:
+        fetch_time, cached_status = entry
+        if requested_at - fetch_time < timedelta(seconds=ttl):
+            return dict(cached_status)
+
+    with _status_locks.setdefault(cache_key, threading.Lock()):
+        # Another caller may have refreshed the entry while this one waited.
+        # A scrape that completed after this request started satisfies even a
+        # forced refresh.
+        entry = _status_cache.get(cache_key)
+        if entry is not None:
+            fetch_time, cached_status = entry
+            if fetch_time >= requested_at or (
+                not force and requested_at - fetch_time < timedelta(seconds=ttl)
+            ):
+                return dict(cached_status)
+
+        failed_at = _status_failures.get(cache_key)
+        if failed_at is not None and (
+            requested_at - failed_at < timedelta(seconds=STATUS_FAILURE_RETRY_SECONDS)
+        ):
+            return {}
+
+        fresh_status = _fetch_bunkr_status(network)
+        if fresh_status:
+            _status_cache[cache_key] = (datetime.now(), fresh_status)
+            _status_failures.pop(cache_key, None)
+            _signal_recoveries()
+        else:
+            _status_failures[cache_key] = datetime.now()
+
+    return dict(fresh_status)
+
+
+def _signal_recoveries() -> None:
+    """Wake every recovery waiter to re-check the freshly cached status."""
+    global _RECOVERY_GENERATION  # pylint: disable=global-statement
+
+    with _recovery_condition:
+        _RECOVERY_GENERATION += 1
+        _recovery_condition.notify_all()
+
+
+def wait_for_recovery(
+    subdomain: str,
+    timeout: float,
+    *,
+    network: NetworkContext | None = None,
+    ttl: int = STATUS_CACHE_TTL_SECONDS,
+) -> bool:
+    """Block for up to `timeout` seconds or until `subdomain` is operational again.
+
+    The status page is polled through :func:`get_bunkr_status` at least every
+    `ttl` seconds, so the wait ends soon after the host recovers even when no
+    other caller scrapes it; a scrape made by any other thread wakes the
+    waiter straight away. Returns True once the subdomain is reported
+    operational, False when the timeout elapsed.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        with _recovery_condition:
+            generation = _RECOVERY_GENERATION
+
+        if get_bunkr_status(network, ttl=ttl).get(subdomain) == _STATUS_OPERATIONAL:
+            return True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        with _recovery_condition:
+            _recovery_condition.wait_for(
+                lambda seen=generation: _RECOVERY_GENERATION != seen,
+                timeout=min(max(ttl, 1), remaining),
+            )
+
+
 def get_offline_servers(bunkr_status: dict[str, str] | None = None) -> dict[str, str]:
     """Return a dictionary of servers that are not operational."""
     bunkr_status = bunkr_status or get_bunkr_status()
     return {
         server_name: server_status
         for server_name, server_status in bunkr_status.items()
-        if server_status != "Operational"
+        if server_status != _STATUS_OPERATIONAL
     }
 
 
+def is_maintenance_status(server_status: str) -> bool:
+    """Return True if `server_status` reports a maintenance window."""
+    return _MAINTENANCE_RE.search(server_status) is not None
+
+
+@lru_cache(maxsize=4096)
 def get_subdomain(download_link: str) -> str:
-    """Extract the capitalized subdomain from a given URL."""
+    """Extract the capitalized subdomain from a given URL.
+
+    Memoised: the same download link is resolved several times per file by
+    the offline, maintenance and retry checks.
+    """
     netloc = urlparse(download_link).netloc
-    return netloc.split(".")[0].capitalize()
+    return sys.intern(netloc.split(".")[0].capitalize())
 
 
 def subdomain_is_offline(
     download_link: str, bunkr_status: dict[str, str] | None = None,
 ) -> bool:
     """Check if the subdomain from the given download link is marked as offline."""
-    offline_servers = get_offline_servers(bunkr_status)
-    subdomain = get_subdomain(download_link)
-    return subdomain in offline_servers
+    bunkr_status = bunkr_status or get_bunkr_status()
+    server_status = bunkr_status.get(get_subdomain(download_link))
+    return server_status is not None and server_status != _STATUS_OPERATIONAL
 
 
 def mark_subdomain_as_offline(bunkr_status: dict[str, str], download_link: str) -> str:
     """Mark the subdomain of a given download link as offline in the Bunkr status."""
     subdomain = get_subdomain(download_link)
-    bunkr_status[subdomain] = "Non-operational"
+    bunkr_status[subdomain] = _STATUS_NON_OPERATIONAL
     return subdomain
 
 
@@ -118,54 +252,50 @@ def refresh_server_status(
         - was_updated: True if the status was refreshed from the server.
     """
     cache_key = network.status_page if network else STATUS_PAGE
-    now = datetime.now()
-
-    # Check cache first
-    if cache_key in _status_cache:
-        fetch_time, cached_status = _status_cache[cache_key]
-        if now - fetch_time < timedelta(seconds=cache_ttl_seconds):
-            # Cache is still valid
-            current_status = cached_status.get(subdomain, "Unknown")
-            if subdomain in cached_status:
-                bunkr_status[subdomain] = cached_status[subdomain]
-            return current_status, False
-
-    # Cache expired or not present, fetch fresh status
-    fresh_status = get_bunkr_status(network)
-    if fresh_status:
-        _status_cache[cache_key] = (now, fresh_status)
+    entry = _status_cache.get(cache_key)
+    is_stale = entry is None or (
+        datetime.now() - entry[0] >= timedelta(seconds=cache_ttl_seconds)
+    )
+
+    current = get_bunkr_status(network, force=is_stale, ttl=cache_ttl_seconds)
+    if not current:
+        # Fallback: couldn't fetch fresh status
+        return bunkr_status.get(subdomain, "Unknown"), False
+
+    if is_stale:
         # Update the provided dictionary with all fresh data
-        bunkr_status.update(fresh_status)
-        current_status = fresh_status.get(subdomain, "Unknown")
-        return current_status, True
+        bunkr_status.update(current)
+    elif subdomain in current:
+        bunkr_status[subdomain] = current[subdomain]
 
-    # Fallback: couldn't fetch fresh status
-    return bunkr_status.get(subdomain, "Unknown"), False
+    return current.get(subdomain, "Unknown"), is_stale
 
 
-def get_bunkr_status_cached(
+def peek_bunkr_status(
     network: NetworkContext | None = None,
     *,
     ttl: int = STATUS_CACHE_TTL_SECONDS,
-) -> dict[str, str]:
-    """Return the host status mapping, reusing :data:`_status_cache` when fresh.
+) -> dict[str, str] | None:
+    """Return a copy of the cached status if it is fresh, without blocking.
 
-    Preferred over :func:`get_bunkr_status` for web callers that may launch
-    multiple jobs in quick succession — the first fetch warms the cache for the
-    rest. TTL defaults to :data:`STATUS_CACHE_TTL_SECONDS` so the behaviour
-    matches :func:`refresh_server_status`.
+    Never scrapes or waits on an in-flight scrape, so async callers can try
+    it on the event loop before handing :func:`get_bunkr_status` to a thread.
     """
+    entry = _status_cache.get(network.status_page if network else STATUS_PAGE)
+    if entry is None or datetime.now() - entry[0] >= timedelta(seconds=ttl):
+        return None
 
-    cache_key = network.status_page if network else STATUS_PAGE
-    now = datetime.now()
+    return dict(entry[1])
 
-    entry = _status_cache.get(cache_key)
-    if entry is not None:
-        fetch_time, cached_status = entry
-        if now - fetch_time < timedelta(seconds=ttl):
-            return dict(cached_status)
 
-    fresh_status = get_bunkr_status(network)
-    if fresh_status:
-        _status_cache[cache_key] = (now, fresh_status)
-    return fresh_status
+def get_bunkr_status_cached(
+    network: NetworkContext | None = None,
+    *,
+    ttl: int = STATUS_CACHE_TTL_SECONDS,
+) -> dict[str, str]:
+    """Return the host status mapping, reusing :data:`_status_cache` when fresh.
+
+    Kept for callers written against the pre-memoisation API;
+    :func:`get_bunkr_status` now applies the same TTL cache itself.
+    """
+    return get_bunkr_status(network, ttl=ttl)
@@ -7,16 +7,20 @@ settings into a single location.
 from __future__ import annotations
 
 import os
+import re
 from argparse import ArgumentParser
-from collections import deque
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass
 from enum import IntEnum
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from argparse import Namespace
 
+    from requests import Session
+
 
 # ============================
 # Paths and Files
@@ -67,6 +71,12 @@ MEDIA_SLUG_REGEX = r'const\s+slug\s*=\s*"([a-zA-Z0-9_-]+)"'  # Extract media slu
 VALID_SLUG_REGEX = r"^[a-zA-Z0-9_-]+$"                       # Validate media slug.
 VALID_CHARACTERS_REGEX = r"[^a-zA-Z0-9 _-]"                  # Validate characters.
 
+# Compiled once at import; callers use these rather than the raw strings above,
+# which are kept for backwards compatibility.
+MEDIA_SLUG_RE = re.compile(MEDIA_SLUG_REGEX)
+VALID_SLUG_RE = re.compile(VALID_SLUG_REGEX)
+VALID_CHARACTERS_RE = re.compile(VALID_CHARACTERS_REGEX)
+
 # ============================
 # UI & Table Settings
 # ============================
@@ -103,6 +113,14 @@ LOG_MANAGER_CONFIG = {
 # ============================
 MAX_FILENAME_LEN = 120  # The maximum length for a file name.
 MAX_WORKERS = 3         # The maximum number of threads for concurrent downloads.
+# URLs of one batch or web job processed at once. Each album already runs up to
+# --max-workers downloads, so this multiplies that figure and is kept small.
+MAX_CONCURRENT_URLS = max(int(os.getenv("MAX_CONCURRENT_URLS", "2")), 1)
+# Files streamed at once from a single CDN subdomain, whatever --max-workers is.
+MAX_DOWNLOADS_PER_HOST = int(os.getenv("MAX_DOWNLOADS_PER_HOST", "6"))
+# Download requests started per second against one CDN subdomain (0 disables).
+# Halved on every 429 and recovered gradually as requests succeed.
+HOST_REQUEST_RATE = float(os.getenv("HOST_REQUEST_RATE", "4"))
 
 # Status page checking behavior
 STATUS_CHECK_ON_FAILURE = (
@@ -111,11 +129,17 @@ STATUS_CHECK_ON_FAILURE = (
 STATUS_CACHE_TTL_SECONDS = int(os.getenv("STATUS_CACHE_TTL_SECONDS", "60"))
 # Strategy: 'backoff' (retry with delays) or 'skip' (log and skip)
 MAINTENANCE_RETRY_STRATEGY = os.getenv("MAINTENANCE_RETRY_STRATEGY", "backoff")
+# Seconds a resolved host address is reused before asking the resolver again
+# (0 disables the cache).
+DNS_CACHE_TTL_SECONDS = int(os.getenv("DNS_CACHE_TTL_SECONDS", "300"))
 
 # Web job memory bounds (PR2)
 JOB_EVENT_RETENTION = int(os.getenv("JOB_EVENT_RETENTION", "2000"))
 JOB_TTL_HOURS = int(os.getenv("JOB_TTL_HOURS", "24"))
 JOB_REAPER_INTERVAL_SECONDS = int(os.getenv("JOB_REAPER_INTERVAL_SECONDS", "900"))
+# Most jobs kept in memory; the oldest terminal jobs are evicted beyond this
+# (0 disables the cap and leaves eviction to the TTL reaper).
+JOB_MAX_RETAINED = int(os.getenv("JOB_MAX_RETAINED", "200"))
 
 # Web API auth + CORS (PR2)
 # Optional shared bearer token. When unset the API runs unauthenticated,
@@ -141,7 +165,7 @@ GB = 1024 * MB
 
 # Thresholds for file sizes and corresponding chunk sizes used during download.
 THRESHOLDS = [
-    (1 * MB, 32 * KB),    # Less than 1 MB
+    (1 * MB, 64 * KB),    # Less than 1 MB (and unknown sizes)
     (10 * MB, 128 * KB),  # 1 MB to 10 MB
     (50 * MB, 512 * KB),  # 10 MB to 50 MB
     (100 * MB, 1 * MB),   # 50 MB to 100 MB
@@ -153,6 +177,25 @@ THRESHOLDS = [
 # Default chunk size for files larger than the largest threshold.
 LARGE_FILE_CHUNK_SIZE = 16 * MB
 
+# THRESHOLDS split into parallel sorted tuples for binary search; the extra
+# trailing chunk covers files beyond the largest threshold.
+_THRESHOLD_SIZES = tuple(size for size, _ in THRESHOLDS)
+_THRESHOLD_CHUNKS = (*(chunk for _, chunk in THRESHOLDS), LARGE_FILE_CHUNK_SIZE)
+if list(_THRESHOLD_SIZES) != sorted(_THRESHOLD_SIZES):
+    raise ValueError("THRESHOLDS must be sorted by file size")
+
+
+def pick_chunk_size(file_size: int) -> int:
+    """Return the chunk size of the first threshold strictly above `file_size`."""
+    return _THRESHOLD_CHUNKS[bisect_right(_THRESHOLD_SIZES, file_size)]
+
+
+# Files of at least RANGE_DOWNLOAD_MIN_SIZE are fetched as this many concurrent
+# byte ranges when the CDN advertises range support (1 disables it).
+RANGE_DOWNLOAD_PARTS = int(os.getenv("RANGE_DOWNLOAD_PARTS", "4"))
+RANGE_DOWNLOAD_MIN_SIZE = int(os.getenv("RANGE_DOWNLOAD_MIN_SIZE_MB", "64")) * MB
+
+
 # ============================
 # HTTP / Network
 # ============================
@@ -160,6 +203,7 @@ class HTTPStatus(IntEnum):
     """Enumeration of common HTTP status codes used in the project."""
 
     OK = 200
+    PARTIAL_CONTENT = 206
     FORBIDDEN = 403
     TOO_MANY_REQUESTS = 429
     INTERNAL_ERROR = 500
@@ -184,6 +228,9 @@ DOWNLOAD_HEADERS: dict[str, str] = {
     "User-Agent": HEADERS["User-Agent"],
     "Connection": "keep-alive",
     "Referer": DEFAULT_DOWNLOAD_REFERER,
+    # Media is already compressed; an identity body is copied straight off the
+    # socket and can be split into byte ranges.
+    "Accept-Encoding": "identity",
 }
 
 # ============================
@@ -234,9 +281,34 @@ class NetworkContext:
             "User-Agent": self.user_agent,
             "Connection": "keep-alive",
             "Referer": self.download_referer,
+            "Accept-Encoding": "identity",
         }
 
 
+@dataclass(frozen=True, slots=True)
+class RunContext:
+    """Per-run settings read from the parsed arguments once per URL."""
+
+    log_level: str = "info"
+    max_workers: int = MAX_WORKERS
+
+    @property
+    def debug(self) -> bool:
+        """Return whether debug logging is enabled for this run."""
+        return self.log_level == "debug"
+
+
+def build_run_context(args: Namespace | None = None) -> RunContext:
+    """Resolve the log level and worker count from `args`, with defaults."""
+    if args is None:
+        return RunContext()
+
+    return RunContext(
+        log_level=(getattr(args, "log_level", None) or "info").lower(),
+        max_workers=getattr(args, "max_workers", MAX_WORKERS),
+    )
+
+
 @dataclass
 class SessionInfo:
     """Hold the session-related information."""
@@ -245,6 +317,45 @@ class SessionInfo:
     bunkr_status: dict[str, str]
     download_path: str
     network: NetworkContext
+    http: Session | None = None  # Shared pooled session; None uses the default.
+    run_ctx: RunContext = RunContext()
+
+    @cached_property
+    def existing_files(self) -> set[str]:
+        """Names already present in the download directory, scanned once.
+
+        Replaces a ``stat`` per file with a single directory listing; the
+        downloader adds each name it finalises so the set stays current.
+        """
+        try:
+            with os.scandir(self.download_path) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+
+    @cached_property
+    def ignore_pattern(self) -> re.Pattern[str] | None:
+        """Single regex matching any word of the ignore list, if one was given."""
+        return compile_word_filter(getattr(self.args, "ignore", None))
+
+    @cached_property
+    def include_pattern(self) -> re.Pattern[str] | None:
+        """Single regex matching any word of the include list, if one was given."""
+        return compile_word_filter(getattr(self.args, "include", None))
+
+
+def compile_word_filter(words: list[str] | None) -> re.Pattern[str] | None:
+    """Compile a list of literal substrings into one alternation regex.
+
+    Lets filename filtering run a single scan per file instead of one
+    substring test per word.
+    """
+    if not words:
+        return None
+
+    # Longest first so overlapping words never shadow one another
+    escaped = sorted(map(re.escape, set(words)), key=len, reverse=True)
+    return re.compile("|".join(escaped))
 
 
 def update_network_settings(
@@ -345,6 +456,17 @@ def build_network_context(
         ),
     )
 
+@dataclass(frozen=True, slots=True)
+class UrlInfo:
+    """URL-derived details resolved once per URL and shared down the call chain."""
+
+    is_album: bool
+    host_page: str
+    identifier: str
+    album_id: str | None
+    album_name: str | None
+
+
 @dataclass
 class AlbumInfo:
     """Store the information about an album and its associated item pages."""
@@ -359,13 +481,22 @@ class ProgressConfig:
     task_name: str
     item_description: str
     color: str = PROGRESS_MANAGER_COLORS["title_color"]
-    panel_width = 40
-    overall_buffer: deque = field(default_factory=lambda: deque(maxlen=BUFFER_SIZE))
+    panel_width: int = 40
 
 
 # ============================
 # Argument Parsing
 # ============================
+# Parser defaults snapshotted at import, before update_network_settings can
+# mutate the module globals, so a memoised parser never depends on when it
+# was first built.
+_DEFAULT_STATUS_PAGE = STATUS_PAGE
+_DEFAULT_BUNKR_API = BUNKR_API
+_DEFAULT_FALLBACK_DOMAIN = FALLBACK_DOMAIN
+_DEFAULT_REFERER = DOWNLOAD_HEADERS.get("Referer", DEFAULT_DOWNLOAD_REFERER)
+_DEFAULT_UA = HEADERS.get("User-Agent", DEFAULT_USER_AGENT)
+
+
 def add_common_arguments(parser: ArgumentParser) -> None:
     """Add arguments shared across parsers."""
     parser.add_argument(
@@ -399,31 +530,31 @@ def add_common_arguments(parser: ArgumentParser) -> None:
     parser.add_argument(
         "--status-page",
         type=str,
-        default=STATUS_PAGE,
+        default=_DEFAULT_STATUS_PAGE,
         help="Override the Bunkr status page URL (default: %(default)s).",
     )
     parser.add_argument(
         "--bunkr-api",
         type=str,
-        default=BUNKR_API,
+        default=_DEFAULT_BUNKR_API,
         help="Override the Bunkr API endpoint (default: %(default)s).",
     )
     parser.add_argument(
         "--download-referer",
         type=str,
-        default=DOWNLOAD_HEADERS.get("Referer", DEFAULT_DOWNLOAD_REFERER),
+        default=_DEFAULT_REFERER,
         help="Referer header sent with download requests (default: %(default)s).",
     )
     parser.add_argument(
         "--user-agent",
         type=str,
-        default=HEADERS.get("User-Agent", DEFAULT_USER_AGENT),
+        default=_DEFAULT_UA,
         help="User agent string for HTTP requests (default: %(default)s).",
     )
     parser.add_argument(
         "--fallback-domain",
         type=str,
-        default=FALLBACK_DOMAIN,
+        default=_DEFAULT_FALLBACK_DOMAIN,
         help="Fallback Bunkr domain used after 403 responses (default: %(default)s).",
     )
     parser.add_argument(
@@ -451,10 +582,15 @@ def add_common_arguments(parser: ArgumentParser) -> None:
     )
 
 
+@lru_cache(maxsize=4)
 def setup_parser(
         *, include_url: bool = False, include_filters: bool = False,
     ) -> ArgumentParser:
-    """Set up parser with optional argument groups."""
+    """Set up parser with optional argument groups.
+
+    Memoised per argument-group combination; callers must not add arguments
+    to the returned parser.
+    """
     parser = ArgumentParser(description="Command-line arguments.")
 
     if include_url:
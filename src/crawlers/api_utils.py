@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING
 import requests
 
 from src.config import BUNKR_API, HEADERS, HTTPStatus, NetworkContext
+from src.http_utils import get_http_session
 from src.url_utils import get_identifier
 
 if TYPE_CHECKING:
@@ -35,9 +36,9 @@ def get_api_response(
     headers = network.headers if network else HEADERS
 
     try:
-        with requests.Session() as session:
-            session.headers.update(headers)
-            response = session.post(api_url, json={"slug": slug})
+        response = get_http_session().post(
+            api_url, json={"slug": slug}, headers=headers,
+        )
 
         if response.status_code != HTTPStatus.OK:
             log_message = f"Failed to fetch encryption data for slug '{slug}'"
@@ -16,6 +16,8 @@ from .api_utils import decrypt_url, get_api_response
 if TYPE_CHECKING:
     from bs4 import BeautifulSoup
 
+_PAGE_ID = re.compile(r"\d+")
+
 
 def extract_next_album_pages(initial_soup: BeautifulSoup, url: str) -> list[str] | None:
     """Extract pagination links for subsequent album pages from an HTML document."""
@@ -26,7 +28,7 @@ def extract_next_album_pages(initial_soup: BeautifulSoup, url: str) -> list[str]
         return None
 
     pagination_text = pagination_nav.get_text()
-    page_ids = re.findall(r"\d+", pagination_text)
+    page_ids = _PAGE_ID.findall(pagination_text)
     num_pages = max(int(page_id) for page_id in page_ids)
 
     # Discard the first ID since it has already been processed in the main code
@@ -8,7 +8,7 @@ import asyncio
 from asyncio import Semaphore
 from collections import defaultdict
 
-from src.bunkr_utils import get_subdomain, refresh_server_status
+from src.bunkr_utils import get_subdomain, is_maintenance_status, refresh_server_status
 from src.config import MAX_WORKERS, AlbumInfo, DownloadInfo, SessionInfo, STATUS_CHECK_ON_FAILURE
 from src.crawlers.crawler_utils import get_download_info
 from src.general_utils import fetch_page
@@ -44,7 +44,9 @@ class AlbumDownloader:
             network = self.session_info.network
 
             # Process the download of an item
-            item_soup = await fetch_page(item_page, network=network)
+            item_soup = await fetch_page(
+                item_page, network=network, session=self.session_info.http,
+            )
             if item_soup is None:
                 self.live_manager.update_log(
                     event="Fetch failed",
@@ -104,7 +106,7 @@ class AlbumDownloader:
 
         # If there are failed downloads, process them after all downloads are complete
         if self.failed_downloads:
-            await self._process_failed_downloads()
+            await self._process_failed_downloads(semaphore)
 
     # Private methods
     async def _retry_failed_download(
@@ -128,7 +130,9 @@ class AlbumDownloader:
         if item_page:
             try:
                 item_soup = await fetch_page(
-                    item_page, network=self.session_info.network,
+                    item_page,
+                    network=self.session_info.network,
+                    session=self.session_info.http,
                 )
                 if item_soup is not None:
                     fresh_link, fresh_filename = await get_download_info(
@@ -159,74 +163,24 @@ class AlbumDownloader:
         # Run the synchronous download function in a separate thread
         await asyncio.to_thread(media_downloader.download)
 
-    async def _process_failed_downloads(self) -> None:
+    async def _process_failed_downloads(self, semaphore: Semaphore) -> None:
         """Process any failed downloads after the initial attempt.
 
         Groups failed downloads by subdomain and checks server status
         before retrying to handle maintenance scenarios intelligently.
+        Retries then run concurrently, bounded by the album's `semaphore`.
         """
         if not self.failed_downloads:
             return
 
-        # Check if status checking is enabled
-        skip_status_check = getattr(
-            self.session_info.args, "skip_status_check", False
-        ) if self.session_info.args else False
-
         # Group failed downloads by subdomain
         subdomain_groups: dict[str, list[dict]] = defaultdict(list)
         for data in self.failed_downloads:
             subdomain = get_subdomain(data["download_link"])
             subdomain_groups[subdomain].append(data)
 
-        # Process each subdomain group
-        for subdomain, downloads_group in subdomain_groups.items():
-            # Check status for this subdomain before retrying
-            if STATUS_CHECK_ON_FAILURE and not skip_status_check:
-                cache_ttl = getattr(
-                    self.session_info.args, "status_cache_ttl", 60
-                ) if self.session_info.args else 60
-
-                current_status, _ = refresh_server_status(
-                    subdomain,
-                    self.session_info.bunkr_status,
-                    cache_ttl_seconds=cache_ttl,
-                    network=self.session_info.network,
-                )
-
-                # Check if subdomain is still under maintenance
-                if "Maintenance" in current_status or "maintenance" in current_status.lower():
-                    maintenance_strategy = getattr(
-                        self.session_info.args, "maintenance_strategy", "backoff"
-                    ) if self.session_info.args else "backoff"
-
-                    if maintenance_strategy == "skip":
-                        # Skip all files from this subdomain
-                        self.live_manager.update_maintenance(
-                            subdomain=subdomain,
-                            status=current_status,
-                            affected_files_count=len(downloads_group),
-                            event="Maintenance skip (retry phase)",
-                            details=(
-                                f"Skipping {len(downloads_group)} file(s) from {subdomain} "
-                                f"due to ongoing maintenance (strategy: skip)."
-                            ),
-                        )
-                        continue  # Skip to next subdomain
-
-                    self.live_manager.update_maintenance(
-                        subdomain=subdomain,
-                        status=current_status,
-                        affected_files_count=len(downloads_group),
-                        event="Maintenance retry",
-                        details=(
-                            f"Retrying {len(downloads_group)} file(s) from {subdomain} "
-                            f"despite maintenance status: {current_status}"
-                        ),
-                    )
-
-            # Retry all downloads from this subdomain
-            for data in downloads_group:
+        async def retry_bounded(data: dict) -> None:
+            async with semaphore:
                 await self._retry_failed_download(
                     data["id"],
                     data["filename"],
@@ -234,4 +188,78 @@ class AlbumDownloader:
                     data.get("item_page"),
                 )
 
+        # Start each group's retries as soon as its status check passes, so
+        # files on healthy hosts do not wait for the remaining checks
+        retries: list[asyncio.Task] = []
+        try:
+            for subdomain, downloads_group in subdomain_groups.items():
+                if await self._should_retry_group(subdomain, downloads_group):
+                    retries.extend(
+                        asyncio.create_task(retry_bounded(data)) for data in downloads_group
+                    )
+
+        except BaseException:
+            for task in retries:
+                task.cancel()
+            await asyncio.gather(*retries, return_exceptions=True)
+            raise
+
+        await asyncio.gather(*retries)
         self.failed_downloads.clear()
+
+    async def _should_retry_group(self, subdomain: str, downloads_group: list[dict]) -> bool:
+        """Check the status of `subdomain` and return whether to retry its files.
+
+        Hosts under maintenance are skipped or retried anyway, per the
+        session's maintenance strategy; either way the decision is logged.
+        """
+        skip_status_check = getattr(
+            self.session_info.args, "skip_status_check", False
+        ) if self.session_info.args else False
+        if not STATUS_CHECK_ON_FAILURE or skip_status_check:
+            return True
+
+        cache_ttl = getattr(
+            self.session_info.args, "status_cache_ttl", 60
+        ) if self.session_info.args else 60
+
+        current_status, _ = await asyncio.to_thread(
+            refresh_server_status,
+            subdomain,
+            self.session_info.bunkr_status,
+            cache_ttl_seconds=cache_ttl,
+            network=self.session_info.network,
+        )
+
+        # Check if subdomain is still under maintenance
+        if is_maintenance_status(current_status):
+            maintenance_strategy = getattr(
+                self.session_info.args, "maintenance_strategy", "backoff"
+            ) if self.session_info.args else "backoff"
+
+            if maintenance_strategy == "skip":
+                # Skip all files from this subdomain
+                self.live_manager.update_maintenance(
+                    subdomain=subdomain,
+                    status=current_status,
+                    affected_files_count=len(downloads_group),
+                    event="Maintenance skip (retry phase)",
+                    details=(
+                        f"Skipping {len(downloads_group)} file(s) from {subdomain} "
+                        f"due to ongoing maintenance (strategy: skip)."
+                    ),
+                )
+                return False
+
+            self.live_manager.update_maintenance(
+                subdomain=subdomain,
+                status=current_status,
+                affected_files_count=len(downloads_group),
+                event="Maintenance retry",
+                details=(
+                    f"Retrying {len(downloads_group)} file(s) from {subdomain} "
+                    f"despite maintenance status: {current_status}"
+                ),
+            )
+
+        return True
@@ -2,22 +2,46 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import math
-import shutil
-from concurrent.futures import Future, ThreadPoolExecutor
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from enum import IntEnum
+from functools import partial
 from pathlib import Path
-from typing import Callable
+from typing import BinaryIO, Callable, Iterator
 
 import requests
 from requests import Response
-from requests.exceptions import ChunkedEncodingError, RequestException
-
-from src.config import DOWNLOAD_HEADERS, LARGE_FILE_CHUNK_SIZE, THRESHOLDS
+from requests.exceptions import ChunkedEncodingError, HTTPError, RequestException
+from requests.exceptions import ConnectionError as RequestConnectionError
+from urllib3.exceptions import ProtocolError, ReadTimeoutError, SSLError
+from urllib3.response import BaseHTTPResponse
+
+from src.config import (
+    DOWNLOAD_HEADERS,
+    MB,
+    RANGE_DOWNLOAD_MIN_SIZE,
+    RANGE_DOWNLOAD_PARTS,
+    STATUS_CACHE_TTL_SECONDS,
+    HTTPStatus,
+    pick_chunk_size,
+)
+from src.http_utils import get_http_session
 from src.managers.progress_manager import ProgressManager
 
 DEFAULT_UNKNOWN_SIZE_BASELINE = 50 * 1024 * 1024
+DEFAULT_WRITE_BUFFER_SIZE = 1 * MB
+# Minimum seconds between progress updates for one task (~20 Hz). Each update
+# re-renders the Rich view or publishes a web event, so per-chunk updates on a
+# fast link would otherwise dominate the download thread.
+PROGRESS_UPDATE_INTERVAL = 0.05
+# Attempts per byte range before a ranged download is abandoned. Each retry
+# resumes from the last byte written rather than restarting the range.
+RANGE_RETRIES = 3
 
 
 class DownloadOutcome(IntEnum):
@@ -38,12 +62,7 @@ class DownloadOutcome(IntEnum):
 
 def get_chunk_size(file_size: int) -> int:
     """Determine the optimal chunk size based on the file size."""
-    for threshold, chunk_size in THRESHOLDS:
-        if file_size < threshold:
-            return chunk_size
-
-    # Return a default chunk size for files larger than the largest threshold
-    return LARGE_FILE_CHUNK_SIZE
+    return pick_chunk_size(file_size)
 
 
 def _normalise_length(value: object) -> int | None:
@@ -70,11 +89,55 @@ def _extract_response_length(response: Response) -> int | None:
     return None
 
 
+# HEAD probe results keyed on the download URL, so retries of the same file
+# skip the round trip. Shape: {url: (expires_at, length_or_None)}. Unknown
+# lengths are remembered briefly to avoid hammering a host that omits them.
+_HEAD_CACHE: dict[str, tuple[float, int | None]] = {}
+_HEAD_CACHE_LOCK = threading.Lock()
+_HEAD_CACHE_MAX_ENTRIES = 1024
+HEAD_NEGATIVE_CACHE_SECONDS = 30
+
+
 def _head_content_length(
     download_url: str,
     *,
     timeout: float = 5.0,
     headers: dict[str, str] | None = None,
+) -> int | None:
+    """Return the HEAD-reported content length, reusing a recent probe."""
+    now = time.monotonic()
+    entry = _HEAD_CACHE.get(download_url)
+    if entry is not None:
+        if entry[0] > now:
+            return entry[1]
+
+        with _HEAD_CACHE_LOCK:
+            _HEAD_CACHE.pop(download_url, None)
+
+    length = _probe_content_length(download_url, timeout=timeout, headers=headers)
+    ttl = STATUS_CACHE_TTL_SECONDS if length else HEAD_NEGATIVE_CACHE_SECONDS
+    with _HEAD_CACHE_LOCK:
+        if len(_HEAD_CACHE) >= _HEAD_CACHE_MAX_ENTRIES:
+            for key in [key for key, (expires, _) in _HEAD_CACHE.items() if expires <= now]:
+                del _HEAD_CACHE[key]
+            if len(_HEAD_CACHE) >= _HEAD_CACHE_MAX_ENTRIES:
+                _HEAD_CACHE.clear()
+        _HEAD_CACHE[download_url] = (now + ttl, length)
+
+    return length
+
+
+def clear_head_cache() -> None:
+    """Forget every cached HEAD probe result."""
+    with _HEAD_CACHE_LOCK:
+        _HEAD_CACHE.clear()
+
+
+def _probe_content_length(
+    download_url: str,
+    *,
+    timeout: float = 5.0,
+    headers: dict[str, str] | None = None,
 ) -> int | None:
     """Best-effort HEAD request used to infer missing content lengths.
 
@@ -86,7 +149,7 @@ def _head_content_length(
 
     effective_headers = headers if headers is not None else DOWNLOAD_HEADERS
     try:
-        head_resp = requests.head(
+        head_resp = get_http_session().head(
             download_url,
             headers=effective_headers,
             timeout=timeout,
@@ -99,21 +162,202 @@ def _head_content_length(
     return _normalise_length(head_resp.headers.get("Content-Length"))
 
 
+# Shared pool for the content-length HEAD probes, created on first use so
+# importing the module stays cheap.
+_HEAD_EXECUTOR: ThreadPoolExecutor | None = None
+_HEAD_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_head_executor() -> ThreadPoolExecutor:
+    """Return the shared HEAD-probe executor, creating it on first use."""
+    global _HEAD_EXECUTOR  # pylint: disable=global-statement
+
+    executor = _HEAD_EXECUTOR
+    if executor is None:
+        with _HEAD_EXECUTOR_LOCK:
+            if _HEAD_EXECUTOR is None:
+                _HEAD_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="bunkr-head",
+                )
+                atexit.register(_HEAD_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+            executor = _HEAD_EXECUTOR
+
+    return executor
+
+
 def _resolve_content_length(
     response: Response,
     download_url: str | None,
     *,
     headers: dict[str, str] | None = None,
-) -> tuple[int | None, Future[int | None] | None, ThreadPoolExecutor | None]:
+) -> tuple[int | None, Future[int | None] | None]:
     """Determine an expected content length and return any async fallback."""
 
     length = _extract_response_length(response)
     if length or not download_url:
-        return length, None, None
+        return length, None
+
+    future = _get_head_executor().submit(
+        _head_content_length, download_url, headers=headers,
+    )
+    return None, future
+
+
+def _write_buffer_size(path: str) -> int:
+    """Return a file write buffer sized to a multiple of the filesystem block.
+
+    Small network chunks are coalesced into writes of at least this size,
+    cutting syscalls on slow disks and network filesystems. Falls back
+    to :data:`DEFAULT_WRITE_BUFFER_SIZE` where ``statvfs`` is unavailable.
+    """
+    try:
+        block_size = os.statvfs(os.path.dirname(path) or ".").f_bsize
+
+    except (AttributeError, OSError):  # statvfs is POSIX-only
+        return DEFAULT_WRITE_BUFFER_SIZE
+
+    return block_size * 16 if block_size > 0 else DEFAULT_WRITE_BUFFER_SIZE
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve `size` bytes for `fd` so the filesystem can lay them out contiguously.
+
+    Best-effort: uses ``posix_fallocate`` where available and falls back to
+    extending the file with ``ftruncate``. Filesystems that refuse the
+    allocation simply grow the file as it is written.
+    """
+    try:
+        os.posix_fallocate(fd, 0, size)
+
+    except AttributeError:  # posix_fallocate is unavailable on macOS/Windows
+        try:
+            os.ftruncate(fd, size)
+        except OSError:
+            pass
+
+    except OSError:  # e.g. EOPNOTSUPP on filesystems without fallocate
+        pass
+
+
+def _drop_page_cache(fd: int) -> None:
+    """Advise the kernel that the written bytes of `fd` will not be read back.
+
+    Downloaded media is written once and never reread by this process, so
+    keeping it in the page cache only evicts more useful data on long runs.
+    Dirty pages are queued for writeback and dropped once clean. Best-effort
+    and a no-op where ``posix_fadvise`` is unavailable (macOS/Windows).
+    """
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except (AttributeError, OSError):
+        pass
+
+
+# Kept well below IOV_MAX (1024 on Linux) for a single writev call.
+_MAX_PENDING_CHUNKS = 256
+
+
+class _VectoredWriter:
+    """Write-only file that flushes gathered chunks with one ``os.writev`` call.
+
+    Unlike a buffered writer it never copies chunks into an intermediate
+    buffer: the pending ``bytes`` objects are handed to the kernel as-is once
+    `threshold` bytes (or :data:`_MAX_PENDING_CHUNKS` chunks) are queued.
+    """
+
+    __slots__ = ("_fd", "_threshold", "_pending", "_pending_bytes")
+
+    def __init__(self, fd: int, threshold: int) -> None:
+        self._fd = fd
+        self._threshold = threshold
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+
+    def __enter__(self) -> _VectoredWriter:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def write(self, chunk: bytes) -> None:
+        """Queue `chunk`, flushing once enough data is pending."""
+        self._pending.append(chunk)
+        self._pending_bytes += len(chunk)
+        if (
+            self._pending_bytes >= self._threshold
+            or len(self._pending) >= _MAX_PENDING_CHUNKS
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every pending chunk to the file."""
+        if not self._pending:
+            return
+
+        written = os.writev(self._fd, self._pending)
+        if written < self._pending_bytes:  # partial write, rare on regular files
+            remainder = memoryview(b"".join(self._pending))[written:]
+            while remainder:
+                remainder = remainder[os.write(self._fd, remainder):]
+
+        self._pending = []
+        self._pending_bytes = 0
+
+    def close(self) -> None:
+        """Flush pending chunks and close the descriptor."""
+        try:
+            self.flush()
+            _drop_page_cache(self._fd)
+        finally:
+            os.close(self._fd)
+
+
+def _open_temp_file(
+    path: str, file_size: int | None, buffer_size: int,
+) -> BinaryIO | _VectoredWriter:
+    """Open `path` for writing, preallocating it when the final size is known.
+
+    Uses :class:`_VectoredWriter` where ``os.writev`` exists and a regular
+    buffered file elsewhere (Windows).
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    if file_size:
+        _preallocate(fd, file_size)
+
+    if hasattr(os, "writev"):
+        return _VectoredWriter(fd, buffer_size)
+
+    return os.fdopen(fd, "wb", buffering=buffer_size)
+
+
+def _iter_body(response: Response, chunk_size: int) -> Iterator[bytes]:
+    """Yield the response body in `chunk_size` pieces.
+
+    Identity-encoded bodies need no decoding, so they are copied straight off
+    the urllib3 stream without the content decoder and the extra generator
+    layer of ``iter_content``. Encoded bodies (and test doubles) still go
+    through ``iter_content``. Errors are translated the same way
+    ``iter_content`` does so callers handle a single set of exceptions.
+    """
+    raw = response.raw
+    encoding = response.headers.get("Content-Encoding", "identity").lower()
+    if not isinstance(raw, BaseHTTPResponse) or encoding != "identity":
+        yield from response.iter_content(chunk_size=chunk_size)
+        return
 
-    executor = ThreadPoolExecutor(max_workers=1)
-    future = executor.submit(_head_content_length, download_url, headers=headers)
-    return None, future, executor
+    try:
+        yield from raw.stream(chunk_size, decode_content=False)
+
+    except ProtocolError as proto_err:
+        raise ChunkedEncodingError(proto_err) from proto_err
+
+    except ReadTimeoutError as timeout_err:
+        raise RequestConnectionError(timeout_err) from timeout_err
+
+    except SSLError as ssl_err:
+        # ``requests``' SSLError is a ConnectionError, so a TLS stream cut off
+        # mid-body is resumed or retried like any other dropped connection.
+        raise requests.exceptions.SSLError(ssl_err) from ssl_err
 
 
 def _log_once(progress_manager: ProgressManager, message: str) -> None:
@@ -127,56 +371,348 @@ def _log_once(progress_manager: ProgressManager, message: str) -> None:
 class _ProgressEstimator:  # pylint: disable=too-few-public-methods
     """Track a rolling progress estimate when file size is unknown."""
 
-    __slots__ = ("baseline", "estimate")
+    __slots__ = (
+        "baseline", "estimate", "_percent_per_byte", "_log_progress", "_next_log_threshold",
+    )
 
     def __init__(self, baseline: float) -> None:
+        # Always positive, so update() needs no zero guard or division.
         self.baseline = baseline if baseline > 0 else float(DEFAULT_UNKNOWN_SIZE_BASELINE)
+        self._percent_per_byte = 100.0 / self.baseline
         self.estimate = 0.0
+        # The log-scaled floor only moves meaningfully when the byte count
+        # doubles, so it is recomputed at power-of-two crossings.
+        self._log_progress = 0.0
+        self._next_log_threshold = 1
 
     def update(self, downloaded_bytes: int) -> float:
         """Return the next completion percentage for the streamed download."""
         if downloaded_bytes <= 0:
             return self.estimate
 
-        if self.baseline <= 0:
-            self.baseline = float(downloaded_bytes) or 1.0
+        if downloaded_bytes >= self._next_log_threshold:
+            self._log_progress = math.log10(downloaded_bytes + 1) * 20.0
+            self._next_log_threshold = downloaded_bytes * 2
 
-        linear_progress = (downloaded_bytes / self.baseline) * 100
-        log_scaled_progress = math.log10(downloaded_bytes + 1) * 20.0
-        self.estimate = min(99.0, max(self.estimate, linear_progress, log_scaled_progress))
+        linear_progress = downloaded_bytes * self._percent_per_byte
+        self.estimate = min(99.0, max(self.estimate, linear_progress, self._log_progress))
         return self.estimate
 
 
-def _emit_progress(
-    progress_manager: ProgressManager,
+def _progress_emitter(
+    progress_manager: ProgressManager, task: int, file_size: int | None,
+) -> Callable[[int], None]:
+    """Return a callable reporting `task` progress for a given byte count.
+
+    The known-size and estimated variants are chosen once, so the download
+    loop calls a single pre-bound function without re-checking the size.
+    """
+    update_task = progress_manager.update_task
+
+    if file_size:
+        percent_per_byte = 100.0 / file_size
+
+        def emit_known(total_downloaded: int) -> None:
+            update_task(task, completed=min(100.0, total_downloaded * percent_per_byte))
+
+        return emit_known
+
+    estimate = _ProgressEstimator(float(DEFAULT_UNKNOWN_SIZE_BASELINE)).update
+
+    def emit_estimated(total_downloaded: int) -> None:
+        update_task(task, completed=estimate(total_downloaded))
+
+    return emit_estimated
+
+
+class _RangeProgress:  # pylint: disable=too-few-public-methods
+    """Aggregate the bytes written by concurrent range workers into one task."""
+
+    __slots__ = ("_lock", "_progress_manager", "_task", "_file_size", "_last_update",
+                 "total", "abort")
+
+    def __init__(self, progress_manager: ProgressManager, task: int, file_size: int) -> None:
+        self._lock = threading.Lock()
+        self._progress_manager = progress_manager
+        self._task = task
+        self._file_size = file_size
+        self._last_update = 0.0
+        self.total = 0
+        # Set when one range fails so the others stop instead of finishing a
+        # download that will be retried anyway.
+        self.abort = threading.Event()
+
+    def add(self, count: int) -> None:
+        """Record `count` written bytes and refresh the task at most ~20 Hz."""
+        with self._lock:
+            self.total += count
+            now = time.monotonic()
+            if now - self._last_update < PROGRESS_UPDATE_INTERVAL:
+                return
+
+            self._last_update = now
+            completed = min(100.0, (self.total / self._file_size) * 100)
+
+        self._progress_manager.update_task(self._task, completed=completed)
+
+
+def _accepts_ranges(response: Response) -> bool:
+    """Return whether byte offsets of `response` can be re-requested with Range."""
+    return (
+        response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        and response.headers.get("Content-Encoding", "identity").lower() == "identity"
+    )
+
+
+def _supports_ranges(response: Response, file_size: int | None) -> bool:
+    """Return whether the download is large enough and the server accepts ranges."""
+    return bool(
+        RANGE_DOWNLOAD_PARTS > 1
+        and file_size
+        and file_size >= RANGE_DOWNLOAD_MIN_SIZE
+        and hasattr(os, "pwrite")
+        and _accepts_ranges(response),
+    )
+
+
+def _range_parts(host_slot: threading.Semaphore | None) -> int:
+    """Return how many ranges to fetch, claiming a host slot for each extra one.
+
+    Every range is a connection of its own, so besides the slot the caller
+    already holds, each extra range takes a free slot of `host_slot` without
+    blocking. The caller releases ``parts - 1`` slots once the transfer ends.
+    """
+    if host_slot is None:
+        return RANGE_DOWNLOAD_PARTS
+
+    parts = 1
+    while parts < RANGE_DOWNLOAD_PARTS and host_slot.acquire(blocking=False):
+        parts += 1
+
+    return parts
+
+
+def _split_ranges(file_size: int, parts: int) -> list[tuple[int, int]]:
+    """Split `file_size` bytes into `parts` contiguous inclusive byte ranges."""
+    part_size = math.ceil(file_size / parts)
+    return [
+        (start, min(start + part_size, file_size) - 1)
+        for start in range(0, file_size, part_size)
+    ]
+
+
+def _open_range(  # pylint: disable=too-many-arguments
+    session: requests.Session,
+    download_url: str,
+    headers: dict[str, str],
+    start: int,
+    end: int,
+    *,
+    pace: Callable[[], None] | None = None,
+) -> Response:
+    """Open a streaming GET for the inclusive byte range `start`-`end`.
+
+    `pace`, when given, is called first so the request waits its turn in the
+    host's request budget like the initial GET.
+    """
+    if pace is not None:
+        pace()
+
+    response = session.get(
+        download_url,
+        headers={**headers, "Range": f"bytes={start}-{end}"},
+        stream=True,
+        timeout=30,
+    )
+    response.raise_for_status()
+
+    # A full 200 body or an encoded one cannot be written at the range offset.
+    encoding = response.headers.get("Content-Encoding", "identity").lower()
+    if response.status_code != HTTPStatus.PARTIAL_CONTENT or encoding != "identity":
+        response.close()
+        error_message = f"Range request for {download_url} was not honoured"
+        raise RequestException(error_message)
+
+    return response
+
+
+def _fetch_range(  # pylint: disable=too-many-arguments
+    fd: int,
+    start: int,
+    end: int,
+    *,
+    open_range: Callable[[int, int], Response],
+    progress: _RangeProgress,
+    chunk_size: int,
+    response: Response | None = None,
+) -> None:
+    """Write bytes `start`-`end` at their offset in `fd`, resuming on failure.
+
+    `response`, when given, is an already-open stream positioned at `start`
+    (the initial GET), which saves a request for the first range.
+    """
+    offset = start
+    for attempt in range(RANGE_RETRIES):
+        try:
+            if response is None:
+                response = open_range(offset, end)
+
+            for chunk in _iter_body(response, chunk_size):
+                if progress.abort.is_set():
+                    return
+
+                view = memoryview(chunk)[: end + 1 - offset]
+                while view:
+                    written = os.pwrite(fd, view, offset)
+                    view = view[written:]
+                    offset += written
+                    progress.add(written)
+
+                if offset > end:
+                    return
+
+        except HTTPError:
+            # A 429/503 is the host pushing back; re-asking at once would
+            # only make it worse, so the caller's backoff handles it.
+            raise
+
+        except RequestException:
+            if attempt == RANGE_RETRIES - 1:
+                raise
+
+        finally:
+            if response is not None:
+                response.close()
+            response = None
+
+    error_message = f"Range {start}-{end} stopped at byte {offset}"
+    raise ChunkedEncodingError(error_message)
+
+
+def _resumable_body(
+    response: Response,
+    chunk_size: int,
+    *,
+    resume: Callable[[int], Response] | None,
+) -> Iterator[bytes]:
+    """Yield the body of `response`, resuming after a dropped connection.
+
+    When the stream breaks and `resume` is given, the remainder is requested
+    from the first missing byte (up to :data:`RANGE_RETRIES` times) instead of
+    failing the whole transfer. A server that does not honour the range
+    surfaces as the original :class:`ChunkedEncodingError`.
+    """
+    offset = 0
+    for attempt in range(RANGE_RETRIES + 1):
+        try:
+            for chunk in _iter_body(response, chunk_size):
+                offset += len(chunk)
+                yield chunk
+            return
+
+        except (ChunkedEncodingError, RequestConnectionError):
+            if resume is None or attempt == RANGE_RETRIES:
+                raise
+
+        response.close()
+        try:
+            response = resume(offset)
+        except HTTPError:
+            raise
+        except RequestException as req_err:
+            raise ChunkedEncodingError(req_err) from req_err
+
+
+def _save_with_ranges(  # pylint: disable=too-many-arguments,too-many-locals
+    response: Response,
+    download_path: str,
     task: int,
+    progress_manager: ProgressManager,
     *,
-    file_size: int | None,
-    estimator: _ProgressEstimator | None,
-    total_downloaded: int,
-) -> _ProgressEstimator | None:  # pylint: disable=too-many-arguments
-    """Update the task progress, returning the (possibly new) estimator."""
+    download_url: str,
+    download_headers: dict[str, str] | None,
+    file_size: int,
+    parts: int,
+    session: requests.Session | None,
+    pace: Callable[[], None] | None,
+) -> DownloadOutcome:
+    """Download `file_size` bytes as `parts` concurrent byte ranges into a `.part` file.
 
-    if file_size:
-        progress_manager.update_task(
-            task,
-            completed=min(100.0, (total_downloaded / file_size) * 100),
-        )
-        return estimator
+    The initial GET keeps serving the first range; the remaining ranges are
+    requested over the pooled session and written at their offsets with
+    ``os.pwrite``, so no locking is needed around the file. An HTTP status
+    error on a range request is re-raised for the caller's backoff.
+    """
+    ranges = _split_ranges(file_size, parts)
+    progress = _RangeProgress(progress_manager, task, file_size)
+    open_range = partial(
+        _open_range,
+        session or get_http_session(),
+        download_url,
+        download_headers if download_headers is not None else DOWNLOAD_HEADERS,
+        pace=pace,
+    )
+    chunk_size = get_chunk_size(file_size // len(ranges))
+    temp_download_path = f"{download_path}.part"
+
+    try:
+        fd = os.open(temp_download_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _preallocate(fd, file_size)
+            with ThreadPoolExecutor(
+                max_workers=len(ranges), thread_name_prefix="bunkr-range",
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _fetch_range,
+                        fd,
+                        start,
+                        end,
+                        open_range=open_range,
+                        progress=progress,
+                        chunk_size=chunk_size,
+                        response=response if index == 0 else None,
+                    )
+                    for index, (start, end) in enumerate(ranges)
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+
+                except BaseException:
+                    progress.abort.set()
+                    raise
 
-    estimator = estimator or _ProgressEstimator(float(DEFAULT_UNKNOWN_SIZE_BASELINE))
-    progress_manager.update_task(
-        task,
-        completed=estimator.update(total_downloaded),
+            _drop_page_cache(fd)
+
+        finally:
+            os.close(fd)
+
+    except HTTPError:
+        progress_manager.update_task(task, completed=0)
+        raise
+
+    except (RequestException, OSError) as err:
+        _log_once(progress_manager, f"Ranged transfer for {download_path} failed: {err}")
+        progress_manager.update_task(task, completed=0, visible=False)
+        return DownloadOutcome.RETRYABLE_FAILURE
+
+    return _finalise_download(
+        file_size=file_size,
+        total_downloaded=progress.total,
+        temp_path=temp_download_path,
+        final_path=download_path,
+        progress_manager=progress_manager,
+        task=task,
     )
-    return estimator
+
 
 # pylint: disable=too-many-arguments
 def _finalise_download(
     *,
     file_size: int | None,
     total_downloaded: int,
-    temp_path: Path,
+    temp_path: str | Path,
     final_path: str,
     progress_manager: ProgressManager,
     task: int,
@@ -198,7 +734,7 @@ def _finalise_download(
             progress_manager.update_task(task, completed=0, visible=False)
             return DownloadOutcome.RETRYABLE_FAILURE
         try:
-            shutil.move(temp_path, final_path)
+            os.replace(temp_path, final_path)
         except OSError as os_err:
             _log_once(progress_manager, f"Could not finalise {final_path}: {os_err}")
             progress_manager.update_task(task, completed=0, visible=False)
@@ -207,7 +743,7 @@ def _finalise_download(
         return DownloadOutcome.SUCCESS
 
     try:
-        shutil.move(temp_path, final_path)
+        os.replace(temp_path, final_path)
     except OSError as os_err:
         _log_once(progress_manager, f"Could not finalise {final_path}: {os_err}")
         progress_manager.update_task(task, completed=0, visible=False)
@@ -217,7 +753,7 @@ def _finalise_download(
 # pylint: enable=too-many-arguments
 
 
-def save_file_with_progress(  # pylint: disable=too-many-locals,too-many-arguments
+def save_file_with_progress(  # pylint: disable=too-many-locals,too-many-arguments,too-many-branches,too-many-statements
     response: Response,
     download_path: str,
     task: int,
@@ -225,20 +761,54 @@ def save_file_with_progress(  # pylint: disable=too-many-locals,too-many-argumen
     *,
     download_url: str | None = None,
     download_headers: dict[str, str] | None = None,
+    session: requests.Session | None = None,
+    host_slot: threading.Semaphore | None = None,
+    pace: Callable[[], None] | None = None,
 ) -> DownloadOutcome:
     """Save the file from the response to the specified path.
 
-    Adds a `.temp` extension for in-flight downloads and attempts to infer the
+    Streams into a `.part` file next to the destination and attempts to infer the
     content length so live progress can be reported accurately. When the server
     omits the header, a best-effort estimate is used so the UI still reflects
     activity while streaming. The optional ``download_headers`` are forwarded
     to the HEAD probe so the content-length backfill uses the same user-agent
     and referer as the streaming GET — otherwise per-job ``NetworkContext``
     overrides would be silently ignored for unknown-length files.
+
+    Large files from servers that accept byte ranges are split across several
+    connections (see :data:`RANGE_DOWNLOAD_PARTS`), using ``session`` or the
+    shared pooled session for the extra range requests. Each extra connection
+    takes a free slot of ``host_slot`` when one is given. Smaller files resume
+    from the last written byte when the stream drops mid-transfer. ``pace`` is
+    called before every range or resume request (e.g. a host token bucket).
+
+    Raises :class:`requests.HTTPError` when a range or resume request is
+    refused (e.g. 429), so the caller can back off before retrying.
     """
-    file_size, head_future, head_executor = _resolve_content_length(
+    file_size, head_future = _resolve_content_length(
         response, download_url, headers=download_headers,
     )
+    if download_url and _supports_ranges(response, file_size):
+        parts = _range_parts(host_slot)
+        if parts > 1:
+            try:
+                return _save_with_ranges(
+                    response,
+                    download_path,
+                    task,
+                    progress_manager,
+                    download_url=download_url,
+                    download_headers=download_headers,
+                    file_size=file_size,
+                    parts=parts,
+                    session=session,
+                    pace=pace,
+                )
+            finally:
+                if host_slot is not None:
+                    for _ in range(parts - 1):
+                        host_slot.release()
+
     if file_size is None:
         logging.warning("Content length unavailable for %s", download_path)
         _log_once(
@@ -246,43 +816,52 @@ def save_file_with_progress(  # pylint: disable=too-many-locals,too-many-argumen
             "Server did not provide a content length. Progress will be estimated.",
         )
 
-    # Initialize a temporary download path with the .temp extension
-    temp_download_path = Path(download_path).with_suffix(".temp")
+    # Stream into "<name>.part" alongside the destination; appending rather
+    # than swapping the suffix keeps "clip.mp4" and "clip.jpg" from sharing
+    # one in-flight file when an album downloads both concurrently.
+    temp_download_path = f"{download_path}.part"
     chunk_size = get_chunk_size(file_size or 0)
     total_downloaded = 0
-    estimator = (
-        _ProgressEstimator(float(DEFAULT_UNKNOWN_SIZE_BASELINE))
-        if file_size is None
+    emit_progress = _progress_emitter(progress_manager, task, file_size)
+    resume = (
+        partial(
+            _open_range,
+            session or get_http_session(),
+            download_url,
+            download_headers if download_headers is not None else DOWNLOAD_HEADERS,
+            end=file_size - 1,
+            pace=pace,
+        )
+        if download_url and file_size and _accepts_ranges(response)
         else None
     )
+    last_update = 0.0
 
     try:
-        with temp_download_path.open("wb") as file:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk is not None:
-                    file.write(chunk)
-                    total_downloaded += len(chunk)
-                    estimator = _emit_progress(
-                        progress_manager,
-                        task,
-                        file_size=file_size,
-                        estimator=estimator,
-                        total_downloaded=total_downloaded,
-                    )
-                    if head_future and file_size is None and head_future.done():
-                        head_length = head_future.result()
-                        head_future = None
-
-                        if head_length:
-                            file_size = head_length
-                            estimator = None
-                            progress_manager.update_task(
-                                task,
-                                completed=min(
-                                    100.0,
-                                    (total_downloaded / file_size) * 100,
-                                ),
-                            )
+        buffer_size = _write_buffer_size(download_path)
+        with _open_temp_file(temp_download_path, file_size, buffer_size) as file:
+            # Per-chunk work is kept to the write and a clock read; everything
+            # else runs at most once per PROGRESS_UPDATE_INTERVAL.
+            write = file.write
+            monotonic = time.monotonic
+            for chunk in _resumable_body(response, chunk_size, resume=resume):
+                write(chunk)
+                total_downloaded += len(chunk)
+
+                # Coalesce updates; _finalise_download always reports the
+                # terminal state, so skipped intermediate ticks are harmless.
+                now = monotonic()
+                if now - last_update < PROGRESS_UPDATE_INTERVAL:
+                    continue
+
+                last_update = now
+                if head_future and file_size is None and head_future.done():
+                    file_size = head_future.result()
+                    head_future = None
+                    if file_size:
+                        emit_progress = _progress_emitter(progress_manager, task, file_size)
+
+                emit_progress(total_downloaded)
 
     # Handle partial downloads caused by network interruptions. The task would
     # otherwise sit frozen at its last estimate — hide it and log so retry
@@ -295,13 +874,18 @@ def save_file_with_progress(  # pylint: disable=too-many-locals,too-many-argumen
         progress_manager.update_task(task, completed=0, visible=False)
         return DownloadOutcome.RETRYABLE_FAILURE
 
+    except HTTPError:
+        progress_manager.update_task(task, completed=0)
+        raise
+
     finally:
-        if head_executor:
-            head_executor.shutdown(wait=False, cancel_futures=True)
+        # Drop a probe that has not started yet; the pool itself is shared.
+        if head_future is not None and file_size is None:
+            head_future.cancel()
 
     # Late HEAD result: if the content-length probe resolved after the loop
-    # exited, promote the estimator into a real percentage one last time so
-    # _finalise_download can compare bytes correctly.
+    # exited, adopt the real size so _finalise_download can compare bytes
+    # correctly.
     if head_future is not None and file_size is None:
         try:
             head_length = head_future.result(timeout=0.1)
@@ -6,24 +6,30 @@ download experience.
 
 from __future__ import annotations
 
+import os
 import random
+import threading
 import time
-from pathlib import Path
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import TYPE_CHECKING
 
-import requests
-from requests import RequestException
+from requests import HTTPError, RequestException
 
 from src.bunkr_utils import (
     get_subdomain,
+    is_maintenance_status,
     mark_subdomain_as_offline,
     refresh_server_status,
     subdomain_is_offline,
+    wait_for_recovery,
 )
 from src.config import (
     DOWNLOAD_HEADERS,
+    HOST_REQUEST_RATE,
     DownloadInfo,
     HTTPStatus,
+    MAX_DOWNLOADS_PER_HOST,
     SessionInfo,
     STATUS_CHECK_ON_FAILURE,
 )
@@ -32,14 +38,138 @@ from src.file_utils import (
     truncate_filename,
     write_on_session_log,
 )
+from src.http_utils import get_http_session
 
 from .download_utils import DownloadOutcome, save_file_with_progress
 
 if TYPE_CHECKING:
     from src.managers.live_manager import LiveManager
 
+# Decorrelated-jitter backoff bounds (seconds) for transient failures, and the
+# fixed schedule used while a host is under maintenance.
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+MAINTENANCE_DELAYS = (60, 180, 300)
+# Longest server-requested wait honoured; anything beyond uses normal backoff.
+RETRY_AFTER_MAX_SECONDS = 120
+# Slowest pace a rate-limited host is throttled to, in requests per second.
+HOST_RATE_FLOOR = 0.25
 
-class MediaDownloader:
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the wait requested by a ``Retry-After`` header, in seconds.
+
+    Accepts delta-seconds or an HTTP date. Returns None when the header is
+    missing, malformed or asks for more than :data:`RETRY_AFTER_MAX_SECONDS`.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    return seconds if seconds <= RETRY_AFTER_MAX_SECONDS else None
+
+
+class _TokenBucket:
+    """Per-host request pacer with additive-increase/multiplicative-decrease.
+
+    Callers take one token per request, sleeping until one is available.
+    A 429 halves the refill rate; every success adds back a fraction of the
+    configured rate until it is reached again.
+    """
+
+    __slots__ = ("_max_rate", "_rate", "_capacity", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self._max_rate = rate
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate in tokens per second."""
+        return self._rate
+
+    def acquire(self) -> None:
+        """Take a token, blocking until the bucket has one."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self._rate
+
+            time.sleep(wait)
+
+    def penalise(self) -> None:
+        """Halve the rate after the host pushed back."""
+        with self._lock:
+            self._rate = max(self._rate / 2, HOST_RATE_FLOOR)
+
+    def reward(self) -> None:
+        """Recover part of the configured rate after a successful request."""
+        with self._lock:
+            self._rate = min(self._rate + self._max_rate / 10, self._max_rate)
+
+
+# One slot pool per CDN subdomain, shared by every downloader in the process,
+# so a high --max-workers cannot pile onto a single host and trip its 429/521
+# protection.
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def _host_slot(subdomain: str) -> threading.BoundedSemaphore:
+    """Return the concurrency limiter for `subdomain`, creating it on first use."""
+    slot = _host_slots.get(subdomain)
+    if slot is None:
+        with _host_slots_lock:
+            slot = _host_slots.setdefault(
+                subdomain, threading.BoundedSemaphore(max(MAX_DOWNLOADS_PER_HOST, 1)),
+            )
+
+    return slot
+
+
+_host_buckets: dict[str, _TokenBucket] = {}
+
+
+def _host_bucket(subdomain: str) -> _TokenBucket | None:
+    """Return the request pacer for `subdomain`, or None when pacing is off."""
+    if HOST_REQUEST_RATE <= 0:
+        return None
+
+    bucket = _host_buckets.get(subdomain)
+    if bucket is None:
+        with _host_slots_lock:
+            bucket = _host_buckets.setdefault(
+                subdomain,
+                _TokenBucket(HOST_REQUEST_RATE, max(MAX_DOWNLOADS_PER_HOST, 1)),
+            )
+
+    return bucket
+
+
+class MediaDownloader:  # pylint: disable=too-many-instance-attributes
     """Manage the downloading of individual files from Bunkr URLs."""
 
     def __init__(
@@ -54,6 +184,16 @@ class MediaDownloader:
         self.download_info = download_info
         self.live_manager = live_manager
         self.retries = retries
+        self._last_delay = RETRY_BASE_DELAY
+        self._host_bucket: _TokenBucket | None = None
+
+        # Failure-handling options are fixed for the session; resolve them once
+        args = session_info.args
+        self.skip_status_check: bool = getattr(args, "skip_status_check", False)
+        self.status_cache_ttl: int = getattr(args, "status_cache_ttl", 60)
+        self.maintenance_strategy: str = getattr(
+            args, "maintenance_strategy", "backoff",
+        )
 
     def attempt_download(self, final_path: str) -> DownloadOutcome:
         """Attempt to download the file with retries.
@@ -67,34 +207,63 @@ class MediaDownloader:
             if self.session_info.network is not None
             else DOWNLOAD_HEADERS
         )
+        # Pooled keep-alive connections are reused across attempts and files
+        session = self.session_info.http or get_http_session()
+        subdomain = get_subdomain(self.download_info.download_link)
+        host_slot = _host_slot(subdomain)
+        self._host_bucket = _host_bucket(subdomain)
         for attempt in range(self.retries):
-            try:
-                response = requests.get(
-                    self.download_info.download_link,
-                    stream=True,
-                    headers=download_headers,
-                    timeout=30,
-                )
-                response.raise_for_status()
+            # Pace before taking a slot so a throttled request does not hold one
+            if self._host_bucket is not None:
+                self._host_bucket.acquire()
+
+            with host_slot:
+                try:
+                    response = session.get(
+                        self.download_info.download_link,
+                        stream=True,
+                        headers=download_headers,
+                        timeout=30,
+                    )
+                    response.raise_for_status()
+
+                except RequestException as req_err:
+                    request_error = req_err
+
+                else:
+                    if self._host_bucket is not None:
+                        self._host_bucket.reward()
+
+                    try:
+                        return save_file_with_progress(
+                            response,
+                            final_path,
+                            self.download_info.task,
+                            self.live_manager,
+                            download_url=self.download_info.download_link,
+                            # Propagate per-job headers so the HEAD probe used
+                            # for unknown-length downloads matches the streaming
+                            # GET's user-agent / referer — otherwise a different
+                            # CDN response can land in the content-length backfill.
+                            download_headers=download_headers,
+                            session=session,
+                            host_slot=host_slot,
+                            pace=(
+                                self._host_bucket.acquire
+                                if self._host_bucket is not None
+                                else None
+                            ),
+                        )
 
-            except RequestException as req_err:
-                # Exit the loop if not retrying
-                if not self._handle_request_exception(req_err, attempt):
-                    break
+                    # A range or resume request was refused mid-transfer
+                    # (429/503); back off exactly as for the initial GET.
+                    except HTTPError as http_err:
+                        request_error = http_err
 
-            else:
-                return save_file_with_progress(
-                    response,
-                    final_path,
-                    self.download_info.task,
-                    self.live_manager,
-                    download_url=self.download_info.download_link,
-                    # Propagate per-job headers so the HEAD probe used for
-                    # unknown-length downloads matches the streaming GET's
-                    # user-agent / referer — otherwise a different CDN
-                    # response can land in the content-length backfill.
-                    download_headers=download_headers,
-                )
+            # Back off outside the slot so other files on the host can proceed.
+            # Exit the loop if not retrying
+            if not self._handle_request_exception(request_error, attempt):
+                break
 
         # All retries exhausted — caller decides whether to queue a retry pass.
         return DownloadOutcome.RETRYABLE_FAILURE
@@ -118,7 +287,7 @@ class MediaDownloader:
             return None
 
         formatted_filename = truncate_filename(self.download_info.filename)
-        final_path = Path(self.session_info.download_path) / formatted_filename
+        final_path = os.path.join(self.session_info.download_path, formatted_filename)
 
         # Skip download if the file exists or is blacklisted
         if self._skip_file_download(final_path):
@@ -131,6 +300,7 @@ class MediaDownloader:
         if outcome is not DownloadOutcome.SUCCESS:
             return self._handle_failed_download(is_final_attempt=is_final_attempt)
 
+        self.session_info.existing_files.add(formatted_filename)
         return None
 
     # Private methods
@@ -145,8 +315,8 @@ class MediaDownloader:
         If any of these conditions are met, the download is skipped, and appropriate
         logs are updated.
         """
-        ignore_list = getattr(self.session_info.args, "ignore", [])
-        include_list = getattr(self.session_info.args, "include", [])
+        ignore_pattern = self.session_info.ignore_pattern
+        include_pattern = self.session_info.include_pattern
 
         def log_and_skip_event(reason: str) -> bool:
             """Log the skip reason and updates the task before."""
@@ -159,22 +329,20 @@ class MediaDownloader:
             return True
 
         # Check if the file already exists
-        if Path(final_path).exists():
+        if os.path.basename(final_path) in self.session_info.existing_files:
             return log_and_skip_event(
                 f"{self.download_info.filename} has already been downloaded.",
             )
 
         # Check if the file is in the ignore list
-        if ignore_list and any(
-            word in self.download_info.filename for word in ignore_list
-        ):
+        if ignore_pattern and ignore_pattern.search(self.download_info.filename):
             return log_and_skip_event(
                 f"{self.download_info.filename} matches the ignore list.",
             )
 
         # Check if the file is not in the include list
-        if include_list and all(
-            word not in self.download_info.filename for word in include_list
+        if include_pattern and not include_pattern.search(
+            self.download_info.filename,
         ):
             return log_and_skip_event(
                 f"No included words found for {self.download_info.filename}.",
@@ -184,9 +352,17 @@ class MediaDownloader:
         return False
 
     def _retry_with_backoff(
-        self, attempt: int, *, event: str, maintenance_delay: bool = False
+        self,
+        attempt: int,
+        *,
+        event: str,
+        maintenance_delay: bool = False,
+        retry_after: float | None = None,
     ) -> bool:
-        """Log error, apply backoff, and return True if should retry."""
+        """Log error, apply backoff, and return True if should retry.
+
+        A server-provided `retry_after` (seconds) replaces the computed delay.
+        """
         self.live_manager.update_log(
             event=event,
             details=f"{event} for {self.download_info.filename} "
@@ -194,16 +370,37 @@ class MediaDownloader:
         )
 
         if attempt < self.retries - 1:
-            if maintenance_delay:
-                # Longer delays for maintenance: 2min, 5min, 10min
-                delay_minutes = [2, 5, 10]
-                delay = delay_minutes[min(attempt, len(delay_minutes) - 1)] * 60
+            if retry_after is not None:
+                delay = retry_after + random.uniform(0, 1)  # noqa: S311
+            elif maintenance_delay:
+                # Longer delays for maintenance: 1min, 3min, 5min
+                delay = MAINTENANCE_DELAYS[min(attempt, len(MAINTENANCE_DELAYS) - 1)]
                 delay += random.uniform(1, 10)  # noqa: S311
             else:
-                # Standard exponential backoff
-                delay = 3 ** (attempt + 1) + random.uniform(1, 3)  # noqa: S311
+                # Decorrelated jitter: spread retries out without the long
+                # exponential tail, so transient CDN errors cost seconds
+                delay = min(
+                    RETRY_MAX_DELAY,
+                    random.uniform(RETRY_BASE_DELAY, self._last_delay * 3),  # noqa: S311
+                )
+                self._last_delay = delay
 
-            time.sleep(delay)
+            if maintenance_delay:
+                # Resume as soon as a status refresh sees the host back up
+                subdomain = get_subdomain(self.download_info.download_link)
+                if wait_for_recovery(
+                    subdomain,
+                    delay,
+                    network=self.session_info.network,
+                    ttl=self.status_cache_ttl,
+                ):
+                    self.live_manager.update_log(
+                        event="Maintenance ended",
+                        details=f"{subdomain} is operational again; resuming "
+                        f"{self.download_info.filename}.",
+                    )
+            else:
+                time.sleep(delay)
             return True
 
         return False
@@ -219,69 +416,23 @@ class MediaDownloader:
 
         # Mark the subdomain as offline and potentially retry based on status check
         if is_server_down:
-            subdomain = get_subdomain(self.download_info.download_link)
-
             # Check if status checking is enabled and not explicitly disabled
-            skip_status_check = getattr(
-                self.session_info.args, "skip_status_check", False
-            ) if self.session_info.args else False
-
-            if STATUS_CHECK_ON_FAILURE and not skip_status_check:
-                # Fetch real-time status from the status page
-                cache_ttl = getattr(
-                    self.session_info.args, "status_cache_ttl", 60
-                ) if self.session_info.args else 60
-
-                current_status, was_updated = refresh_server_status(
-                    subdomain,
-                    self.session_info.bunkr_status,
-                    cache_ttl_seconds=cache_ttl,
-                    network=self.session_info.network,
-                )
-
+            if STATUS_CHECK_ON_FAILURE and not self.skip_status_check:
+                subdomain, current_status, was_updated = self._current_status()
                 status_check_msg = "(refreshed)" if was_updated else "(cached)"
 
                 # Check if server is under maintenance
-                if "Maintenance" in current_status or "maintenance" in current_status.lower():
-                    # Log maintenance event to session log
-                    log_maintenance_event(
-                        subdomain, current_status, self.download_info.download_link
-                    )
-
-                    maintenance_details = (
-                        f"{subdomain} is under maintenance {status_check_msg}: "
-                        f"{current_status}. File {self.download_info.filename} "
-                        f"will be retried."
-                    )
-                    self.live_manager.update_maintenance(
-                        subdomain=subdomain,
-                        status=current_status,
-                        affected_files_count=1,
-                        event="Maintenance detected",
-                        details=maintenance_details,
-                    )
-
-                    # Get maintenance strategy
-                    maintenance_strategy = getattr(
-                        self.session_info.args, "maintenance_strategy", "backoff"
-                    ) if self.session_info.args else "backoff"
-
-                    if maintenance_strategy == "skip":
-                        # Log and skip this file
-                        self.live_manager.update_log(
-                            event="Maintenance skip",
-                            details=(
-                                f"Skipping {self.download_info.filename} due to "
-                                f"maintenance (strategy: skip)."
-                            ),
-                        )
-                        return False
-
-                    # Use backoff strategy with longer delays for maintenance
-                    return self._retry_with_backoff(
+                if is_maintenance_status(current_status):
+                    return self._handle_maintenance(
                         attempt,
-                        event="Waiting for maintenance",
-                        maintenance_delay=True
+                        subdomain,
+                        current_status,
+                        event="Maintenance detected",
+                        details=(
+                            f"{subdomain} is under maintenance {status_check_msg}: "
+                            f"{current_status}. File {self.download_info.filename} "
+                            f"will be retried."
+                        ),
                     )
 
                 # Status page says operational but we got 521 - transient issue
@@ -312,61 +463,97 @@ class MediaDownloader:
             HTTPStatus.TOO_MANY_REQUESTS,
             HTTPStatus.SERVICE_UNAVAILABLE,
         ):
-            return self._retry_with_backoff(attempt, event="Retrying download")
+            if (
+                req_err.response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+                and self._host_bucket is not None
+            ):
+                self._host_bucket.penalise()
+
+            return self._retry_with_backoff(
+                attempt,
+                event="Retrying download",
+                retry_after=parse_retry_after(req_err.response.headers.get("Retry-After")),
+            )
 
         if req_err.response.status_code == HTTPStatus.BAD_GATEWAY:
-            # Check status on 502 errors as well
-            skip_status_check = getattr(
-                self.session_info.args, "skip_status_check", False
-            ) if self.session_info.args else False
-
-            if STATUS_CHECK_ON_FAILURE and not skip_status_check:
-                subdomain = get_subdomain(self.download_info.download_link)
-                cache_ttl = getattr(
-                    self.session_info.args, "status_cache_ttl", 60
-                ) if self.session_info.args else 60
-
-                current_status, _ = refresh_server_status(
-                    subdomain,
-                    self.session_info.bunkr_status,
-                    cache_ttl_seconds=cache_ttl,
-                    network=self.session_info.network,
-                )
-
-                if "Maintenance" in current_status or "maintenance" in current_status.lower():
-                    # Log maintenance event to session log
-                    log_maintenance_event(
-                        subdomain, current_status, self.download_info.download_link
-                    )
-
-                    self.live_manager.update_maintenance(
-                        subdomain=subdomain,
-                        status=current_status,
-                        affected_files_count=1,
+            # Check status on 502 errors as well, unless no attempt follows:
+            # a maintenance verdict only matters if there is one to delay
+            is_last_attempt = attempt >= self.retries - 1
+            if STATUS_CHECK_ON_FAILURE and not self.skip_status_check and not is_last_attempt:
+                subdomain, current_status, _ = self._current_status()
+
+                if is_maintenance_status(current_status):
+                    return self._handle_maintenance(
+                        attempt,
+                        subdomain,
+                        current_status,
                         event="Maintenance detected (502)",
                         details=(
                             f"{subdomain} maintenance during bad gateway for "
                             f"{self.download_info.filename}."
                         ),
                     )
-                    return self._retry_with_backoff(
-                        attempt,
-                        event="Waiting for maintenance",
-                        maintenance_delay=True
-                    )
 
             self.live_manager.update_log(
                 event="Server error",
                 details=f"Bad gateway for {self.download_info.filename}.",
             )
-            # Setting retries to 1 forces an immediate failure on the next check.
-            self.retries = 1
+            # A plain bad gateway is terminal; the caller stops retrying.
             return False
 
         # Do not retry, exit the loop
         self.live_manager.update_log(event="Request error", details=str(req_err))
         return False
 
+    def _current_status(self) -> tuple[str, str, bool]:
+        """Return the subdomain, its live status and whether it was re-fetched."""
+        subdomain = get_subdomain(self.download_info.download_link)
+        current_status, was_updated = refresh_server_status(
+            subdomain,
+            self.session_info.bunkr_status,
+            cache_ttl_seconds=self.status_cache_ttl,
+            network=self.session_info.network,
+        )
+        return subdomain, current_status, was_updated
+
+    def _handle_maintenance(
+        self,
+        attempt: int,
+        subdomain: str,
+        current_status: str,
+        *,
+        event: str,
+        details: str,
+    ) -> bool:
+        """Record a maintenance window and wait it out or skip, per strategy."""
+        log_maintenance_event(
+            subdomain, current_status, self.download_info.download_link,
+        )
+        self.live_manager.update_maintenance(
+            subdomain=subdomain,
+            status=current_status,
+            affected_files_count=1,
+            event=event,
+            details=details,
+        )
+
+        if self.maintenance_strategy == "skip":
+            self.live_manager.update_log(
+                event="Maintenance skip",
+                details=(
+                    f"Skipping {self.download_info.filename} due to "
+                    f"maintenance (strategy: skip)."
+                ),
+            )
+            return False
+
+        # Use backoff strategy with longer delays for maintenance
+        return self._retry_with_backoff(
+            attempt,
+            event="Waiting for maintenance",
+            maintenance_delay=True,
+        )
+
     def _handle_failed_download(self, *, is_final_attempt: bool) -> dict | None:
         """Handle a failed download after all retry attempts."""
         if not is_final_attempt:
@@ -18,7 +18,7 @@ from .config import (
     DOWNLOAD_FOLDER,
     MAX_FILENAME_LEN,
     SESSION_LOG,
-    VALID_CHARACTERS_REGEX,
+    VALID_CHARACTERS_RE,
 )
 
 
@@ -99,17 +99,21 @@ def format_directory_name(directory_name: str, directory_id: str | None) -> str
     return f"{directory_name} ({directory_id})" if directory_id is not None else None
 
 
+# Characters that are invalid in directory names on the current platform.
+_INVALID_DIRECTORY_CHARS = re.compile(
+    {
+        "nt": r'[\\/:*?"<>|]',  # Windows
+        "posix": r"[/:]",       # macOS and Linux
+    }[os.name],
+)
+
+
 def sanitize_directory_name(directory_name: str) -> str:
     """Sanitize a given directory name by replacing invalid characters with underscores.
 
     Handles the invalid characters specific to Windows, macOS, and Linux.
     """
-    invalid_chars_dict = {
-        "nt": r'[\\/:*?"<>|]',  # Windows
-        "posix": r"[/:]",       # macOS and Linux
-    }
-    invalid_chars = invalid_chars_dict.get(os.name)
-    return re.sub(invalid_chars, "_", directory_name)
+    return _INVALID_DIRECTORY_CHARS.sub("_", directory_name)
 
 
 def create_download_directory(
@@ -151,11 +155,12 @@ def remove_invalid_characters(text: str) -> str:
     This function keeps only letters (both uppercase and lowercase), digits, spaces,
     hyphens ('-'), and underscores ('_').
     """
-    return re.sub(VALID_CHARACTERS_REGEX, "", text)
+    return VALID_CHARACTERS_RE.sub("", text)
 
 
-_LEADING_ALNUM_RUN = re.compile(r"^[A-Za-z0-9]+")
 _MAX_EXTENSION_LEN = 16  # typical real extensions top out well below this
+# Bounded repetition fuses the alnum match with the length cap in one pass.
+_LEADING_ALNUM_RUN = re.compile(rf"[A-Za-z0-9]{{1,{_MAX_EXTENSION_LEN}}}")
 
 
 def _sanitize_extension(extension: str) -> str:
@@ -174,8 +179,7 @@ def _sanitize_extension(extension: str) -> str:
     match = _LEADING_ALNUM_RUN.match(body)
     if not match:
         return ""
-    safe = match.group(0)[:_MAX_EXTENSION_LEN]
-    return f".{safe}"
+    return f".{match.group(0)}"
 
 
 def truncate_filename(filename: str) -> str:
@@ -192,12 +196,10 @@ def truncate_filename(filename: str) -> str:
 
     # Take only the terminal component so ``..`` / ``/`` / ``\\`` segments
     # are dropped before anything else touches the value.
-    terminal = Path(filename).name
-    stem = Path(terminal).stem
-    extension = Path(terminal).suffix
+    terminal = Path(Path(filename).name)
 
-    safe_stem = remove_invalid_characters(stem)
-    safe_ext = _sanitize_extension(extension)
+    safe_stem = remove_invalid_characters(terminal.stem)
+    safe_ext = _sanitize_extension(terminal.suffix)
 
     # When the sanitised extension alone meets or exceeds the limit, drop
     # it entirely — keeping a truncated middle of the extension would
@@ -205,8 +207,4 @@ def truncate_filename(filename: str) -> str:
     if len(safe_ext) >= MAX_FILENAME_LEN:
         safe_ext = ""
 
-    budget = MAX_FILENAME_LEN - len(safe_ext)
-    if len(safe_stem) > budget:
-        safe_stem = safe_stem[:budget]
-
-    return f"{safe_stem}{safe_ext}"
+    return f"{safe_stem[:MAX_FILENAME_LEN - len(safe_ext)]}{safe_ext}"
@@ -0,0 +1,132 @@
+"""Shared, connection-pooled HTTP session used for every outbound request.
+
+Opening a fresh ``requests`` session per call pays a full TCP + TLS handshake
+each time. Bunkr albums hit the same handful of hosts over and over, so a single
+pooled session keeps those connections alive and reuses them across page
+fetches, API calls and downloads for the lifetime of the process.
+
+The module also provides an opt-in DNS cache: every new connection otherwise
+triggers a fresh ``getaddrinfo`` for a CDN subdomain that was resolved moments
+earlier.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import DNS_CACHE_TTL_SECONDS, MAX_WORKERS
+
+# Process-wide session, built lazily on first use (or explicitly by the CLI
+# entry points once the worker count is known). ``requests.Session`` is safe
+# to share across the worker threads that drive downloads: urllib3's
+# connection pools are thread-safe.
+_HTTP_SESSION: requests.Session | None = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def create_http_session(max_workers: int = MAX_WORKERS) -> requests.Session:
+    """Create a session whose connection pools are sized for `max_workers`."""
+    # ``pool_connections`` is the number of distinct hosts kept warm, while
+    # ``pool_maxsize`` caps the idle connections retained per host. Page
+    # fetches, API calls and downloads share a host, so leave headroom above
+    # the worker count to avoid urllib3 discarding connections.
+    pool_size = max(max_workers, 1) * 4
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def configure_http_session(max_workers: int = MAX_WORKERS) -> requests.Session:
+    """Replace the shared session with one sized for `max_workers`."""
+    global _HTTP_SESSION  # pylint: disable=global-statement
+
+    session = create_http_session(max_workers)
+    with _HTTP_SESSION_LOCK:
+        previous, _HTTP_SESSION = _HTTP_SESSION, session
+
+    if previous is not None:
+        previous.close()
+
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _HTTP_SESSION  # pylint: disable=global-statement
+
+    session = _HTTP_SESSION
+    if session is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                _HTTP_SESSION = create_http_session()
+            session = _HTTP_SESSION
+
+    return session
+
+
+def close_http_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    global _HTTP_SESSION  # pylint: disable=global-statement
+
+    with _HTTP_SESSION_LOCK:
+        session, _HTTP_SESSION = _HTTP_SESSION, None
+
+    if session is not None:
+        session.close()
+
+
+# Resolver results keyed on the full ``getaddrinfo`` call signature.
+# Shape: {(host, port, args, kwargs): (expires_at, addrinfo_list)}.
+_DNS_CACHE: dict[tuple, tuple[float, list]] = {}
+_DNS_CACHE_LOCK = threading.Lock()
+_system_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, port, *args, **kwargs) -> list:
+    """Drop-in for :func:`socket.getaddrinfo` that reuses fresh results."""
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+
+    entry = _DNS_CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        return list(entry[1])
+
+    # Failures are never cached so a transient resolver error is retried, but
+    # an expired answer from earlier in the session beats failing the request.
+    try:
+        result = _system_getaddrinfo(host, port, *args, **kwargs)
+    except OSError:
+        if entry is None:
+            raise
+        return list(entry[1])
+
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[key] = (now + DNS_CACHE_TTL_SECONDS, result)
+
+    return list(result)
+
+
+def install_dns_cache() -> None:
+    """Route name resolution through the TTL cache (idempotent).
+
+    Installed by the entry points rather than at import time so importing the
+    package never changes process-wide socket behaviour on its own.
+    """
+    if DNS_CACHE_TTL_SECONDS <= 0 or socket.getaddrinfo is _cached_getaddrinfo:
+        return
+
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+def clear_dns_cache() -> None:
+    """Forget every cached resolution."""
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE.clear()
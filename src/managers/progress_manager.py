@@ -7,23 +7,34 @@ monitoring task completion.
 from __future__ import annotations
 
 import shutil
+from collections import deque
+from contextvars import ContextVar
 
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
     Progress,
     SpinnerColumn,
+    Task,
     TextColumn,
     TimeRemainingColumn,
 )
 from rich.table import Column, Table
 
 from src.config import (
+    BUFFER_SIZE,
     PROGRESS_COLUMNS_SEPARATOR,
     PROGRESS_MANAGER_COLORS,
     ProgressConfig,
 )
 
+# Overall task (id, number of items) owning the tasks added from the current
+# asyncio context. Albums downloaded concurrently each run in their own task,
+# so their file bars advance the right overall bar instead of the latest one.
+_current_overall: ContextVar[tuple[int, int] | None] = ContextVar(
+    "current_overall", default=None,
+)
+
 
 class ProgressManager:
     """Manage and tracks the progress of multiple tasks.
@@ -42,6 +53,9 @@ class ProgressManager:
         self.overall_progress = self._create_progress_bar()
         self.task_progress = self._create_progress_bar(show_time=True)
         self.num_tasks = 0
+        # Completed overall tasks still on screen, oldest first. Allocated on
+        # the first completion; runs that never finish an album skip it.
+        self.overall_buffer: deque[Task] | None = None
 
     def get_panel_width(self) -> int:
         """Return the width of the panel."""
@@ -51,19 +65,28 @@ class ProgressManager:
         """Add an overall progress task with a given description and total tasks."""
         self.num_tasks = num_tasks
         overall_description = self._adjust_description(description)
-        self.overall_progress.add_task(
+        overall_id = self.overall_progress.add_task(
             f"[{self.config.color}]{overall_description}",
             total=num_tasks,
             completed=0,
         )
+        _current_overall.set((overall_id, num_tasks))
 
     def add_task(self, current_task: int = 0, total: int = 100) -> int:
         """Add an individual task to the task progress bar."""
+        overall = _current_overall.get()
+        num_tasks = overall[1] if overall else self.num_tasks
         task_description = (
             f"[{self.config.color}]{self.config.item_description} "
-            f"{current_task + 1}/{self.num_tasks}"
+            f"{current_task + 1}/{num_tasks}"
+        )
+        # The owning overall id rides on the Rich task itself, so it is freed
+        # with the task rather than kept in a mapping that only ever grows
+        return self.task_progress.add_task(
+            task_description,
+            total=total,
+            overall_id=overall[0] if overall else None,
         )
-        return self.task_progress.add_task(task_description, total=total)
 
     def update_task(
         self,
@@ -109,25 +132,31 @@ class ProgressManager:
     # Private methods
     def _update_overall_task(self, task_id: int) -> None:
         """Advance the overall progress bar and removes old tasks."""
-        # Access the latest task dynamically
-        current_overall_task = self.overall_progress.tasks[-1]
+        # Resolve the overall task this item belongs to, falling back to the
+        # latest one for tasks added outside an overall context
+        task = self.task_progress.tasks[task_id]
+        overall_id = task.fields.get("overall_id")
+        current_overall_task = next(
+            (overall for overall in self.overall_progress.tasks if overall.id == overall_id),
+            self.overall_progress.tasks[-1],
+        )
 
         # If the task is finished, remove it and update the overall progress
-        if self.task_progress.tasks[task_id].finished:
+        if task.finished:
             self.overall_progress.advance(current_overall_task.id)
             self.task_progress.update(task_id, visible=False)
 
-        # Track completed overall tasks
+        # Track and cleanup completed overall tasks
         if current_overall_task.finished:
-            self.config.overall_buffer.append(current_overall_task)
-
-        # Cleanup completed overall tasks
-        self._cleanup_completed_overall_tasks()
+            if self.overall_buffer is None:
+                self.overall_buffer = deque(maxlen=BUFFER_SIZE)
+            self.overall_buffer.append(current_overall_task)
+            self._cleanup_completed_overall_tasks()
 
     def _cleanup_completed_overall_tasks(self) -> None:
         """Remove the oldest completed overall task from the buffer and progress bar."""
-        if len(self.config.overall_buffer) == self.config.overall_buffer.maxlen:
-            completed_overall_id = self.config.overall_buffer.popleft().id
+        if self.overall_buffer and len(self.overall_buffer) == self.overall_buffer.maxlen:
+            completed_overall_id = self.overall_buffer.popleft().id
             self.overall_progress.remove_task(completed_overall_id)
 
     # Static methods
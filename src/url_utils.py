@@ -8,22 +8,23 @@ from __future__ import annotations
 
 import html
 import logging
-import re
 import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from urllib.parse import unquote, urlparse, urlunparse
 
 from .config import (
     FALLBACK_DOMAIN,
-    MEDIA_SLUG_REGEX,
+    MEDIA_SLUG_RE,
     URL_TYPE_MAPPING,
-    VALID_SLUG_REGEX,
+    VALID_SLUG_RE,
 )
 
 if TYPE_CHECKING:
     from bs4 import BeautifulSoup
 
 
+@lru_cache(maxsize=1024)
 def get_host_page(url: str) -> str:
     """Extract the base host URL from a given URL."""
     url_netloc = urlparse(url).netloc
@@ -82,6 +83,7 @@ def get_identifier(url: str, soup: BeautifulSoup | None = None) -> str:
     return url
 
 
+@lru_cache(maxsize=1024)
 def get_album_id(url: str) -> str:
     """Extract the album or video ID from the provided URL."""
     try:
@@ -98,17 +100,17 @@ def get_media_slug(url: str, soup: BeautifulSoup) -> str:
 
     Tries to obtain the media slug (e.g., 'filename.mp4') directly from the last
     segment of the URL. If this segment is empty or unreliable, it searches the HTML
-    <script> tags for a match using MEDIA_SLUG_REGEX.
+    <script> tags for a match using MEDIA_SLUG_RE.
     """
     # Try extracting the slug directly from the URL
     media_slug = url.rstrip("/").split("/")[-1]
-    if re.fullmatch(VALID_SLUG_REGEX, media_slug):
+    if VALID_SLUG_RE.fullmatch(media_slug):
         return media_slug
 
     # Fallback: try to find slug in script tags
     for item in soup.find_all("script"):
         script_text = item.get_text()
-        match = re.search(MEDIA_SLUG_REGEX, script_text)
+        match = MEDIA_SLUG_RE.search(script_text)
         if match:
             return match.group(1)
 
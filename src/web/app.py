@@ -6,28 +6,31 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import json
 import logging
 import os
 import secrets
 import threading
-from argparse import Namespace
+import time
 from collections import deque
 from contextlib import asynccontextmanager, nullcontext
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, AsyncIterator, Callable, Literal
+from typing import Annotated, Any, AsyncIterator, Callable, Literal
 from uuid import uuid4
 
 from fastapi import Depends, FastAPI, Header, HTTPException, WebSocket, WebSocketDisconnect, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field, AnyHttpUrl
+from pydantic import AfterValidator, BaseModel, Field, AnyHttpUrl
 
 from downloader import validate_and_download
 from src import __version__ as __app_version__
-from src.bunkr_utils import get_bunkr_status_cached
+from src.bunkr_utils import get_bunkr_status_cached, peek_bunkr_status
 from src.config import (
     ALLOWED_DOWNLOAD_ROOT,
     ALLOWED_ORIGIN_REGEX,
@@ -35,13 +38,21 @@ from src.config import (
     API_ACCESS_TOKEN,
     DOWNLOAD_FOLDER,
     JOB_EVENT_RETENTION,
+    JOB_MAX_RETAINED,
     JOB_REAPER_INTERVAL_SECONDS,
     JOB_TTL_HOURS,
+    MAX_CONCURRENT_URLS,
     MAX_WORKERS,
     build_network_context,
     get_network_settings,
 )
 from src.file_utils import PathOutsideSandboxError, resolve_within_allowed_root
+from src.http_utils import install_dns_cache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships in requirements.txt
+    orjson = None
 
 _env_version = os.getenv("APP_VERSION", "")
 if _env_version and _env_version.lower() != "latest":
@@ -52,15 +63,36 @@ else:
 logger = logging.getLogger(__name__)
 
 
-def _format_duration(delta: timedelta) -> str:
-    """Format a timedelta into the hh:mm:ss string used across the project."""
-    total_seconds = int(delta.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+def _format_duration(elapsed: float) -> str:
+    """Format elapsed seconds into the hh:mm:ss string used across the project."""
+    minutes, seconds = divmod(int(elapsed), 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02} hrs {minutes:02} mins {seconds:02} secs"
 
 
+# (whole second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp formatted. Swapped
+# as one tuple so concurrent readers never see a torn pair.
+_ts_second_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO-8601 string with microseconds.
+
+    Equivalent to ``datetime.now(timezone.utc).isoformat()`` but only formats
+    the date and time once per second; in between, just the fraction changes.
+    """
+    global _ts_second_cache  # pylint: disable=global-statement
+
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _ts_second_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _ts_second_cache = (second, prefix)
+
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}+00:00"
+
+
 class NetworkOverrides(BaseModel):
     """Optional overrides for Bunkr networking endpoints."""
 
@@ -87,10 +119,15 @@ class NetworkOverrides(BaseModel):
     )
 
 
+# Validated as an HTTP(S) URL, then kept as the normalised ``str`` every
+# consumer wants, so job code never re-stringifies a ``Url`` object.
+HttpUrlStr = Annotated[AnyHttpUrl, AfterValidator(str)]
+
+
 class DownloadRequest(BaseModel):
     """Payload used to kick off a download job via the HTTP API."""
 
-    urls: list[AnyHttpUrl] = Field(..., min_length=1, description="List of Bunkr URLs.")
+    urls: list[HttpUrlStr] = Field(..., min_length=1, description="List of Bunkr URLs.")
     include: list[str] = Field(default_factory=list)
     ignore: list[str] = Field(default_factory=list)
     custom_path: str | None = Field(default=None, description="Optional absolute base directory.")
@@ -137,7 +174,55 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class JobEventBroker:
+_JSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def _dumps(payload: Any) -> str:
+    """Encode `payload` as compact JSON text, via orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.dumps(payload).decode()  # pylint: disable=no-member
+    # Same encoding as Starlette's ``send_json``.
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+class _Envelope(dict):
+    """Broadcast envelope that serialises itself to a WebSocket frame once.
+
+    Every subscriber of a job is handed the same envelope object, so caching
+    the JSON text on it turns an N-tab fan-out into one encode plus N
+    sends. Envelopes must not be mutated once broadcast.
+    """
+
+    __slots__ = ("_frame",)
+
+    def frame(self) -> str:
+        """Return the JSON text frame for this envelope, encoding it on first use."""
+
+        try:
+            return self._frame
+        except AttributeError:
+            self._frame = _dumps(self)  # pylint: disable=attribute-defined-outside-init
+            return self._frame
+
+
+def _batch_frame(batch: list[_Envelope]) -> str:
+    """Join already-encoded envelopes into a single JSON array frame."""
+
+    return "[" + ",".join(event.frame() for event in batch) + "]"
+
+
+# Seconds a batching WebSocket waits after the first pending envelope so the
+# rest of a progress burst shares its frame.
+WS_BATCH_WINDOW = 0.01
+
+# Live envelopes buffered per WebSocket subscriber. A client that falls this
+# far behind loses the oldest ones and is told to backfill over HTTP instead
+# of pinning an ever-growing queue.
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class JobEventBroker:  # pylint: disable=too-many-instance-attributes
     """Fan-out publisher that buffers job events for any active subscribers.
 
     Each published envelope is stamped with a monotonically increasing
@@ -155,23 +240,33 @@ class JobEventBroker:
         # pruning is silent from the broker's perspective — callers that ask
         # for an event_id below the retained floor get a 410 from the HTTP
         # layer so they know to reset rather than silently miss history.
-        self._events: deque[dict[str, Any]] = deque(
+        self._events: deque[_Envelope] = deque(
             maxlen=retention if retention is not None else JOB_EVENT_RETENTION,
         )
-        self._subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
+        self._subscribers: set[asyncio.Queue[_Envelope]] = set()
+        # Envelopes discarded per subscriber since it last caught up.
+        self._dropped: dict[asyncio.Queue[_Envelope], int] = {}
         self._id_lock = threading.Lock()
         self._event_seq = 0
+        self._loop_thread: int | None = None
+        # Callbacks handed over by worker threads, run in order by one loop
+        # callback; a non-empty list means that drain is already scheduled.
+        self._deferred: list[tuple[Callable[..., None], tuple[Any, ...]]] = []
+        self._deferred_lock = threading.Lock()
 
     def bind(self, loop: asyncio.AbstractEventLoop) -> None:
         """Attach the broker to the event loop that owns its subscribers.
 
         Safe to call repeatedly with the same loop. Idempotent to preserve
         the ``Job.__post_init__`` → ``_run_download_job`` two-phase bind.
+        Must be called from the thread running `loop`; its ident is recorded
+        so :meth:`dispatch` can tell loop-thread callers apart cheaply.
         """
 
         if self._loop is not None and self._loop is not loop:
             raise RuntimeError("JobEventBroker is already bound to a different loop")
         self._loop = loop
+        self._loop_thread = threading.get_ident()
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
@@ -187,13 +282,21 @@ class JobEventBroker:
     def _broadcast(self, event: dict[str, Any]) -> None:
         """Stamp the envelope, retain it for replays, and fan out live."""
 
+        envelope = _Envelope(event)
         with self._id_lock:
             self._event_seq += 1
-            event["event_id"] = self._event_seq
-        event.setdefault("ts", datetime.now(timezone.utc).isoformat())
-        self._events.append(event)
-        for queue in list(self._subscribers):
-            queue.put_nowait(event)
+            envelope["event_id"] = self._event_seq
+        envelope.setdefault("ts", _utc_timestamp())
+        self._events.append(envelope)
+        # Iterate the live set: it is only mutated on the loop thread by
+        # subscribe(), and put_nowait/get_nowait wake waiters via call_soon,
+        # so nothing can add or remove a subscriber mid-loop.
+        for queue in self._subscribers:
+            if queue.full():
+                # Drop-oldest: the ring buffer still holds it for a backfill
+                queue.get_nowait()
+                self._dropped[queue] = self._dropped.get(queue, 0) + 1
+            queue.put_nowait(envelope)
 
     @property
     def next_event_id(self) -> int:
@@ -229,23 +332,54 @@ class JobEventBroker:
             return None
         return self._events[0].get("event_id")
 
-    def publish(self, event: dict[str, Any]) -> None:
-        """Publish an event, marshaling to the bound loop when called off-thread."""
+    def has_pruned(self, since: int) -> bool:
+        """Return True if envelopes after `since` were dropped from the ring."""
+
+        oldest = self.oldest_event_id
+        return since > 0 and oldest is not None and since + 1 < oldest
+
+    def dispatch(self, callback: Callable[..., None], *args: Any) -> None:
+        """Run `callback` on the bound loop: inline on its thread, else deferred.
+
+        Compares thread idents rather than probing ``get_running_loop()``,
+        which raises on every call from a download worker thread. Calls from
+        other threads are queued and drained in batches, so a burst of
+        progress updates wakes the loop once.
+        """
 
         # Access the bound loop through the property so unbound brokers raise
-        # an explicit RuntimeError instead of silently matching the ``None``
-        # from a sync context and discarding events into _broadcast without a
+        # an explicit RuntimeError instead of running the callback without a
         # subscriber fan-out loop.
         bound_loop = self.loop
-        try:
-            running_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            running_loop = None
+        if threading.get_ident() == self._loop_thread:
+            callback(*args)
+            return
 
-        if running_loop is bound_loop:
-            self._broadcast(event)
-        else:
-            bound_loop.call_soon_threadsafe(self._broadcast, event)
+        # Only the first callback of a burst wakes the loop; the rest ride
+        # along in the same drain instead of each paying a self-pipe write.
+        with self._deferred_lock:
+            self._deferred.append((callback, args))
+            if len(self._deferred) > 1:
+                return
+        bound_loop.call_soon_threadsafe(self._run_deferred)
+
+    def _run_deferred(self) -> None:
+        """Run every callback deferred from other threads, oldest first."""
+
+        with self._deferred_lock:
+            batch, self._deferred = self._deferred, []
+        for callback, args in batch:
+            try:
+                callback(*args)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Mirror the loop's own handling of a failing callback: log
+                # it and keep running the rest of the batch.
+                logger.exception("Deferred broker callback failed")
+
+    def publish(self, event: dict[str, Any]) -> None:
+        """Publish an event, marshaling to the bound loop when called off-thread."""
+
+        self.dispatch(self._broadcast, event)
 
     def get_events(self, since: int = 0) -> list[dict[str, Any]]:
         """Return envelopes with ``event_id > since``.
@@ -256,27 +390,85 @@ class JobEventBroker:
 
         if since <= 0:
             return list(self._events)
-        return [event for event in self._events if event.get("event_id", 0) > since]
 
-    async def subscribe(self) -> AsyncIterator[dict[str, Any]]:
-        """Yield past and live events to a subscriber.
+        # Ids are appended in increasing order, so walk back from the newest
+        # envelope and stop at the cursor: O(k) in the events returned.
+        tail = []
+        for event in reversed(self._events):
+            if event.get("event_id", 0) <= since:
+                break
+            tail.append(event)
+        tail.reverse()
+        return tail
+
+    async def subscribe(self, since: int = 0) -> AsyncIterator[_Envelope]:
+        """Yield past (``event_id > since``) and live events to a subscriber.
+
+        A reconnecting client passes its cursor as `since` so only the
+        envelopes it has not seen are replayed instead of the whole history.
+        See :meth:`subscribe_batches` for the ordering and overflow rules.
+        """
+
+        async for batch in self.subscribe_batches(since):
+            for event in batch:
+                yield event
+
+    async def subscribe_batches(
+        self, since: int = 0, window: float = 0.0,
+    ) -> AsyncIterator[list[_Envelope]]:
+        """Yield past and live events in batches of whatever is pending.
 
         Snapshot-then-register is atomic on the broker loop because
         :meth:`_broadcast` never awaits — no event can land between taking the
         snapshot and adding the queue to ``_subscribers``, so no event is
         dropped, and none is delivered twice.
+
+        Each live batch is the envelope that woke the subscriber plus every
+        other one already queued, so a burst of progress updates goes out as
+        one WebSocket frame instead of one frame each. A positive `window`
+        waits that many seconds after the first envelope so the rest of a
+        burst joins the same batch.
+
+        A subscriber that falls :data:`SUBSCRIBER_QUEUE_SIZE` envelopes behind
+        loses the oldest ones; the next batch starts with a ``dropped`` frame
+        (no ``event_id``) whose ``next_id`` lets the client backfill the gap
+        over ``/events``.
         """
 
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        snapshot = list(self._events)
+        queue: asyncio.Queue[_Envelope] = asyncio.Queue(
+            maxsize=SUBSCRIBER_QUEUE_SIZE,
+        )
+        snapshot = self.get_events(since)
         self._subscribers.add(queue)
         try:
-            for event in snapshot:
-                yield event
+            for offset in range(0, len(snapshot), SUBSCRIBER_QUEUE_SIZE):
+                yield snapshot[offset:offset + SUBSCRIBER_QUEUE_SIZE]
             while True:
-                yield await queue.get()
+                batch = [await queue.get()]
+                if window > 0:
+                    await asyncio.sleep(window)
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                dropped = self._dropped.pop(queue, 0)
+                if dropped:
+                    batch.insert(0, _Envelope(
+                        type="dropped", count=dropped, next_id=self._event_seq,
+                    ))
+                yield batch
         finally:
             self._subscribers.discard(queue)
+            self._dropped.pop(queue, None)
+
+# A task_updated envelope that only moves a task's percentage is published
+# once the task advanced this many points or this many seconds have passed.
+# State changes (visibility, completion) are always published immediately.
+TASK_UPDATE_MIN_DELTA = 1.0
+TASK_UPDATE_MIN_INTERVAL = 0.25
+
+
+# The web flow has no terminal display; ``nullcontext`` is reusable and
+# reentrant, so every manager shares one for the CLI's ``with manager.live``.
+_NO_LIVE_DISPLAY = nullcontext()
 
 
 class WebLiveManager:  # pylint: disable=too-many-instance-attributes
@@ -293,12 +485,18 @@ class WebLiveManager:  # pylint: disable=too-many-instance-attributes
         """
 
         self._broker = broker
-        self.live = nullcontext()
+        self.live = _NO_LIVE_DISPLAY
         self._task_id_lock = threading.Lock()
         self._next_task_id = 0
         self._overall = {"description": None, "total": 0, "completed": 0}
+        self._overall_emitted_at = 0.0
+        self._overall_timer: asyncio.TimerHandle | None = None
         self._tasks: dict[int, dict[str, Any]] = {}
-        self._started_at = datetime.now(timezone.utc)
+        # task_id -> (completed, monotonic time) of the last published update
+        self._last_emit: dict[int, tuple[float, float]] = {}
+        # task_id -> pending trailing publish of coalesced progress
+        self._flush_timers: dict[int, asyncio.TimerHandle] = {}
+        self._started_at = time.monotonic()
         self._log_level = log_level.lower()
         # Mirror the CLI boot message so behaviour stays consistent.
         self.update_log(event="Script started", details="The script has started execution.")
@@ -308,20 +506,27 @@ class WebLiveManager:  # pylint: disable=too-many-instance-attributes
         )
 
     def add_overall_task(self, description: str, num_tasks: int) -> None:
-        """Publish an overall task describing the total work units expected."""
+        """Publish an overall task describing the total work units expected.
+
+        A job downloads several URLs concurrently, so an album that starts
+        while another is unfinished extends the running totals instead of
+        resetting them.
+        """
 
         def _impl() -> None:
-            self._overall.update({
-                "description": description,
-                "total": num_tasks,
-                "completed": 0,
-            })
-            self._broker.publish({
-                "type": "overall",
-                "description": description,
-                "total": num_tasks,
-                "completed": 0,
-            })
+            overall = self._overall
+            if overall["completed"] < overall["total"]:
+                overall.update({
+                    "description": description,
+                    "total": overall["total"] + num_tasks,
+                })
+            else:
+                overall.update({
+                    "description": description,
+                    "total": num_tasks,
+                    "completed": 0,
+                })
+            self._publish_overall(force=True)
 
         self._run_in_loop(_impl)
 
@@ -368,9 +573,14 @@ class WebLiveManager:  # pylint: disable=too-many-instance-attributes
         """Update an existing task's completion percentage and visibility.
 
         The update is silently no-ops when nothing changed, preventing
-        ``task_updated`` from spamming the wire with identical state. If the
-        corresponding :meth:`add_task` closure hasn't landed on the broker
-        loop yet, the update is rescheduled once via ``call_soon``.
+        ``task_updated`` from spamming the wire with identical state. Pure
+        progress ticks are coalesced too: they publish only after
+        :data:`TASK_UPDATE_MIN_DELTA` points or
+        :data:`TASK_UPDATE_MIN_INTERVAL` seconds, and a held-back tick is
+        flushed once the interval ends if nothing newer was sent. If the
+        corresponding
+        :meth:`add_task` closure hasn't landed on the broker loop yet, the
+        update is rescheduled once via ``call_soon``.
         """
 
         retry_flag = {"retried": False}
@@ -400,23 +610,55 @@ class WebLiveManager:  # pylint: disable=too-many-instance-attributes
                         self._overall["total"],
                         self._overall["completed"] + 1,
                     )
-                    self._broker.publish({
-                        "type": "overall",
-                        "description": self._overall["description"],
-                        "total": self._overall["total"],
-                        "completed": self._overall["completed"],
-                    })
+                    self._publish_overall()
 
             after = (task["completed"], task["visible"], task["finished"])
             if before == after:
                 return
 
-            self._broker.publish(
-                {"type": "task_updated", "task": self._task_payload(task)},
-            )
+            now = time.monotonic()
+            if before[1:] == after[1:] and task_id in self._last_emit:
+                last_completed, last_time = self._last_emit[task_id]
+                wait = TASK_UPDATE_MIN_INTERVAL - (now - last_time)
+                if (
+                    abs(task["completed"] - last_completed) < TASK_UPDATE_MIN_DELTA
+                    and wait > 0
+                ):
+                    # Publish the held-back progress once the interval is up
+                    # in case no further tick arrives to carry it.
+                    if task_id not in self._flush_timers:
+                        self._flush_timers[task_id] = self._broker.loop.call_later(
+                            wait, self._flush_task, task_id,
+                        )
+                    return
+
+            self._emit_task(task_id, task, now)
 
         self._run_in_loop(_impl)
 
+    def _emit_task(self, task_id: int, task: dict[str, Any], now: float) -> None:
+        """Publish ``task_updated`` for `task` and record it as last emitted."""
+
+        timer = self._flush_timers.pop(task_id, None)
+        if timer is not None:
+            timer.cancel()
+        if task["finished"]:
+            self._last_emit.pop(task_id, None)
+        else:
+            self._last_emit[task_id] = (task["completed"], now)
+        self._broker.publish(
+            {"type": "task_updated", "task": self._task_payload(task)},
+        )
+
+    def _flush_task(self, task_id: int) -> None:
+        """Publish progress that coalescing held back, if still unsent."""
+
+        self._flush_timers.pop(task_id, None)
+        task = self._tasks.get(task_id)
+        last = self._last_emit.get(task_id)
+        if task is not None and last is not None and task["completed"] != last[0]:
+            self._emit_task(task_id, task, time.monotonic())
+
     def update_log(self, *, event: str, details: str) -> None:
         """Append a log entry to the job timeline and broadcast it."""
 
@@ -464,7 +706,9 @@ class WebLiveManager:  # pylint: disable=too-many-instance-attributes
         """Emit the closing log, including elapsed time, for the job."""
 
         def _impl() -> None:
-            duration = datetime.now(timezone.utc) - self._started_at
+            if self._overall_timer is not None:
+                self._flush_overall()
+            duration = time.monotonic() - self._started_at
             self._broker.publish({
                 "type": "log",
                 "event": "Script ended",
@@ -476,6 +720,36 @@ class WebLiveManager:  # pylint: disable=too-many-instance-attributes
 
         self._run_in_loop(_impl)
 
+    def _publish_overall(self, *, force: bool = False) -> None:
+        """Publish the overall progress, at most once per throttle interval.
+
+        Only the latest overall count matters to clients, so intermediate
+        counts within :data:`TASK_UPDATE_MIN_INTERVAL` are folded into one
+        trailing publish. New totals (`force`) and completion go out at once.
+        """
+
+        overall = self._overall
+        now = time.monotonic()
+        wait = TASK_UPDATE_MIN_INTERVAL - (now - self._overall_emitted_at)
+        if not force and overall["completed"] < overall["total"] and wait > 0:
+            if self._overall_timer is None:
+                self._overall_timer = self._broker.loop.call_later(
+                    wait, self._flush_overall,
+                )
+            return
+
+        if self._overall_timer is not None:
+            self._overall_timer.cancel()
+            self._overall_timer = None
+        self._overall_emitted_at = now
+        self._broker.publish({"type": "overall", **overall})
+
+    def _flush_overall(self) -> None:
+        """Publish the overall count that throttling held back."""
+
+        self._overall_timer = None
+        self._publish_overall(force=True)
+
     def _task_payload(self, task: dict[str, Any]) -> dict[str, Any]:
         """Normalise the internal task dictionary for outgoing events."""
 
@@ -489,16 +763,7 @@ class WebLiveManager:  # pylint: disable=too-many-instance-attributes
     def _run_in_loop(self, callback: Callable[..., None], *args: Any) -> None:
         """Execute a callback in the broker loop, deferring if on another thread."""
 
-        loop = self._broker.loop
-        try:
-            running_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            running_loop = None
-
-        if running_loop is loop:
-            callback(*args)
-        else:
-            loop.call_soon_threadsafe(callback, *args)
+        self._broker.dispatch(callback, *args)
 
 
 @dataclass(slots=True)
@@ -513,6 +778,12 @@ class Job:  # pylint: disable=too-many-instance-attributes
     manager: WebLiveManager | None = None
     task: asyncio.Task[None] | None = None
     error: str | None = None
+    # (status, error, info, JSON-ready dict) of the last JobInfo built;
+    # rebuilt when either field changes. URLs and created_at are fixed for
+    # the job's lifetime.
+    _info: tuple[JobStatus, str | None, JobInfo, dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def __post_init__(self) -> None:
         # Binding the broker before the manager is constructed is load-bearing:
@@ -534,10 +805,33 @@ class Job:  # pylint: disable=too-many-instance-attributes
             "job_id": self.job_id,
             "status": self.status.value,
             "created_at": self.created_at,
-            "urls": [str(url) for url in self.request.urls],
+            "urls": list(self.request.urls),
             "error": self.error,
         }
 
+    def _cached_info(self) -> tuple[JobStatus, str | None, JobInfo, dict[str, Any]]:
+        """Return the info cache entry, rebuilding it after a state change."""
+
+        cached = self._info
+        if cached is None or cached[0] is not self.status or cached[1] != self.error:
+            info = JobInfo(**self.as_dict())
+            cached = (self.status, self.error, info, info.model_dump(mode="json"))
+            self._info = cached
+        return cached
+
+    def info(self) -> JobInfo:
+        """Return the API model for this job, reusing it until its state changes."""
+
+        return self._cached_info()[2]
+
+    def info_json(self) -> dict[str, Any]:
+        """Return :meth:`info` already dumped to JSON types, cached alongside it.
+
+        Must not be mutated: every response for this state shares the dict.
+        """
+
+        return self._cached_info()[3]
+
 
 _TERMINAL_STATUSES = frozenset({
     JobStatus.COMPLETED,
@@ -549,15 +843,31 @@ _TERMINAL_STATUSES = frozenset({
 class JobStore:
     """In-memory registry for active and completed jobs."""
 
-    def __init__(self) -> None:
+    def __init__(self, max_jobs: int = JOB_MAX_RETAINED) -> None:
+        # Only touched from the event loop thread, and no method awaits while
+        # mutating it, so plain dict operations need no lock. Insertion order
+        # is creation order, so iteration visits the oldest jobs first.
         self._jobs: dict[str, Job] = {}
-        self._lock = asyncio.Lock()
+        self._max_jobs = max_jobs
 
-    async def add(self, job: Job) -> None:
-        """Store a job entry, ensuring writes happen sequentially."""
+    def add(self, job: Job) -> None:
+        """Store a job entry, evicting the oldest terminal jobs over the cap.
+
+        Active jobs are never evicted, so the store can exceed ``max_jobs``
+        while that many jobs are pending or running.
+        """
 
-        async with self._lock:
-            self._jobs[job.job_id] = job
+        self._jobs[job.job_id] = job
+        excess = len(self._jobs) - self._max_jobs
+        if self._max_jobs <= 0 or excess <= 0:
+            return
+
+        evicted = [
+            job_id for job_id, stored in self._jobs.items()
+            if stored.status in _TERMINAL_STATUSES
+        ][:excess]
+        for job_id in evicted:
+            del self._jobs[job_id]
 
     def get(self, job_id: str) -> Job | None:
         """Fetch a job by identifier, returning None when missing."""
@@ -572,19 +882,18 @@ class JobStore:
     async def reap(self, ttl_hours: int, now: datetime | None = None) -> list[str]:
         """Evict terminal jobs older than ``ttl_hours``. Returns removed ids.
 
-        The lock is held for the scan-and-delete phase so in-flight writers
-        never race with eviction. Active jobs (pending/running) are never
-        reaped regardless of age.
+        The scan-and-delete phase never awaits, so in-flight writers on the
+        loop cannot race with eviction. Active jobs (pending/running) are
+        never reaped regardless of age.
         """
 
         current = now or datetime.now(timezone.utc)
         cutoff = current - timedelta(hours=ttl_hours)
         removed: list[str] = []
-        async with self._lock:
-            for job_id, job in list(self._jobs.items()):
-                if job.status in _TERMINAL_STATUSES and job.created_at < cutoff:
-                    del self._jobs[job_id]
-                    removed.append(job_id)
+        for job_id, job in list(self._jobs.items()):
+            if job.status in _TERMINAL_STATUSES and job.created_at < cutoff:
+                del self._jobs[job_id]
+                removed.append(job_id)
         return removed
 
 
@@ -628,35 +937,115 @@ def _status_event(status: JobStatus, message: str | None = None) -> dict[str, An
     payload = {
         "type": "status",
         "status": status.value,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utc_timestamp(),
     }
     if message:
         payload["message"] = message
     return payload
 
 
-def _build_namespace(url: str, request: DownloadRequest) -> Namespace:
-    """Build a CLI-like namespace from an incoming HTTP download request."""
+@dataclass(frozen=True, slots=True)
+class DownloadArgs:  # pylint: disable=too-many-instance-attributes
+    """CLI-equivalent arguments for one URL of a web download job.
+
+    Stands in for the ``argparse.Namespace`` the CLI builds; consumers read it
+    through ``getattr`` with defaults, so fields the web flow never sets (such
+    as ``skip_status_check``) simply fall back.
+    """
+
+    url: str
+    include: list[str] | None
+    ignore: list[str] | None
+    custom_path: str | None
+    disable_ui: bool
+    disable_disk_check: bool
+    log_level: str
+    max_workers: int
+    status_page: AnyHttpUrl | None
+    bunkr_api: AnyHttpUrl | None
+    download_referer: AnyHttpUrl | None
+    user_agent: str | None
+    fallback_domain: str | None
+
+
+def _build_download_args(request: DownloadRequest) -> DownloadArgs:
+    """Build the job-wide arguments for the request's first URL.
+
+    Only ``url`` differs between the URLs of a job, so callers derive the rest
+    with :func:`dataclasses.replace` instead of rebuilding every field.
+    """
 
-    include = request.include or None
-    ignore = request.ignore or None
-    return Namespace(
-        url=url,
-        include=include,
-        ignore=ignore,
+    network = request.network
+    return DownloadArgs(
+        url=request.urls[0],
+        include=request.include or None,
+        ignore=request.ignore or None,
         custom_path=request.custom_path,
         disable_ui=True,
         disable_disk_check=request.disable_disk_check,
         log_level=request.log_level,
         max_workers=request.max_workers,
-        status_page=request.network.status_page if request.network else None,
-        bunkr_api=request.network.api_endpoint if request.network else None,
-        download_referer=request.network.download_referer if request.network else None,
-        user_agent=request.network.user_agent if request.network else None,
-        fallback_domain=request.network.fallback_domain if request.network else None,
+        status_page=network.status_page if network else None,
+        bunkr_api=network.api_endpoint if network else None,
+        download_referer=network.download_referer if network else None,
+        user_agent=network.user_agent if network else None,
+        fallback_domain=network.fallback_domain if network else None,
     )
 
 
+async def _download_urls(
+    job: Job, job_args: DownloadArgs, bunkr_status: dict[str, str],
+) -> None:
+    """Download every URL of `job`, up to :data:`MAX_CONCURRENT_URLS` at a time.
+
+    Each URL's album runs up to ``max_workers`` downloads itself, so URLs are
+    not also fanned out ``max_workers`` wide.
+
+    As in the CLI, a failing URL is logged and the others run to completion;
+    once every URL has finished, the first failure is re-raised so the job
+    still ends as failed. Only cancelling the job cancels URLs in flight.
+    """
+
+    manager = job.manager
+    urls = job.request.urls
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_URLS)
+
+    async def _download_one(index: int, url: str) -> None:
+        async with semaphore:
+            if len(urls) > 1:
+                manager.update_log(
+                    event="Processing URL", details=f"{index}/{len(urls)}: {url}",
+                )
+            manager.log_debug(event="Debug", details=f"Starting download for {url}")
+            args = job_args if index == 1 else replace(job_args, url=url)
+            try:
+                await validate_and_download(bunkr_status, url, manager, args=args)
+            except Exception as err:
+                # A single-URL job reports its failure once, from the caller.
+                if len(urls) > 1:
+                    manager.update_log(
+                        event="Download failed", details=f"{url}: {err}",
+                    )
+                raise
+            manager.log_debug(event="Debug", details=f"Completed download for {url}")
+
+    tasks = [
+        asyncio.create_task(_download_one(index, url))
+        for index, url in enumerate(urls, start=1)
+    ]
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 async def _run_download_job(job: Job) -> None:
     """Execute the download flow while emitting updates through the live manager."""
 
@@ -674,11 +1063,15 @@ async def _run_download_job(job: Job) -> None:
     try:
         # Build a per-job NetworkContext — no module-level mutation, so two
         # concurrent jobs with different overrides cannot interfere. The
-        # equivalent namespace is also threaded through ``args`` below so
+        # same arguments are also threaded through ``args`` below so
         # ``validate_and_download`` can reproduce the same context inside.
-        job_args_preview = _build_namespace(str(job.request.urls[0]), job.request)
-        job_network = build_network_context(job_args_preview)
-        bunkr_status = await asyncio.to_thread(get_bunkr_status_cached, job_network)
+        job_args = _build_download_args(job.request)
+        job_network = build_network_context(job_args)
+        # A fresh cached status (e.g. from a job started moments ago) is
+        # served on the loop; only a miss costs a worker thread.
+        bunkr_status = peek_bunkr_status(job_network)
+        if bunkr_status is None:
+            bunkr_status = await asyncio.to_thread(get_bunkr_status_cached, job_network)
         if not isinstance(bunkr_status, dict):
             logger.warning(
                 "Bunkr status lookup returned %s; defaulting to empty mapping",
@@ -689,16 +1082,7 @@ async def _run_download_job(job: Job) -> None:
             event="Debug",
             details=f"Fetched bunkr status for {len(bunkr_status)} hosts",
         )
-        for index, url in enumerate(job.request.urls, start=1):
-            if len(job.request.urls) > 1:
-                manager.update_log(
-                    event="Processing URL",
-                    details=f"{index}/{len(job.request.urls)}: {url}",
-                )
-            manager.log_debug(event="Debug", details=f"Starting download for {url}")
-            args = _build_namespace(str(url), job.request)
-            await validate_and_download(bunkr_status, str(url), manager, args=args)
-            manager.log_debug(event="Debug", details=f"Completed download for {url}")
+        await _download_urls(job, job_args, bunkr_status)
 
         manager.stop()
         job.status = JobStatus.COMPLETED
@@ -766,8 +1150,9 @@ async def _lifespan(app_instance: FastAPI):
     shutdown.
     """
 
+    install_dns_cache()
     dist_path = Path(__file__).resolve().parent.parent.parent / "frontend" / "dist"
-    if dist_path.exists():
+    if await asyncio.to_thread(dist_path.exists):
         app_instance.mount(
             "/", StaticFiles(directory=dist_path, html=True), name="frontend",
         )
@@ -798,6 +1183,7 @@ app = FastAPI(
     title="BunkrDownloader API",
     version=APP_VERSION,
     lifespan=_lifespan,
+    default_response_class=_JSONResponse,
     # Applies to every HTTP route (not WebSocket — that validates ?token= manually).
     dependencies=[Depends(require_auth)],
 )
@@ -847,27 +1233,38 @@ async def start_download(request: DownloadRequest) -> DownloadResponse:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
 
     job = Job(job_id=uuid4().hex, request=request)
-    await job_store.add(job)
+    job_store.add(job)
     job.event_broker.publish(_status_event(JobStatus.PENDING))
     job.task = asyncio.create_task(_run_download_job(job))
     return DownloadResponse(job_id=job.job_id)
 
 
-@app.get("/api/downloads", response_model=list[JobInfo])
-async def list_downloads() -> list[JobInfo]:
+# The job endpoints return each job's cached, already-validated JSON dict
+# directly; declaring the models only for OpenAPI skips FastAPI re-validating
+# and re-encoding every JobInfo on each poll.
+@app.get(
+    "/api/downloads",
+    response_model=None,
+    responses={200: {"model": list[JobInfo]}},
+)
+async def list_downloads() -> Response:
     """Return metadata for each tracked download job."""
 
-    return [JobInfo(**job.as_dict()) for job in job_store.list_jobs()]
+    return _JSONResponse([job.info_json() for job in job_store.list_jobs()])
 
 
-@app.get("/api/downloads/{job_id}", response_model=JobInfo)
-async def get_download(job_id: str) -> JobInfo:
+@app.get(
+    "/api/downloads/{job_id}",
+    response_model=None,
+    responses={200: {"model": JobInfo}},
+)
+async def get_download(job_id: str) -> Response:
     """Return the current state of a job by identifier."""
 
     job = job_store.get(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    return JobInfo(**job.as_dict())
+    return _JSONResponse(job.info_json())
 
 
 @app.post("/api/downloads/{job_id}/cancel")
@@ -925,34 +1322,54 @@ async def get_download_events(job_id: str, since: int = Query(0, ge=0)) -> dict[
         raise HTTPException(status_code=404, detail="Job not found")
 
     broker = job.event_broker
-    oldest = broker.oldest_event_id
-    if since > 0 and oldest is not None and since + 1 < oldest:
+    if broker.has_pruned(since):
         raise HTTPException(
             status_code=410,
             detail={
                 "error": "events pruned",
-                "oldest_event_id": oldest,
+                "oldest_event_id": broker.oldest_event_id,
                 "next_id": broker.next_event_id - 1,
             },
         )
 
     events = broker.get_events(since=since)
-    if events:
-        next_id = max(event.get("event_id", since) for event in events)
-    else:
-        next_id = since
+    # Envelopes come back in event_id order, so the newest one is the cursor
+    next_id = events[-1].get("event_id", since) if events else since
     return {"events": events, "next_id": next_id, "next_index": next_id}
 
 
+def _scan_dir(path: Path, limit: int = 50) -> list[str]:
+    """Return the `limit` alphabetically first sub-directory paths of `path`.
+
+    ``os.scandir`` answers ``is_dir`` from the cached directory entry type,
+    so only symlinks cost an extra ``stat``; the bounded heap keeps memory at
+    `limit` paths however large the directory is.
+    """
+
+    with os.scandir(path) as iterator:
+        return heapq.nsmallest(
+            limit, (entry.path for entry in iterator if entry.is_dir()),
+        )
+
+
 @app.get("/api/directories")
 async def list_directories(base_path: str | None = Query(None, alias="basePath")) -> dict[str, Any]:
-    """Return up to fifty sub-directories under the allowed download root.
+    """Return the first fifty sub-directories (by path) under the download root.
 
     ``basePath`` is sandboxed against :data:`ALLOWED_DOWNLOAD_ROOT`; requests
     that try to enumerate directories outside that root are rejected with
     422 rather than silently exposing the container's filesystem.
+
+    Path resolution, stat calls and the scan all block on the filesystem
+    (possibly a slow network mount), so they run in a worker thread.
     """
 
+    return await asyncio.to_thread(_list_directory, base_path)
+
+
+def _list_directory(base_path: str | None) -> dict[str, Any]:
+    """Synchronous body of :func:`list_directories`."""
+
     # Default to the sandbox root rather than ``cwd`` so the picker surfaces
     # legitimate download locations out of the box.
     candidate = base_path or ALLOWED_DOWNLOAD_ROOT
@@ -979,18 +1396,16 @@ async def list_directories(base_path: str | None = Query(None, alias="basePath")
     if not resolved.exists() or not resolved.is_dir():
         raise HTTPException(status_code=404, detail="Directory not found")
 
-    entries = []
-    for entry in resolved.iterdir():
-        if entry.is_dir():
-            entries.append(str(entry))
-        if len(entries) >= 50:
-            break
-
-    return {"path": str(resolved), "directories": sorted(entries)}
+    return {"path": str(resolved), "directories": _scan_dir(resolved)}
 
 
 @app.websocket("/ws/jobs/{job_id}")
-async def job_updates(websocket: WebSocket, job_id: str) -> None:
+async def job_updates(
+    websocket: WebSocket,
+    job_id: str,
+    since: int = Query(0, ge=0),
+    batch: bool = Query(False),
+) -> None:
     """Stream job updates to the caller via WebSocket.
 
     The first frame is always a ``hello`` envelope carrying
@@ -1002,6 +1417,15 @@ async def job_updates(websocket: WebSocket, job_id: str) -> None:
     because ``/events`` returns envelopes with ``event_id > since``. Sending
     ``next_event_id`` here instead (the id that *will* be assigned next)
     would silently skip one envelope on every reconnect.
+
+    An optional ``?since=<cursor>`` limits the history replayed after the
+    ``hello`` frame to envelopes with ``event_id > since``. If the ring
+    buffer has already pruned part of that history, a ``reset`` frame follows
+    ``hello`` instead and only envelopes after ``next_id`` are streamed — the
+    WebSocket counterpart of the ``410 Gone`` from ``/events``. With
+    ``?batch=1`` the envelopes pending for the client, plus any arriving
+    within :data:`WS_BATCH_WINDOW`, go out together as one JSON array frame;
+    otherwise each envelope is its own frame.
     """
 
     # Accept first so we can emit a structured close frame. Pre-accept
@@ -1030,12 +1454,26 @@ async def job_updates(websocket: WebSocket, job_id: str) -> None:
         "type": "hello",
         "next_id": hello_cursor,
         "next_index": hello_cursor,
-        "ts": datetime.now(timezone.utc).isoformat(),
+        "ts": _utc_timestamp(),
     }
     try:
-        await websocket.send_json(hello_envelope)
-        async for event in job.event_broker.subscribe():
-            await websocket.send_json(event)
+        await websocket.send_text(_dumps(hello_envelope))
+        if job.event_broker.has_pruned(since):
+            await websocket.send_text(_dumps({
+                "type": "reset",
+                "oldest_event_id": job.event_broker.oldest_event_id,
+                "next_id": hello_cursor,
+            }))
+            since = hello_cursor
+
+        if batch:
+            async for events in job.event_broker.subscribe_batches(
+                since, window=WS_BATCH_WINDOW,
+            ):
+                await websocket.send_text(_batch_frame(events))
+        else:
+            async for event in job.event_broker.subscribe(since):
+                await websocket.send_text(event.frame())
     except WebSocketDisconnect:
         return
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
-from src.web.app import app as fastapi_app
+from src.web.app import app as fastapi_app, job_store
 
 
 # Signature mirrors validate_and_download so the keyword-only call site
@@ -80,6 +81,34 @@ def test_ws_hello_frame_precedes_replay() -> None:
             assert "ts" in first
 
 
+def test_ws_resume_below_pruned_floor_sends_reset() -> None:
+    """A ``?since=`` cursor the ring has pruned past gets a reset, not a gap."""
+
+    with (
+        patch("src.web.app.validate_and_download", side_effect=_fake_validate),
+        patch("src.web.app.get_bunkr_status_cached", return_value={}),
+        TestClient(fastapi_app) as client,
+    ):
+        job_id = client.post(
+            "/api/downloads",
+            json={"urls": ["https://bunkr.test/a/pruned"]},
+        ).json()["job_id"]
+        _drain(client, job_id, min_events=4)
+
+        broker = job_store.get(job_id).event_broker
+        while broker.oldest_event_id < 3:
+            broker._events.popleft()  # pylint: disable=protected-access
+
+        with client.websocket_connect(f"/ws/jobs/{job_id}?since=1") as ws:
+            hello = ws.receive_json()
+            reset = ws.receive_json()
+
+        assert hello["type"] == "hello"
+        assert reset["type"] == "reset"
+        assert reset["next_id"] == hello["next_id"]
+        assert reset["oldest_event_id"] == broker.oldest_event_id
+
+
 def test_parallel_jobs_do_not_cross_contaminate_events() -> None:
     """Two concurrent jobs keep their event streams isolated by job_id."""
 
@@ -110,3 +139,39 @@ def test_parallel_jobs_do_not_cross_contaminate_events() -> None:
         details_b = {e.get("details") for e in events_b}
         assert "done https://bunkr.test/a/2" not in details_a
         assert "done https://bunkr.test/a/1" not in details_b
+
+
+def test_failing_url_lets_in_flight_urls_finish() -> None:
+    """One URL failing neither cancels the others nor hides the failure."""
+
+    async def _fail_fast_or_finish(bunkr_status, url, manager, args=None):
+        if url.endswith("/bad"):
+            raise RuntimeError("Failed to fetch page")
+        await asyncio.sleep(0.2)
+        await _fake_validate(bunkr_status, url, manager, args=args)
+
+    with (
+        patch("src.web.app.validate_and_download", side_effect=_fail_fast_or_finish),
+        patch("src.web.app.get_bunkr_status_cached", return_value={}),
+        TestClient(fastapi_app) as client,
+    ):
+        job_id = client.post(
+            "/api/downloads",
+            json={
+                "urls": ["https://bunkr.test/a/good", "https://bunkr.test/a/bad"],
+                "max_workers": 2,
+            },
+        ).json()["job_id"]
+
+        deadline = time.time() + 2.0
+        while client.get(f"/api/downloads/{job_id}").json()["status"] != "failed":
+            assert time.time() < deadline, "job never failed"
+            time.sleep(0.05)
+
+        details = [
+            e.get("details")
+            for e in client.get(f"/api/downloads/{job_id}/events").json()["events"]
+        ]
+        assert "done https://bunkr.test/a/good" in details
+        assert "https://bunkr.test/a/bad: Failed to fetch page" in details
+        assert client.get(f"/api/downloads/{job_id}").json()["error"] == "Failed to fetch page"
@@ -62,6 +62,19 @@ class TestPathSandbox:
             assert resp.status_code == 200, resp.text
             assert any("nested" in d for d in resp.json()["directories"])
 
+    def test_directories_lists_alphabetically_first_fifty(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path,
+    ) -> None:
+        for index in reversed(range(60)):
+            (tmp_path / f"dir{index:02d}").mkdir()
+        monkeypatch.setattr("src.file_utils.ALLOWED_DOWNLOAD_ROOT", str(tmp_path))
+
+        with TestClient(fastapi_app) as client:
+            resp = client.get("/api/directories", params={"basePath": str(tmp_path)})
+            assert resp.status_code == 200, resp.text
+            names = [d.rsplit("/", 1)[-1] for d in resp.json()["directories"]]
+            assert names == [f"dir{index:02d}" for index in range(50)]
+
     def test_directories_default_path_materialises_missing_root(
         self, monkeypatch: pytest.MonkeyPatch, tmp_path,
     ) -> None:
@@ -0,0 +1,197 @@
+"""Tests for status-page parsing and the shared status cache."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import bunkr_utils
+
+_STATUS_HTML = """
+<html><body>
+  <header><p>Bunkr status</p><span>ignored</span></header>
+  <div class="flex items-center gap-4 py-4 border-b border-soft last:border-b-0">
+    <p>Cdn12</p><span>Operational</span>
+  </div>
+  <div class="flex items-center gap-4 py-4 border-b border-soft last:border-b-0">
+    <p>Cdn13</p><span>Under maintenance</span>
+  </div>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_status_cache() -> Iterator[None]:
+    """Isolate tests from each other's cached status pages."""
+
+    bunkr_utils._status_cache.clear()  # pylint: disable=protected-access
+    bunkr_utils._status_failures.clear()  # pylint: disable=protected-access
+    yield
+    bunkr_utils._status_cache.clear()  # pylint: disable=protected-access
+    bunkr_utils._status_failures.clear()  # pylint: disable=protected-access
+
+
+def _fake_session(html: str) -> MagicMock:
+    session = MagicMock()
+    session.get.return_value.text = html
+    return session
+
+
+def test_status_page_rows_are_parsed() -> None:
+    """Only the server rows contribute entries to the status mapping."""
+
+    session = _fake_session(_STATUS_HTML)
+    with patch.object(bunkr_utils, "get_http_session", return_value=session):
+        status = bunkr_utils.get_bunkr_status()
+
+    assert status == {"Cdn12": "Operational", "Cdn13": "Under maintenance"}
+
+
+def test_status_is_scraped_once_per_ttl_window() -> None:
+    """Repeat callers share the cached scrape; ``force`` bypasses it."""
+
+    session = _fake_session(_STATUS_HTML)
+    with patch.object(bunkr_utils, "get_http_session", return_value=session):
+        first = bunkr_utils.get_bunkr_status()
+        first["Cdn12"] = "Non-operational"  # callers get their own copy
+        second = bunkr_utils.get_bunkr_status_cached()
+        assert session.get.call_count == 1
+
+        bunkr_utils.get_bunkr_status(force=True)
+        assert session.get.call_count == 2
+
+    assert second["Cdn12"] == "Operational"
+
+
+def test_peek_only_returns_a_fresh_cached_status() -> None:
+    """Peeking never scrapes and ignores entries older than the TTL."""
+
+    assert bunkr_utils.peek_bunkr_status() is None
+
+    session = _fake_session(_STATUS_HTML)
+    with patch.object(bunkr_utils, "get_http_session", return_value=session):
+        bunkr_utils.get_bunkr_status()
+
+    assert bunkr_utils.peek_bunkr_status() == {
+        "Cdn12": "Operational", "Cdn13": "Under maintenance",
+    }
+    assert bunkr_utils.peek_bunkr_status(ttl=0) is None
+    assert session.get.call_count == 1
+
+
+def test_refresh_reports_whether_status_was_refetched() -> None:
+    """``refresh_server_status`` only flags an update on an actual scrape."""
+
+    session = _fake_session(_STATUS_HTML)
+    known: dict[str, str] = {}
+    with patch.object(bunkr_utils, "get_http_session", return_value=session):
+        assert bunkr_utils.refresh_server_status("Cdn13", known) == (
+            "Under maintenance", True,
+        )
+        assert bunkr_utils.refresh_server_status("Cdn13", known) == (
+            "Under maintenance", False,
+        )
+
+    assert session.get.call_count == 1
+    assert known["Cdn12"] == "Operational"
+
+
+def test_concurrent_misses_share_one_scrape() -> None:
+    """Threads missing the cache together wait on a single in-flight fetch."""
+
+    calls: list[int] = []
+
+    def _slow_fetch(_network=None) -> dict[str, str]:
+        calls.append(1)
+        time.sleep(0.05)
+        return {"Cdn12": "Operational"}
+
+    results: list[dict[str, str]] = []
+    with patch.object(bunkr_utils, "_fetch_bunkr_status", side_effect=_slow_fetch):
+        threads = [
+            threading.Thread(target=lambda: results.append(bunkr_utils.get_bunkr_status()))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"Cdn12": "Operational"}] * 5
+
+
+def test_failed_scrape_is_not_retried_immediately() -> None:
+    """While the status page is down, repeated refreshes do not re-scrape it."""
+
+    session = _fake_session("<html><body>offline</body></html>")
+    with patch.object(bunkr_utils, "get_http_session", return_value=session):
+        assert not bunkr_utils.get_bunkr_status(force=True)
+        assert not bunkr_utils.get_bunkr_status(force=True)
+
+    assert session.get.call_count == 1
+
+
+def test_fresh_operational_status_wakes_recovery_waiters() -> None:
+    """A scrape by another thread wakes a waiter before its next poll."""
+
+    maintenance = _fake_session(_STATUS_HTML.replace("Operational", "Maintenance"))
+    with patch.object(bunkr_utils, "get_http_session", return_value=maintenance):
+        bunkr_utils.get_bunkr_status()
+
+    woke: list[bool] = []
+    waiter = threading.Thread(
+        target=lambda: woke.append(bunkr_utils.wait_for_recovery("Cdn12", 5, ttl=60)),
+    )
+    waiter.start()
+    time.sleep(0.05)
+
+    session = _fake_session(_STATUS_HTML)
+    with patch.object(bunkr_utils, "get_http_session", return_value=session):
+        bunkr_utils.get_bunkr_status(force=True)
+    waiter.join(timeout=1)
+
+    assert woke == [True]
+
+
+def test_recovery_wait_polls_the_status_page_itself() -> None:
+    """With nobody else scraping, the waiter re-checks once the TTL lapses."""
+
+    pages = iter([_STATUS_HTML.replace("Operational", "Maintenance"), _STATUS_HTML])
+    session = MagicMock()
+    session.get.side_effect = lambda *_args, **_kwargs: MagicMock(text=next(pages))
+
+    with patch.object(bunkr_utils, "get_http_session", return_value=session):
+        started = time.monotonic()
+        recovered = bunkr_utils.wait_for_recovery("Cdn12", 5, ttl=1)
+
+    assert recovered is True
+    assert session.get.call_count == 2
+    assert time.monotonic() - started < 2
+
+
+def test_recovery_wait_times_out_while_the_host_is_down() -> None:
+    """A host still in maintenance keeps the waiter blocked until the timeout."""
+
+    session = _fake_session(_STATUS_HTML.replace("Operational", "Maintenance"))
+    with patch.object(bunkr_utils, "get_http_session", return_value=session):
+        assert bunkr_utils.wait_for_recovery("Cdn12", 0.1, ttl=60) is False
+
+
+@pytest.mark.parametrize(
+    "server_status, expected",
+    [
+        ("Maintenance", True),
+        ("Under maintenance", True),
+        ("Operational", False),
+        ("Non-operational", False),
+    ],
+)
+def test_is_maintenance_status(server_status: str, expected: bool) -> None:
+    """Maintenance is detected regardless of how the label is cased."""
+
+    assert bunkr_utils.is_maintenance_status(server_status) is expected
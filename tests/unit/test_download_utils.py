@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import gzip
+import io
+import threading
 from pathlib import Path
 from typing import Iterable
 from unittest.mock import patch
 
 import pytest
+import requests
+import urllib3
 from requests.exceptions import ChunkedEncodingError
+from urllib3.response import HTTPResponse
 
 from src.downloaders import download_utils
+from src.config import GB, KB, LARGE_FILE_CHUNK_SIZE, MB
 from src.downloaders.download_utils import (
     DownloadOutcome,
     _finalise_download,
+    get_chunk_size,
     save_file_with_progress,
 )
 
@@ -37,6 +45,9 @@ class FakeResponse:  # pylint: disable=too-few-public-methods
         self.raw = _FakeRaw(raw_remaining)
         self._raises = raises
 
+    def close(self) -> None:
+        """Release the (absent) connection."""
+
     def iter_content(self, chunk_size: int | None = None):
         """Stream pre-set chunks, then optionally raise to simulate a mid-stream error."""
         del chunk_size
@@ -161,3 +172,287 @@ def test_finalise_download_outcome_matrix(
         task=0,
     )
     assert outcome is expected
+
+
+@pytest.mark.parametrize(
+    "file_size, expected",
+    [
+        (0, 64 * KB),
+        (1 * MB - 1, 64 * KB),
+        (1 * MB, 128 * KB),  # thresholds are exclusive upper bounds
+        (75 * MB, 1 * MB),
+        (1 * GB - 1, 8 * MB),
+        (1 * GB, LARGE_FILE_CHUNK_SIZE),
+        (50 * GB, LARGE_FILE_CHUNK_SIZE),
+    ],
+)
+def test_get_chunk_size_matches_thresholds(file_size: int, expected: int) -> None:
+    """Binary-searched chunk sizes keep the original threshold boundaries."""
+
+    assert get_chunk_size(file_size) == expected
+
+
+def _real_response(body: bytes, headers: dict[str, str]) -> requests.Response:
+    """Build a ``requests.Response`` backed by a real urllib3 body stream."""
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    response.raw = HTTPResponse(
+        body=io.BytesIO(body), headers=headers, preload_content=False,
+    )
+    return response
+
+
+def test_identity_body_streams_straight_from_raw(
+    fake_live_manager, tmp_path: Path,
+) -> None:
+    """Identity-encoded bodies are copied from the socket stream byte for byte."""
+
+    payload = bytes(range(256)) * 512
+    response = _real_response(payload, {"Content-Length": str(len(payload))})
+    dest = tmp_path / "raw.bin"
+
+    outcome = save_file_with_progress(
+        response, str(dest), task=0, progress_manager=fake_live_manager,
+    )
+
+    assert outcome is DownloadOutcome.SUCCESS
+    assert dest.read_bytes() == payload
+
+
+def test_tls_error_mid_body_surfaces_as_connection_error() -> None:
+    """A truncated TLS stream maps to ``requests``' SSLError, a ConnectionError."""
+
+    response = _real_response(b"x" * 64, {"Content-Length": "64"})
+    with patch.object(
+        response.raw, "stream", side_effect=urllib3.exceptions.SSLError("bad record mac"),
+    ):
+        with pytest.raises(requests.exceptions.ConnectionError) as exc_info:
+            list(download_utils._iter_body(response, 16))  # pylint: disable=protected-access
+
+    assert isinstance(exc_info.value, requests.exceptions.SSLError)
+
+
+def test_encoded_body_is_still_decoded(fake_live_manager, tmp_path: Path) -> None:
+    """A compressed body keeps going through ``iter_content`` decoding."""
+
+    payload = b"media-bytes" * 100
+    response = _real_response(gzip.compress(payload), {"Content-Encoding": "gzip"})
+    dest = tmp_path / "decoded.bin"
+
+    outcome = save_file_with_progress(
+        response, str(dest), task=0, progress_manager=fake_live_manager,
+    )
+
+    assert outcome is DownloadOutcome.SUCCESS
+    assert dest.read_bytes() == payload
+
+
+class _RangeSession:  # pylint: disable=too-few-public-methods
+    """Serve ``Range`` requests for ``payload`` the way a CDN would."""
+
+    def __init__(
+        self, payload: bytes, *, honour_ranges: bool = True, status: int | None = None,
+    ) -> None:
+        self.payload = payload
+        self.honour_ranges = honour_ranges
+        self.status = status
+        self.ranges: list[str] = []
+
+    def get(self, url: str, *, headers: dict[str, str], **_kwargs) -> requests.Response:
+        """Return a 206 slice for the requested range, or the full body."""
+        del url
+        self.ranges.append(headers["Range"])
+        if self.status is not None:
+            response = _real_response(b"", {})
+            response.status_code = self.status
+            return response
+
+        if not self.honour_ranges:
+            return _real_response(self.payload, {})
+
+        start, end = (int(part) for part in headers["Range"][6:].split("-"))
+        response = _real_response(self.payload[start:end + 1], {})
+        response.status_code = 206
+        return response
+
+
+def test_large_file_is_fetched_as_parallel_ranges(
+    fake_live_manager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Range-capable servers get one request per extra part, reassembled in order."""
+
+    monkeypatch.setattr(download_utils, "RANGE_DOWNLOAD_MIN_SIZE", 1)
+    monkeypatch.setattr(download_utils, "RANGE_DOWNLOAD_PARTS", 4)
+    payload = bytes(range(256)) * 400
+    headers = {"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"}
+    session = _RangeSession(payload)
+    dest = tmp_path / "ranged.bin"
+
+    outcome = save_file_with_progress(
+        _real_response(payload, headers),
+        str(dest),
+        task=0,
+        progress_manager=fake_live_manager,
+        download_url="https://cdn.example/file",
+        session=session,
+    )
+
+    assert outcome is DownloadOutcome.SUCCESS
+    assert dest.read_bytes() == payload
+    # The initial GET serves the first range itself.
+    assert len(session.ranges) == 3
+
+
+def test_ignored_range_request_is_retryable(
+    fake_live_manager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A server answering a range with the full body fails the attempt cleanly."""
+
+    monkeypatch.setattr(download_utils, "RANGE_DOWNLOAD_MIN_SIZE", 1)
+    payload = b"z" * 4096
+    headers = {"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"}
+    dest = tmp_path / "ignored.bin"
+
+    outcome = save_file_with_progress(
+        _real_response(payload, headers),
+        str(dest),
+        task=0,
+        progress_manager=fake_live_manager,
+        download_url="https://cdn.example/file",
+        session=_RangeSession(payload, honour_ranges=False),
+    )
+
+    assert outcome is DownloadOutcome.RETRYABLE_FAILURE
+    assert not dest.exists()
+
+
+def test_every_extra_request_is_paced(
+    fake_live_manager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Range and resume requests each wait on the pacing callback first."""
+
+    monkeypatch.setattr(download_utils, "RANGE_DOWNLOAD_MIN_SIZE", 1)
+    monkeypatch.setattr(download_utils, "RANGE_DOWNLOAD_PARTS", 4)
+    payload = bytes(range(256)) * 400
+    headers = {"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"}
+    session = _RangeSession(payload)
+    paced: list[int] = []
+
+    outcome = save_file_with_progress(
+        _real_response(payload, headers),
+        str(tmp_path / "paced.bin"),
+        task=0,
+        progress_manager=fake_live_manager,
+        download_url="https://cdn.example/file",
+        session=session,
+        pace=lambda: paced.append(len(session.ranges)),
+    )
+
+    assert outcome is DownloadOutcome.SUCCESS
+    assert len(paced) == len(session.ranges) == 3
+
+
+def test_rate_limited_range_is_raised_without_retrying(
+    fake_live_manager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A 429 on a range request is left to the caller's backoff."""
+
+    monkeypatch.setattr(download_utils, "RANGE_DOWNLOAD_MIN_SIZE", 1)
+    monkeypatch.setattr(download_utils, "RANGE_DOWNLOAD_PARTS", 2)
+    payload = b"r" * 4096
+    headers = {"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"}
+    session = _RangeSession(payload, status=429)
+
+    with pytest.raises(requests.HTTPError):
+        save_file_with_progress(
+            _real_response(payload, headers),
+            str(tmp_path / "limited.bin"),
+            task=0,
+            progress_manager=fake_live_manager,
+            download_url="https://cdn.example/file",
+            session=session,
+        )
+
+    assert len(session.ranges) == 1
+
+
+def test_ranges_are_capped_at_free_host_slots(
+    fake_live_manager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each extra range needs a free host slot, which is returned afterwards."""
+
+    monkeypatch.setattr(download_utils, "RANGE_DOWNLOAD_MIN_SIZE", 1)
+    monkeypatch.setattr(download_utils, "RANGE_DOWNLOAD_PARTS", 4)
+    payload = bytes(range(256)) * 64
+    headers = {"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"}
+    session = _RangeSession(payload)
+    host_slot = threading.BoundedSemaphore(2)
+
+    with host_slot:  # held by the caller for the initial GET
+        outcome = save_file_with_progress(
+            _real_response(payload, headers),
+            str(tmp_path / "capped.bin"),
+            task=0,
+            progress_manager=fake_live_manager,
+            download_url="https://cdn.example/file",
+            session=session,
+            host_slot=host_slot,
+        )
+
+    assert outcome is DownloadOutcome.SUCCESS
+    assert len(session.ranges) == 1
+    # Both slots are back: one more release would exceed the bound.
+    with pytest.raises(ValueError):
+        host_slot.release()
+
+
+def test_dropped_stream_resumes_from_last_byte(
+    fake_live_manager, tmp_path: Path,
+) -> None:
+    """A mid-stream failure re-requests only the missing tail of the file."""
+
+    payload = b"0123456789" * 10
+    response = FakeResponse(
+        [payload[:40]],
+        headers={"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"},
+        raises=ChunkedEncodingError,
+    )
+    session = _RangeSession(payload)
+    dest = tmp_path / "resumed.bin"
+
+    outcome = save_file_with_progress(
+        response,
+        str(dest),
+        task=0,
+        progress_manager=fake_live_manager,
+        download_url="https://cdn.example/file",
+        session=session,
+    )
+
+    assert outcome is DownloadOutcome.SUCCESS
+    assert dest.read_bytes() == payload
+    assert session.ranges == [f"bytes=40-{len(payload) - 1}"]
+
+
+@pytest.mark.skipif(
+    not hasattr(download_utils.os, "posix_fadvise"), reason="POSIX only",
+)
+def test_finished_file_is_dropped_from_page_cache(
+    fake_live_manager, tmp_path: Path,
+) -> None:
+    """The written file is advised out of the page cache once complete."""
+
+    response = FakeResponse([b"a" * 16], headers={"Content-Length": "16"})
+    dest = tmp_path / "file.bin"
+
+    with patch.object(download_utils.os, "posix_fadvise") as fadvise:
+        outcome = save_file_with_progress(
+            response, str(dest), task=0, progress_manager=fake_live_manager,
+        )
+
+    assert outcome is DownloadOutcome.SUCCESS
+    fadvise.assert_called_once()
+    assert fadvise.call_args.args[1:] == (0, 0, download_utils.os.POSIX_FADV_DONTNEED)
+    assert dest.read_bytes() == b"a" * 16
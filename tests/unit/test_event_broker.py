@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import threading
+from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from src.web.app import JobEventBroker
+from src.web.app import JobEventBroker, _batch_frame, _utc_timestamp
 
 
 @pytest.mark.asyncio
@@ -82,6 +85,33 @@ async def test_event_id_monotonic_across_threads() -> None:
     assert [e["event_id"] for e in events] == list(range(1, 501))
 
 
+@pytest.mark.asyncio
+async def test_off_loop_dispatches_share_one_wakeup() -> None:
+    """A burst from a worker thread wakes the loop once and keeps its order."""
+
+    broker = JobEventBroker()
+    loop = asyncio.get_running_loop()
+    broker.bind(loop)
+    wakeups: list[object] = []
+    original = loop.call_soon_threadsafe
+
+    def _counting(callback, *args, **kwargs):
+        wakeups.append(callback)
+        return original(callback, *args, **kwargs)
+
+    seen: list[int] = []
+    with patch.object(loop, "call_soon_threadsafe", _counting):
+        worker = threading.Thread(
+            target=lambda: [broker.dispatch(seen.append, i) for i in range(50)],
+        )
+        worker.start()
+        worker.join()
+        await asyncio.sleep(0)
+
+    assert seen == list(range(50))
+    assert len(wakeups) == 1
+
+
 @pytest.mark.asyncio
 async def test_get_events_filters_by_event_id() -> None:
     """``since`` semantics are by ``event_id``, not list index."""
@@ -96,9 +126,127 @@ async def test_get_events_filters_by_event_id() -> None:
     assert [e["event_id"] for e in tail] == [6, 7, 8, 9, 10]
 
 
+@pytest.mark.asyncio
+async def test_subscribe_since_replays_only_unseen_events() -> None:
+    """A reconnecting subscriber resumes after its cursor, then goes live."""
+
+    broker = JobEventBroker()
+    broker.bind(asyncio.get_running_loop())
+
+    for i in range(10):
+        broker.publish({"type": "log", "event": f"e{i}", "details": ""})
+
+    stream = broker.subscribe(since=7)
+    seen = [(await stream.__anext__())["event_id"] for _ in range(3)]
+    broker.publish({"type": "log", "event": "live", "details": ""})
+    seen.append((await stream.__anext__())["event_id"])
+    await stream.aclose()
+
+    assert seen == [8, 9, 10, 11]
+
+
 def test_broker_requires_bind_before_publish() -> None:
     """``publish`` before ``bind`` raises a clear RuntimeError rather than crashing."""
 
     broker = JobEventBroker()
     with pytest.raises(RuntimeError):
         broker.publish({"type": "log", "event": "e", "details": ""})
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_and_is_told_so(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A stalled subscriber's queue stays bounded and reports the gap."""
+
+    monkeypatch.setattr("src.web.app.SUBSCRIBER_QUEUE_SIZE", 3)
+    broker = JobEventBroker()
+    broker.bind(asyncio.get_running_loop())
+
+    stream = broker.subscribe()
+    first = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)  # register the queue before publishing
+
+    for i in range(6):
+        broker.publish({"type": "log", "event": f"e{i}", "details": ""})
+
+    received = [await first]
+    for _ in range(3):
+        received.append(await stream.__anext__())
+    await stream.aclose()
+
+    # Only the newest three envelopes survive, announced by one gap frame
+    assert received[0] == {"type": "dropped", "count": 3, "next_id": 6}
+    assert [e["event_id"] for e in received[1:]] == [4, 5, 6]
+
+
+def test_utc_timestamp_matches_isoformat() -> None:
+    """The cached formatter yields the same shape as ``datetime.isoformat``."""
+
+    before = datetime.now(timezone.utc)
+    stamp = datetime.fromisoformat(_utc_timestamp())
+    after = datetime.now(timezone.utc)
+
+    assert stamp.tzinfo == timezone.utc
+    assert before - timedelta(milliseconds=1) <= stamp <= after
+
+
+@pytest.mark.asyncio
+async def test_envelope_frame_is_encoded_once_for_all_subscribers() -> None:
+    """Subscribers share one envelope and therefore one JSON encoding."""
+
+    broker = JobEventBroker()
+    broker.bind(asyncio.get_running_loop())
+    first, second = broker.subscribe(), broker.subscribe()
+    pending = [asyncio.ensure_future(stream.__anext__()) for stream in (first, second)]
+    await asyncio.sleep(0)
+
+    broker.publish({"type": "log", "event": "é", "details": ""})
+    received = [await future for future in pending]
+    await first.aclose()
+    await second.aclose()
+
+    assert received[0] is received[1]
+    frame = received[0].frame()
+    assert received[1].frame() is frame
+    assert json.loads(frame) == received[0]
+    assert "é" in frame
+
+
+@pytest.mark.asyncio
+async def test_subscribe_batches_drains_pending_events_into_one_frame() -> None:
+    """Everything queued when a subscriber wakes is delivered as one batch."""
+
+    broker = JobEventBroker()
+    broker.bind(asyncio.get_running_loop())
+    broker.publish({"type": "log", "event": "replayed", "details": ""})
+
+    stream = broker.subscribe_batches()
+    replay = await stream.__anext__()
+    for i in range(3):
+        broker.publish({"type": "log", "event": f"e{i}", "details": ""})
+    live = await stream.__anext__()
+    await stream.aclose()
+
+    assert [e["event_id"] for e in replay] == [1]
+    assert [e["event_id"] for e in live] == [2, 3, 4]
+    assert [e["event_id"] for e in json.loads(_batch_frame(live))] == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_batches_window_gathers_a_burst() -> None:
+    """Envelopes published during the window join the waking envelope."""
+
+    broker = JobEventBroker()
+    broker.bind(asyncio.get_running_loop())
+    stream = broker.subscribe_batches(window=0.05)
+    pending = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+
+    broker.publish({"type": "log", "event": "first", "details": ""})
+    await asyncio.sleep(0.01)
+    broker.publish({"type": "log", "event": "second", "details": ""})
+    batch = await pending
+    await stream.aclose()
+
+    assert [e["event_id"] for e in batch] == [1, 2]
@@ -0,0 +1,95 @@
+"""Tests for the shared, connection-pooled HTTP session."""
+
+from __future__ import annotations
+
+import socket
+from collections.abc import Iterator
+
+import pytest
+
+from src import http_utils
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_session() -> Iterator[None]:
+    """Give every test a clean process-wide session slot."""
+
+    http_utils.close_http_session()
+    yield
+    http_utils.close_http_session()
+
+
+def test_shared_session_is_reused() -> None:
+    """Repeated lookups hand back the same pooled session."""
+
+    assert http_utils.get_http_session() is http_utils.get_http_session()
+
+
+def test_pool_is_sized_from_worker_count() -> None:
+    """Per-host pools leave headroom above the configured worker count."""
+
+    session = http_utils.create_http_session(max_workers=5)
+    adapter = session.get_adapter("https://cdn.example.com/")
+
+    assert adapter._pool_maxsize == 20  # pylint: disable=protected-access
+    session.close()
+
+
+def test_configure_replaces_shared_session() -> None:
+    """Reconfiguring swaps in a new session for subsequent callers."""
+
+    original = http_utils.get_http_session()
+    replacement = http_utils.configure_http_session(max_workers=2)
+
+    assert replacement is not original
+    assert http_utils.get_http_session() is replacement
+
+
+def test_dns_cache_reuses_fresh_resolution(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second lookup for the same host is served without the resolver."""
+
+    calls: list[str] = []
+
+    def _fake_getaddrinfo(host, port, *_args, **_kwargs):
+        calls.append(host)
+        return [("family", "type", "proto", "", ("203.0.113.7", port))]
+
+    monkeypatch.setattr(http_utils, "_system_getaddrinfo", _fake_getaddrinfo)
+    http_utils.clear_dns_cache()
+
+    first = http_utils._cached_getaddrinfo(  # pylint: disable=protected-access
+        "cdn.example.com", 443,
+    )
+    second = http_utils._cached_getaddrinfo(  # pylint: disable=protected-access
+        "cdn.example.com", 443,
+    )
+
+    assert first == second
+    assert calls == ["cdn.example.com"]
+    http_utils.clear_dns_cache()
+
+
+def test_dns_cache_serves_stale_entry_when_resolver_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An expired resolution is reused if re-resolving the host fails."""
+
+    answer = [("family", "type", "proto", "", ("203.0.113.7", 443))]
+
+    def _failing_getaddrinfo(*_args, **_kwargs):
+        raise socket.gaierror("resolver unavailable")
+
+    http_utils.clear_dns_cache()
+    key = ("cdn.example.com", 443, (), ())
+    http_utils._DNS_CACHE[key] = (0.0, answer)  # pylint: disable=protected-access
+    monkeypatch.setattr(http_utils, "_system_getaddrinfo", _failing_getaddrinfo)
+
+    assert http_utils._cached_getaddrinfo(  # pylint: disable=protected-access
+        "cdn.example.com", 443,
+    ) == answer
+
+    with pytest.raises(socket.gaierror):
+        http_utils._cached_getaddrinfo(  # pylint: disable=protected-access
+            "other.example.com", 443,
+        )
+    http_utils.clear_dns_cache()
@@ -7,10 +7,15 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from requests.exceptions import RequestException
+from requests.exceptions import HTTPError, RequestException
 
 from src.config import DownloadInfo, HTTPStatus, NetworkContext, SessionInfo
-from src.downloaders.media_downloader import MediaDownloader
+from src.downloaders.download_utils import DownloadOutcome
+from src.downloaders.media_downloader import (
+    MediaDownloader,
+    _TokenBucket,
+    parse_retry_after,
+)
 
 
 def _make_downloader(
@@ -59,6 +64,7 @@ def _fake_request_exception(status_code: int | None) -> RequestException:
     else:
         response = MagicMock()
         response.status_code = status_code
+        response.headers = {}
         err.response = response
     return err
 
@@ -75,10 +81,12 @@ def _fake_request_exception(status_code: int | None) -> RequestException:
         # Transient 429/503 → retry
         (HTTPStatus.TOO_MANY_REQUESTS, "Operational", "backoff", True),
         (HTTPStatus.SERVICE_UNAVAILABLE, "Operational", "backoff", True),
-        # Bad gateway + no maintenance → one-shot failure (retries forced to 1)
+        # Bad gateway + no maintenance → one-shot failure
         (HTTPStatus.BAD_GATEWAY, "Operational", "backoff", False),
         # Bad gateway + maintenance → retry
         (HTTPStatus.BAD_GATEWAY, "Maintenance", "backoff", True),
+        # Bad gateway + maintenance + skip → stop retrying, like the 521 path
+        (HTTPStatus.BAD_GATEWAY, "Maintenance", "skip", False),
         # Generic 500-class (not mapped) → give up
         (HTTPStatus.INTERNAL_ERROR, "Operational", "backoff", False),
     ],
@@ -101,6 +109,7 @@ def test_handle_request_exception_branches(  # pylint: disable=too-many-argument
             return_value=(current_status, True),
         ),
         patch("src.downloaders.media_downloader.time.sleep"),
+        patch("src.downloaders.media_downloader.wait_for_recovery", return_value=False),
     ):
         result = downloader._handle_request_exception(  # pylint: disable=protected-access
             _fake_request_exception(status_code),
@@ -124,6 +133,7 @@ def test_maintenance_emits_structured_event(
             return_value=("Maintenance", True),
         ),
         patch("src.downloaders.media_downloader.time.sleep"),
+        patch("src.downloaders.media_downloader.wait_for_recovery", return_value=False),
         patch("src.downloaders.media_downloader.log_maintenance_event"),
     ):
         downloader._handle_request_exception(  # pylint: disable=protected-access
@@ -133,3 +143,171 @@ def test_maintenance_emits_structured_event(
 
     events = [evt for evt, _ in fake_live_manager.logs]
     assert "Maintenance detected" in events, fake_live_manager.logs
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, None),
+        ("7", 7.0),
+        ("600", None),  # beyond the cap: fall back to normal backoff
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),  # date in the past
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(header, expected) -> None:
+    """Delta-seconds and HTTP dates are honoured within the cap."""
+
+    assert parse_retry_after(header) == expected
+
+
+def test_rate_limit_sleeps_for_retry_after(fake_live_manager, tmp_path: Path) -> None:
+    """A 429 with ``Retry-After`` waits as long as the server asked."""
+
+    downloader = _make_downloader(fake_live_manager, tmp_path)
+    err = _fake_request_exception(HTTPStatus.TOO_MANY_REQUESTS)
+    err.response.headers = {"Retry-After": "5"}
+
+    with (
+        patch("src.downloaders.media_downloader.time.sleep") as sleep,
+        patch("src.downloaders.media_downloader.random.uniform", return_value=0.0),
+    ):
+        result = downloader._handle_request_exception(  # pylint: disable=protected-access
+            err, attempt=0,
+        )
+
+    assert result is True
+    sleep.assert_called_once_with(5.0)
+
+
+def test_refused_range_request_backs_off_like_the_initial_get(
+    fake_live_manager, tmp_path: Path,
+) -> None:
+    """An HTTPError raised mid-transfer goes through the request error handling."""
+
+    downloader = _make_downloader(fake_live_manager, tmp_path)
+    downloader.session_info.http = MagicMock()
+    err = HTTPError("429 on range", response=MagicMock(status_code=429, headers={}))
+
+    with (
+        patch(
+            "src.downloaders.media_downloader.save_file_with_progress",
+            side_effect=[err, DownloadOutcome.SUCCESS],
+        ),
+        patch.object(
+            downloader, "_handle_request_exception", return_value=True,
+        ) as handle,
+    ):
+        outcome = downloader.attempt_download(str(tmp_path / "file.bin"))
+
+    assert outcome is DownloadOutcome.SUCCESS
+    handle.assert_called_once_with(err, 0)
+
+
+@pytest.mark.parametrize(
+    "ignore, include, expect_skip",
+    [
+        (None, None, False),
+        (["file"], None, True),
+        (["other", "[.bin]"], None, False),
+        (None, ["other"], True),
+        (None, ["other", ".bin"], False),
+    ],
+)
+def test_skip_lists_use_compiled_patterns(
+    fake_live_manager, tmp_path: Path, ignore, include, expect_skip,
+) -> None:
+    """Ignore/include words are matched literally as substrings of the name."""
+
+    downloader = _make_downloader(fake_live_manager, tmp_path)
+    downloader.session_info.args.ignore = ignore
+    downloader.session_info.args.include = include
+
+    skipped = downloader._skip_file_download(  # pylint: disable=protected-access
+        str(tmp_path / "file.bin"),
+    )
+
+    assert skipped is expect_skip
+
+
+def test_existing_files_come_from_one_directory_scan(
+    fake_live_manager, tmp_path: Path,
+) -> None:
+    """Files on disk when the session starts are skipped without a stat each."""
+
+    (tmp_path / "file.bin").write_bytes(b"done")
+    downloader = _make_downloader(fake_live_manager, tmp_path)
+
+    with patch("src.downloaders.media_downloader.os.stat") as stat:
+        skipped = downloader._skip_file_download(  # pylint: disable=protected-access
+            str(tmp_path / "file.bin"),
+        )
+
+    assert skipped is True
+    stat.assert_not_called()
+    assert downloader.session_info.existing_files == {"file.bin"}
+
+
+def test_bad_gateway_on_last_attempt_skips_status_refresh(
+    fake_live_manager, tmp_path: Path,
+) -> None:
+    """The final 502 fails straight away instead of scraping the status page."""
+
+    downloader = _make_downloader(fake_live_manager, tmp_path)
+
+    with patch("src.downloaders.media_downloader.refresh_server_status") as refresh:
+        result = downloader._handle_request_exception(  # pylint: disable=protected-access
+            _fake_request_exception(HTTPStatus.BAD_GATEWAY),
+            attempt=downloader.retries - 1,
+        )
+
+    assert result is False
+    refresh.assert_not_called()
+
+
+def test_bad_gateway_stops_without_mutating_retries(
+    fake_live_manager, tmp_path: Path,
+) -> None:
+    """A terminal 502 is reported through the return value alone."""
+
+    downloader = _make_downloader(fake_live_manager, tmp_path, status_check=False)
+
+    result = downloader._handle_request_exception(  # pylint: disable=protected-access
+        _fake_request_exception(HTTPStatus.BAD_GATEWAY),
+        attempt=0,
+    )
+
+    assert result is False
+    assert downloader.retries == 3
+
+
+def test_token_bucket_paces_requests_beyond_the_burst() -> None:
+    """Once the burst is spent, callers sleep until the next token refills."""
+
+    bucket = _TokenBucket(rate=2.0, capacity=2)
+
+    with patch("src.downloaders.media_downloader.time.sleep") as sleep:
+        bucket.acquire()
+        bucket.acquire()
+        sleep.assert_not_called()
+
+        with patch(
+            "src.downloaders.media_downloader.time.monotonic",
+            side_effect=[bucket._updated, bucket._updated + 0.5],  # pylint: disable=protected-access
+        ):
+            bucket.acquire()
+
+    sleep.assert_called_once_with(pytest.approx(0.5, abs=0.01))
+
+
+def test_token_bucket_halves_on_429_and_recovers_additively() -> None:
+    """Pushback halves the rate; successes ramp it back to the configured cap."""
+
+    bucket = _TokenBucket(rate=4.0, capacity=1)
+
+    bucket.penalise()
+    assert bucket.rate == 2.0
+
+    for _ in range(10):
+        bucket.reward()
+    assert bucket.rate == 4.0
@@ -100,7 +100,7 @@ async def test_job_reaper_evicts_old_terminal_jobs() -> None:
             datetime.now(timezone.utc) - timedelta(hours=hours_old),
         )
         job.status = status
-        await store.add(job)
+        store.add(job)
         return job
 
     fresh_running = await _seed(JobStatus.RUNNING, 99)  # never reaped (active)
@@ -118,6 +118,25 @@ async def test_job_reaper_evicts_old_terminal_jobs() -> None:
     assert stale_done.job_id not in remaining
 
 
+@pytest.mark.asyncio
+async def test_job_store_evicts_oldest_terminal_jobs_over_cap() -> None:
+    """Past ``max_jobs`` the oldest finished jobs go; active ones stay."""
+
+    from src.web.app import DownloadRequest
+
+    store = JobStore(max_jobs=3)
+    request = DownloadRequest(urls=["https://bunkr.test/a/x"])
+    jobs = [Job(job_id=f"job-{i}", request=request) for i in range(5)]
+    jobs[0].status = JobStatus.RUNNING
+    jobs[1].status = JobStatus.COMPLETED
+    jobs[2].status = JobStatus.FAILED
+
+    for job in jobs:
+        store.add(job)
+
+    assert [job.job_id for job in store.list_jobs()] == ["job-0", "job-3", "job-4"]
+
+
 @pytest.mark.asyncio
 async def test_job_reaper_loop_cancels_cleanly() -> None:
     """The reaper background loop terminates on cancel without logging errors."""
@@ -131,3 +150,26 @@ async def test_job_reaper_loop_cancels_cleanly() -> None:
     task.cancel()
     with pytest.raises(asyncio.CancelledError):
         await task
+
+
+@pytest.mark.asyncio
+async def test_job_info_is_reused_until_state_changes() -> None:
+    """Polling ``/api/downloads`` reuses each job's model between transitions."""
+
+    from src.web.app import DownloadRequest
+
+    job = Job(job_id="cached", request=DownloadRequest(urls=["https://bunkr.test/a/x"]))
+
+    first = job.info()
+    assert job.info() is first
+    assert first.urls == ["https://bunkr.test/a/x"]
+    payload = job.info_json()
+    assert job.info_json() is payload
+    assert payload["created_at"] == first.model_dump(mode="json")["created_at"]
+
+    job.status = JobStatus.FAILED
+    job.error = "boom"
+    failed = job.info()
+    assert failed is not first
+    assert (failed.status, failed.error) == ("failed", "boom")
+    assert job.info_json()["status"] == "failed"
@@ -0,0 +1,38 @@
+"""Tests for routing file progress to the owning overall task."""
+
+from __future__ import annotations
+
+import asyncio
+
+from src.managers.progress_manager import ProgressManager
+
+
+async def test_concurrent_albums_advance_their_own_overall_task() -> None:
+    """Files finishing in one album never advance a sibling album's bar."""
+
+    manager = ProgressManager(task_name="Album", item_description="File")
+    first_album_added = asyncio.Event()
+    second_album_added = asyncio.Event()
+    task_ids: dict[str, int] = {}
+
+    async def album(name: str, num_tasks: int, *, wait_for: asyncio.Event | None,
+                    signal: asyncio.Event) -> None:
+        manager.add_overall_task(name, num_tasks)
+        signal.set()
+        if wait_for is not None:
+            await wait_for.wait()
+        task_ids[name] = manager.add_task()
+
+    await asyncio.gather(
+        album("first", 2, wait_for=second_album_added, signal=first_album_added),
+        album("second", 5, wait_for=None, signal=second_album_added),
+    )
+
+    # The first album's file was added after the second album's overall task,
+    # so "the latest overall task" would be the wrong one to advance.
+    manager.update_task(task_ids["first"], completed=100)
+
+    overall_tasks = manager.overall_progress.tasks
+    assert overall_tasks[0].completed == 1
+    assert overall_tasks[1].completed == 0
+    assert manager.task_progress.tasks[task_ids["first"]].description.endswith("1/2")
@@ -11,7 +11,7 @@ on the contract surfaces a loud failure with a named test.
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -95,6 +95,7 @@ def test_head_content_length_uses_supplied_headers() -> None:
     yield an inconsistent content length versus the streaming GET.
     """
 
+    download_utils.clear_head_cache()
     captured: dict[str, dict[str, str]] = {}
 
     class _FakeResponse:
@@ -109,7 +110,10 @@ def test_head_content_length_uses_supplied_headers() -> None:
         return _FakeResponse()
 
     custom = {"User-Agent": "custom-agent/2.0", "Referer": "https://custom/ref"}
-    with patch("src.downloaders.download_utils.requests.head", side_effect=_fake_head):
+    with patch.object(
+        download_utils, "get_http_session",
+        return_value=MagicMock(head=MagicMock(side_effect=_fake_head)),
+    ):
         length = download_utils._head_content_length(  # pylint: disable=protected-access
             "https://cdn.example/file.bin",
             headers=custom,
@@ -122,6 +126,7 @@ def test_head_content_length_uses_supplied_headers() -> None:
 def test_head_content_length_falls_back_to_module_defaults() -> None:
     """Callers that omit ``headers`` keep the pre-PR2 behaviour (module globals)."""
 
+    download_utils.clear_head_cache()
     captured: dict[str, dict[str, str]] = {}
 
     class _FakeResponse:
@@ -135,7 +140,10 @@ def test_head_content_length_falls_back_to_module_defaults() -> None:
         captured["headers"] = headers
         return _FakeResponse()
 
-    with patch("src.downloaders.download_utils.requests.head", side_effect=_fake_head):
+    with patch.object(
+        download_utils, "get_http_session",
+        return_value=MagicMock(head=MagicMock(side_effect=_fake_head)),
+    ):
         length = download_utils._head_content_length(  # pylint: disable=protected-access
             "https://cdn.example/file.bin",
         )
@@ -229,6 +237,159 @@ async def test_album_unresolved_link_finishes_task_without_download() -> None:
     assert any("Download link unresolved" in evt for evt, _ in mgr.logs)
 
 
+@pytest.mark.asyncio
+async def test_failed_downloads_are_retried_concurrently() -> None:
+    """The retry phase overlaps files instead of replaying them one by one."""
+
+    from argparse import Namespace
+
+    from src.config import AlbumInfo, NetworkContext, SessionInfo
+    from src.downloaders.album_downloader import AlbumDownloader
+
+    session_info = SessionInfo(
+        args=Namespace(skip_status_check=True),
+        bunkr_status={},
+        download_path="/tmp",
+        network=NetworkContext(
+            status_page="https://status.example/",
+            bunkr_api="https://api.example/api/vs",
+            fallback_domain="example.cr",
+            user_agent="ua/1",
+            download_referer="https://ref.example/",
+        ),
+    )
+    downloader = AlbumDownloader(
+        session_info=session_info,
+        album_info=AlbumInfo(album_id="stub", item_pages=[]),
+        live_manager=MagicMock(),
+    )
+    downloader.failed_downloads = [
+        {"id": i, "filename": f"{i}.bin", "download_link": f"https://cdn{i % 2}.test/{i}"}
+        for i in range(4)
+    ]
+
+    in_flight = peak = 0
+
+    async def _fake_retry(*_args) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    with patch.object(downloader, "_retry_failed_download", side_effect=_fake_retry):
+        await downloader._process_failed_downloads(  # pylint: disable=protected-access
+            asyncio.Semaphore(3),
+        )
+
+    assert peak == 3
+    assert not downloader.failed_downloads
+
+
+@pytest.mark.asyncio
+async def test_retry_phase_skips_hosts_under_maintenance() -> None:
+    """With the skip strategy, only files on operational hosts are retried."""
+
+    from argparse import Namespace
+
+    from src.config import AlbumInfo, SessionInfo
+    from src.downloaders.album_downloader import AlbumDownloader
+
+    downloader = AlbumDownloader(
+        session_info=SessionInfo(
+            args=Namespace(
+                skip_status_check=False,
+                status_cache_ttl=60,
+                maintenance_strategy="skip",
+            ),
+            bunkr_status={},
+            download_path="/tmp",
+            network=None,
+        ),
+        album_info=AlbumInfo(album_id="stub", item_pages=[]),
+        live_manager=MagicMock(),
+    )
+    downloader.failed_downloads = [
+        {"id": i, "filename": f"{i}.bin", "download_link": f"https://cdn{i}.test/{i}"}
+        for i in range(2)
+    ]
+
+    def _status(subdomain, *_args, **_kwargs):
+        return ("Maintenance" if subdomain == "Cdn0" else "Operational"), False
+
+    with (
+        patch("src.downloaders.album_downloader.STATUS_CHECK_ON_FAILURE", True),
+        patch("src.downloaders.album_downloader.refresh_server_status", side_effect=_status),
+        patch.object(downloader, "_retry_failed_download") as retry,
+    ):
+        await downloader._process_failed_downloads(  # pylint: disable=protected-access
+            asyncio.Semaphore(2),
+        )
+
+    retry.assert_awaited_once_with(1, "1.bin", "https://cdn1.test/1", None)
+
+
+@pytest.mark.asyncio
+async def test_retries_start_before_later_status_checks_finish() -> None:
+    """A healthy host's retries run during a slow check and are cancelled if it fails."""
+
+    import threading
+    from argparse import Namespace
+
+    from src.config import AlbumInfo, SessionInfo
+    from src.downloaders.album_downloader import AlbumDownloader
+
+    downloader = AlbumDownloader(
+        session_info=SessionInfo(
+            args=Namespace(skip_status_check=False, status_cache_ttl=60),
+            bunkr_status={},
+            download_path="/tmp",
+            network=None,
+        ),
+        album_info=AlbumInfo(album_id="stub", item_pages=[]),
+        live_manager=MagicMock(),
+    )
+    downloader.failed_downloads = [
+        {"id": i, "filename": f"{i}.bin", "download_link": f"https://cdn{i}.test/{i}"}
+        for i in range(2)
+    ]
+    release = threading.Event()
+    started = asyncio.Event()
+    cancelled: list[int] = []
+
+    def _status(subdomain, *_args, **_kwargs):
+        if subdomain == "Cdn1":
+            release.wait(5)
+            raise RuntimeError("status page exploded")
+        return "Operational", False
+
+    async def _fake_retry(task, *_args) -> None:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(task)
+            raise
+
+    with (
+        patch("src.downloaders.album_downloader.STATUS_CHECK_ON_FAILURE", True),
+        patch("src.downloaders.album_downloader.refresh_server_status", side_effect=_status),
+        patch.object(downloader, "_retry_failed_download", side_effect=_fake_retry),
+    ):
+        phase = asyncio.create_task(
+            downloader._process_failed_downloads(  # pylint: disable=protected-access
+                asyncio.Semaphore(2),
+            ),
+        )
+        await asyncio.wait_for(started.wait(), timeout=1)
+        release.set()
+
+        with pytest.raises(RuntimeError):
+            await phase
+
+    assert cancelled == [0]
+
+
 def test_get_item_filename_keeps_nbsp_when_repair_fails() -> None:
     """A filename with a literal U+00A0 must not crash the album.
 
@@ -293,3 +454,103 @@ def test_get_album_name_keeps_nbsp_when_repair_fails() -> None:
     soup = BeautifulSoup(raw, "html.parser")
 
     assert get_album_name(soup) == expected
+
+
+def test_head_content_length_reuses_recent_probe() -> None:
+    """Retrying the same URL inside the TTL does not send a second HEAD."""
+
+    download_utils.clear_head_cache()
+    calls: list[str] = []
+
+    class _FakeResponse:
+        status_code = 200
+        headers = {"Content-Length": "77"}
+
+        def raise_for_status(self) -> None:
+            return None
+
+    def _fake_head(url, *, headers, timeout, allow_redirects):  # noqa: ARG001
+        calls.append(url)
+        return _FakeResponse()
+
+    with patch.object(
+        download_utils, "get_http_session",
+        return_value=MagicMock(head=MagicMock(side_effect=_fake_head)),
+    ):
+        first = download_utils._head_content_length(  # pylint: disable=protected-access
+            "https://cdn.example/cached.bin",
+        )
+        second = download_utils._head_content_length(  # pylint: disable=protected-access
+            "https://cdn.example/cached.bin",
+        )
+
+    assert first == second == 77
+    assert calls == ["https://cdn.example/cached.bin"]
+    download_utils.clear_head_cache()
+
+
+@pytest.mark.asyncio
+async def test_cli_batch_survives_a_failing_url() -> None:
+    """Any per-URL error is logged; the other URLs still run to completion."""
+
+    from argparse import Namespace
+
+    import main
+    from tests.conftest import FakeLiveManager
+
+    live_manager = FakeLiveManager()
+    live_manager.live = MagicMock()
+    finished: list[str] = []
+
+    async def _fake_validate(_status, url, _manager, args=None):
+        if url == "https://bunkr.test/a/bad":
+            raise OSError("disk full")
+        await asyncio.sleep(0.01)
+        finished.append(url)
+
+    with (
+        patch.object(main, "initialize_managers", return_value=live_manager),
+        patch.object(main, "validate_and_download", _fake_validate),
+    ):
+        await main.process_urls(
+            ["https://bunkr.test/a/good", "https://bunkr.test/a/bad"],
+            Namespace(disable_ui=True, max_workers=2),
+            {},
+        )
+
+    assert finished == ["https://bunkr.test/a/good"]
+    assert ("Download failed", "https://bunkr.test/a/bad: disk full") in live_manager.logs
+
+
+@pytest.mark.asyncio
+async def test_cli_batch_caps_concurrent_urls_independently_of_max_workers() -> None:
+    """URLs are not fanned out ``max_workers`` wide on top of each album's pool."""
+
+    from argparse import Namespace
+
+    import main
+    from tests.conftest import FakeLiveManager
+
+    live_manager = FakeLiveManager()
+    live_manager.live = MagicMock()
+    in_flight = peak = 0
+
+    async def _fake_validate(*_args, **_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    with (
+        patch.object(main, "initialize_managers", return_value=live_manager),
+        patch.object(main, "validate_and_download", _fake_validate),
+        patch.object(main, "MAX_CONCURRENT_URLS", 2),
+    ):
+        await main.process_urls(
+            [f"https://bunkr.test/a/{i}" for i in range(6)],
+            Namespace(disable_ui=True, max_workers=8),
+            {},
+        )
+
+    assert peak == 2
@@ -7,7 +7,7 @@ import threading
 
 import pytest
 
-from src.web.app import JobEventBroker, WebLiveManager
+from src.web.app import TASK_UPDATE_MIN_INTERVAL, JobEventBroker, WebLiveManager
 
 
 @pytest.mark.asyncio
@@ -125,3 +125,92 @@ async def test_update_maintenance_publishes_structured_envelope() -> None:
     assert payload["subdomain"] == "Cdn13"
     assert payload["affected_files_count"] == 7
     assert payload["status"] == "Maintenance"
+
+
+@pytest.mark.asyncio
+async def test_small_progress_ticks_are_coalesced() -> None:
+    """Sub-point progress ticks collapse; completion always publishes."""
+
+    broker = JobEventBroker()
+    broker.bind(asyncio.get_running_loop())
+    mgr = WebLiveManager(broker)
+    mgr.add_overall_task("album", 1)
+    task_id = mgr.add_task(current_task=0)
+    await asyncio.sleep(0.02)
+
+    for tenth in range(1, 10):
+        mgr.update_task(task_id, completed=10 + tenth / 10)
+    mgr.update_task(task_id, completed=100)
+    await asyncio.sleep(0.02)
+
+    updated = [
+        e["task"]["completed"]
+        for e in broker.get_events()
+        if e.get("type") == "task_updated"
+    ]
+    assert updated == [10.1, 100.0]
+
+
+@pytest.mark.asyncio
+async def test_held_back_progress_is_flushed_after_the_interval() -> None:
+    """A stalled download still publishes the last coalesced tick."""
+
+    broker = JobEventBroker()
+    broker.bind(asyncio.get_running_loop())
+    mgr = WebLiveManager(broker)
+    task_id = mgr.add_task(current_task=0)
+    await asyncio.sleep(0)
+
+    mgr.update_task(task_id, completed=10)
+    mgr.update_task(task_id, completed=10.5)
+    await asyncio.sleep(TASK_UPDATE_MIN_INTERVAL + 0.05)
+
+    updated = [
+        e["task"]["completed"]
+        for e in broker.get_events()
+        if e.get("type") == "task_updated"
+    ]
+    assert updated == [10.0, 10.5]
+
+
+@pytest.mark.asyncio
+async def test_overall_task_accumulates_while_an_album_is_unfinished() -> None:
+    """Concurrent albums of one job share a single overall progress bar."""
+
+    broker = JobEventBroker()
+    broker.bind(asyncio.get_running_loop())
+    mgr = WebLiveManager(broker)
+
+    mgr.add_overall_task("first", 2)
+    mgr.update_task(mgr.add_task(current_task=0), completed=100)
+    mgr.add_overall_task("second", 1)
+    mgr.update_task(mgr.add_task(current_task=1), completed=100)
+    mgr.update_task(mgr.add_task(current_task=2), completed=100)
+    mgr.add_overall_task("third", 1)
+    await asyncio.sleep(0)
+
+    overall = [
+        (e["total"], e["completed"])
+        for e in broker.get_events() if e.get("type") == "overall"
+    ]
+    # (2, 1) and (3, 2) fall inside the throttle interval and are superseded.
+    assert overall == [(2, 0), (3, 1), (3, 3), (1, 0)]
+
+
+@pytest.mark.asyncio
+async def test_overall_progress_is_throttled_to_the_latest_count() -> None:
+    """Rapid file completions publish one trailing overall update."""
+
+    broker = JobEventBroker()
+    broker.bind(asyncio.get_running_loop())
+    mgr = WebLiveManager(broker)
+    mgr.add_overall_task("album", 5)
+    for index in range(3):
+        mgr.update_task(mgr.add_task(current_task=index), completed=100)
+    await asyncio.sleep(TASK_UPDATE_MIN_INTERVAL + 0.05)
+
+    overall = [
+        (e["total"], e["completed"])
+        for e in broker.get_events() if e.get("type") == "overall"
+    ]
+    assert overall == [(5, 0), (5, 3)]